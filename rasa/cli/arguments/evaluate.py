@@ -41,6 +41,14 @@ def set_markers_arguments(parser: argparse.ArgumentParser) -> None:
         "`-per-session.csv` will be added automatically.",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=int,
+        help="Number of processes which extract markers in parallel.",
+    )
+
     add_endpoint_param(
         parser, help_text="Configuration file for the tracker store as a yml file."
     )
@@ -140,6 +140,15 @@ def add_test_nlu_argument_group(
         default=5,
         help="Number of cross validation folds (cross validation only).",
     )
+    cross_validation_arguments.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        default=1,
+        type=int,
+        help="Number of cross validation folds which are trained and evaluated in "
+        "parallel processes (cross validation only).",
+    )
     comparison_arguments = parser.add_argument_group("Comparison Mode")
     comparison_arguments.add_argument(
         "-r",
@@ -100,6 +100,7 @@ def _run_markers_cli(args: argparse.Namespace) -> None:
         args.config,
         args.output_filename,
         stats_file_prefix,
+        args.jobs,
     )
 
 
@@ -112,6 +113,7 @@ def _run_markers(
     config: Path,
     output_filename: Path,
     stats_file_prefix: Optional[Path] = None,
+    jobs: int = 1,
 ) -> None:
     """Run markers algorithm over specified config and tracker store.
 
@@ -135,6 +137,7 @@ def _run_markers(
             '<path-to-stats-folder>/statistics-overall.csv', while the statistics
             computed per session will be stored in
             '<path-to-stats-folder>/statistics-per-session.csv'.
+        jobs: Number of processes which extract markers in parallel.
     """
     telemetry.track_markers_extraction_initiated(
         strategy=strategy,
@@ -188,6 +191,7 @@ def _run_markers(
                 overall_stats_file=_append_suffix(
                     stats_file_prefix, STATS_OVERALL_SUFFIX
                 ),
+                jobs=jobs,
             )
         )
     except (FileExistsError, NotADirectoryError) as e:
@@ -15,7 +15,13 @@ from typing import (
 
 import aiohttp
 import rasa.core
-from rasa.core.actions.constants import DEFAULT_SELECTIVE_DOMAIN, SELECTIVE_DOMAIN
+from rasa.core.actions.constants import (
+    DEFAULT_SELECTIVE_DOMAIN,
+    DEFAULT_TRACKER_DELTA,
+    SELECTIVE_DOMAIN,
+    TRACKER_DELTA,
+)
+from rasa.core.actions.tracker_delta import TrackerDeltaState, tracker_delta_state
 from rasa.core.constants import (
     DEFAULT_REQUEST_TIMEOUT,
     COMPRESS_ACTION_SERVER_REQUEST_ENV_NAME,
@@ -664,27 +670,53 @@ class RemoteAction(Action):
         self,
         tracker: "DialogueStateTracker",
         domain: "Domain",
+        full: bool = False,
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
-        from rasa.shared.core.trackers import EventVerbosity
+        """Create the request json send to the action server.
+
+        Args:
+            tracker: The conversation the action is run for.
+            domain: The model's domain.
+            full: Only relevant if delta payloads are enabled. If `True`, the whole
+                tracker and domain are sent instead of only the changes since the
+                last call to the action server.
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
+        Returns:
+            The request body.
+        """
+        from rasa.shared.core.trackers import EventVerbosity
 
-        result = {
+        result: Dict[Text, Any] = {
             "next_action": self._name,
             "sender_id": tracker.sender_id,
-            "tracker": tracker_state,
             "version": rasa.__version__,
         }
 
-        if (
+        send_domain = (
             not self._is_selective_domain_enabled()
             or domain.does_custom_action_explicitly_need_domain(self.name())
-        ):
+        )
+
+        delta_state = self._tracker_delta_state()
+        if delta_state is not None:
+            result.update(
+                delta_state.payload(tracker, domain if send_domain else None, full)
+            )
+            return result
+
+        result["tracker"] = tracker.current_state(EventVerbosity.ALL)
+        if send_domain:
             result["domain"] = domain.as_dict()
 
         return result
 
+    def _tracker_delta_state(self) -> Optional[TrackerDeltaState]:
+        if self.action_endpoint is None or not self.action_endpoint.kwargs.get(
+            TRACKER_DELTA, DEFAULT_TRACKER_DELTA
+        ):
+            return None
+        return tracker_delta_state(self.action_endpoint)
+
     def _is_selective_domain_enabled(self) -> bool:
         if self.action_endpoint is None:
             return False
@@ -787,15 +819,29 @@ class RemoteAction(Action):
                 DEFAULT_COMPRESS_ACTION_SERVER_REQUEST,
             )
 
-            modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
-                json_body=json_body
-            )
-            response: Any = await self.action_endpoint.request(
-                json=modified_json if modified_json else json_body,
-                method="post",
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                compress=should_compress,
-            )
+            try:
+                response, modified_json = await self._send_request(
+                    json_body, should_compress
+                )
+            except ClientResponseError as e:
+                delta_state = self._tracker_delta_state()
+                if not (e.status == 409 and delta_state is not None):
+                    raise
+                # the action server doesn't know the conversation or the domain
+                # (anymore), e.g. because it was restarted
+                logger.debug(
+                    f"Action server is missing the state of conversation "
+                    f"'{tracker.sender_id}'. Sending the full tracker and domain."
+                )
+                delta_state.forget()
+                json_body = self._action_call_format(tracker, domain, full=True)
+                response, modified_json = await self._send_request(
+                    json_body, should_compress
+                )
+
+            delta_state = self._tracker_delta_state()
+            if delta_state is not None:
+                delta_state.acknowledge(json_body, tracker)
             if modified_json:
                 plugin_manager().hook.prefixing_custom_actions_response(
                     json_body=json_body, response=response
@@ -850,6 +896,20 @@ class RemoteAction(Action):
                 "Error: {}".format(self.name(), status, e)
             )
 
+    async def _send_request(
+        self, json_body: Dict[Text, Any], compress: bool
+    ) -> Tuple[Any, Optional[Dict[Text, Any]]]:
+        modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
+            json_body=json_body
+        )
+        response = await self.action_endpoint.request(  # type: ignore[union-attr]
+            json=modified_json if modified_json else json_body,
+            method="post",
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            compress=compress,
+        )
+        return response, modified_json
+
     def name(self) -> Text:
         return self._name
 
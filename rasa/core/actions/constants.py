@@ -1,2 +1,6 @@
 DEFAULT_SELECTIVE_DOMAIN = False
 SELECTIVE_DOMAIN = "enable_selective_domain"
+DEFAULT_TRACKER_DELTA = False
+TRACKER_DELTA = "enable_tracker_delta"
+DEFAULT_TRACKER_DELTA_MAX_CONVERSATIONS = 10000
+TRACKER_DELTA_MAX_CONVERSATIONS = "tracker_delta_max_conversations"
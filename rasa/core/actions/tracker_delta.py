@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import itertools
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Text
+
+from rasa.core.actions.constants import (
+    DEFAULT_TRACKER_DELTA_MAX_CONVERSATIONS,
+    TRACKER_DELTA_MAX_CONVERSATIONS,
+)
+from rasa.shared.core.events import Event
+from rasa.shared.core.trackers import EventVerbosity
+from rasa.utils.endpoints import EndpointConfig
+
+if TYPE_CHECKING:
+    from rasa.shared.core.domain import Domain
+    from rasa.shared.core.trackers import DialogueStateTracker
+
+logger = logging.getLogger(__name__)
+
+EVENTS_OFFSET_KEY = "events_offset"
+DOMAIN_HASH_KEY = "domain_hash"
+
+
+class _SentEvents(NamedTuple):
+    """The events of a conversation which the action server already received."""
+
+    number_of_events: int
+    last_event: Dict[Text, Any]
+
+
+class TrackerDeltaState:
+    """Remembers what was sent to an action server which supports delta payloads.
+
+    In delta mode the action server keeps the conversations and domains it
+    received. Follow-up calls then only contain the events which were added since
+    the previous call and the hash of the domain. If the action server doesn't
+    know the conversation or the domain anymore, it answers with a `409` status
+    code and the full payload is sent again.
+    """
+
+    def __init__(
+        self, max_conversations: int = DEFAULT_TRACKER_DELTA_MAX_CONVERSATIONS
+    ) -> None:
+        """Creates the state.
+
+        Args:
+            max_conversations: Maximum number of conversations to remember. The
+                least recently used conversations are forgotten first.
+        """
+        self.max_conversations = max_conversations
+        self._sent_events: OrderedDict[Text, _SentEvents] = OrderedDict()
+        self._domain: Optional[Domain] = None
+        self._domain_hash: Optional[Text] = None
+        self._acknowledged_domain_hash: Optional[Text] = None
+
+    def domain_hash(self, domain: Domain) -> Text:
+        """Returns the hash of `domain` (it's only computed once per domain)."""
+        if self._domain is not domain or self._domain_hash is None:
+            self._domain = domain
+            self._domain_hash = domain.fingerprint()
+        return self._domain_hash
+
+    def payload(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Optional[Domain],
+        full: bool = False,
+    ) -> Dict[Text, Any]:
+        """Creates the tracker and domain part of a request to the action server.
+
+        Args:
+            tracker: The conversation the action is run for.
+            domain: The domain if it has to be sent to the action server.
+            full: If `True`, the whole tracker and domain are sent regardless of
+                what the action server already received.
+
+        Returns:
+            The `tracker`, `events_offset` and (if a domain is given) `domain_hash`
+            and `domain` fields of the request.
+        """
+        offset = 0 if full else self._events_offset(tracker)
+
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        tracker_state["events"] = [
+            event.as_dict() for event in itertools.islice(tracker.events, offset, None)
+        ]
+        payload: Dict[Text, Any] = {
+            "tracker": tracker_state,
+            EVENTS_OFFSET_KEY: offset,
+        }
+
+        if domain is not None:
+            domain_hash = self.domain_hash(domain)
+            payload[DOMAIN_HASH_KEY] = domain_hash
+            if full or domain_hash != self._acknowledged_domain_hash:
+                payload["domain"] = domain.as_dict()
+
+        return payload
+
+    def acknowledge(
+        self, payload: Dict[Text, Any], tracker: DialogueStateTracker
+    ) -> None:
+        """Records that the action server successfully processed `payload`.
+
+        Args:
+            payload: The request which was sent to the action server.
+            tracker: The conversation which was sent as part of the request.
+        """
+        if DOMAIN_HASH_KEY in payload:
+            self._acknowledged_domain_hash = payload[DOMAIN_HASH_KEY]
+
+        if not tracker.events:
+            self.forget(tracker.sender_id)
+            return
+
+        self._sent_events[tracker.sender_id] = _SentEvents(
+            len(tracker.events), tracker.events[-1].as_dict()
+        )
+        self._sent_events.move_to_end(tracker.sender_id)
+        while len(self._sent_events) > self.max_conversations:
+            self._sent_events.popitem(last=False)
+
+    def forget(self, sender_id: Optional[Text] = None) -> None:
+        """Forgets what was sent for a conversation (or for all conversations).
+
+        Args:
+            sender_id: The conversation to forget. If `None`, all conversations and
+                the acknowledged domain are forgotten.
+        """
+        if sender_id is None:
+            self._sent_events.clear()
+            self._acknowledged_domain_hash = None
+        else:
+            self._sent_events.pop(sender_id, None)
+
+    def _events_offset(self, tracker: DialogueStateTracker) -> int:
+        sent = self._sent_events.get(tracker.sender_id)
+        if sent is None or sent.number_of_events > len(tracker.events):
+            return 0
+
+        # the tracker might have been loaded differently (e.g. only the events of
+        # the latest session) since the last call, in which case the number of
+        # events doesn't point to the same event anymore
+        last_sent_event: Event = tracker.events[sent.number_of_events - 1]
+        if last_sent_event.as_dict() != sent.last_event:
+            logger.debug(
+                f"Events of conversation '{tracker.sender_id}' changed since the "
+                f"last call to the action server. Sending all events."
+            )
+            return 0
+
+        return sent.number_of_events
+
+
+_states: Dict[Text, TrackerDeltaState] = {}
+
+
+def tracker_delta_state(
+    action_endpoint: EndpointConfig,
+) -> Optional[TrackerDeltaState]:
+    """Returns the delta payload state for the action server at `action_endpoint`.
+
+    Args:
+        action_endpoint: The endpoint of the action server.
+
+    Returns:
+        The state which is shared by all actions which are run by this server or
+        `None` if the endpoint has no URL to identify the action server by.
+    """
+    url = action_endpoint.url
+    if url is None:
+        return None
+
+    if url not in _states:
+        _states[url] = TrackerDeltaState(
+            int(
+                action_endpoint.kwargs.get(
+                    TRACKER_DELTA_MAX_CONVERSATIONS,
+                    DEFAULT_TRACKER_DELTA_MAX_CONVERSATIONS,
+                )
+            )
+        )
+    return _states[url]
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from asyncio import AbstractEventLoop, CancelledError
 import functools
 import logging
@@ -14,6 +15,7 @@ from rasa.core import jobs
 from rasa.core.channels.channel import OutputChannel, UserMessage
 from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
+from rasa.core.inference_executor import InferenceExecutor
 from rasa.shared.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
 from rasa.shared.constants import DEFAULT_SENDER_ID
@@ -35,6 +37,10 @@ from rasa.core.utils import AvailableEndpoints
 
 logger = logging.getLogger(__name__)
 
+# Models are written to disk in chunks of this size (in bytes) while they are
+# downloaded so that they don't need to be kept in memory as a whole.
+MODEL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 async def load_from_server(agent: Agent, model_server: EndpointConfig) -> Agent:
     """Load a persisted model from a server."""
@@ -55,18 +61,21 @@ async def load_from_server(agent: Agent, model_server: EndpointConfig) -> Agent:
     return agent
 
 
-def _load_and_set_updated_model(
+async def _load_and_set_updated_model(
     agent: Agent, model_directory: Text, fingerprint: Text
 ) -> None:
     """Load the persisted model into memory and set the model on the agent.
 
+    The model is loaded in a worker thread so that the agent can keep handling
+    messages with its current model in the meantime.
+
     Args:
         agent: Instance of `Agent` to update with the new model.
         model_directory: Rasa model directory.
         fingerprint: Fingerprint of the supplied model at `model_directory`.
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
-    agent.load_model(model_directory, fingerprint)
+    await agent.load_model_in_thread(model_directory, fingerprint)
 
     logger.debug("Finished updating agent to new model.")
 
@@ -83,7 +92,9 @@ async def _update_model_from_server(model_server: EndpointConfig, agent: Agent)
             )
 
             if new_fingerprint:
-                _load_and_set_updated_model(agent, temporary_directory, new_fingerprint)
+                await _load_and_set_updated_model(
+                    agent, temporary_directory, new_fingerprint
+                )
             else:
                 logger.debug(f"No new model found at URL {model_server.url}")
         except Exception:  # skipcq: PYL-W0703
@@ -112,59 +123,60 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                model_path = Path(model_directory) / resp.headers.get(
-                    "filename", "model.tar.gz"
+    session = model_server.pooled_session()
+    try:
+        params = model_server.combine_parameters()
+        async with session.request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
+                logger.debug(
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
+                )
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
+                )
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
                 )
-                with open(model_path, "wb") as file:
-                    file.write(await resp.read())
+                return None
 
-                logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
+            model_path = Path(model_directory) / resp.headers.get(
+                "filename", "model.tar.gz"
+            )
+            with open(model_path, "wb") as file:
+                async for chunk in resp.content.iter_chunked(MODEL_DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
 
-                # return the new fingerprint
-                return resp.headers.get("ETag")
+            logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
 
-        except aiohttp.ClientError as e:
-            logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
-            )
-            return None
+            # return the new fingerprint
+            return resp.headers.get("ETag")
+
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(model_server: EndpointConfig, agent: Agent) -> None:
@@ -219,6 +231,7 @@ async def load_agent(
     generator = None
     action_endpoint = None
     http_interpreter = None
+    inference_executor = None
 
     if endpoints:
         broker = await EventBroker.create(endpoints.event_broker, loop=loop)
@@ -231,6 +244,7 @@ async def load_agent(
         model_server = endpoints.model if endpoints.model else model_server
         if endpoints.nlu:
             http_interpreter = RasaNLUHttpInterpreter(endpoints.nlu)
+        inference_executor = InferenceExecutor.create(endpoints.inference)
 
     agent = Agent(
         generator=generator,
@@ -240,6 +254,7 @@ async def load_agent(
         model_server=model_server,
         remote_storage=remote_storage,
         http_interpreter=http_interpreter,
+        inference_executor=inference_executor,
     )
 
     try:
@@ -247,11 +262,15 @@ async def load_agent(
             return await load_from_server(agent, model_server)
 
         elif remote_storage is not None:
-            agent.load_model_from_remote_storage(model_path)
+            # Retrieving and loading the model blocks, hence it's done in a worker
+            # thread so that the event loop can keep serving other requests.
+            await asyncio.get_running_loop().run_in_executor(
+                None, agent.load_model_from_remote_storage, model_path
+            )
 
         elif model_path is not None and os.path.exists(model_path):
             try:
-                agent.load_model(model_path)
+                await agent.load_model_in_thread(model_path)
             except ModelNotFound:
                 rasa.shared.utils.io.raise_warning(
                     f"No valid model found at {model_path}!"
@@ -301,6 +320,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ):
         """Initializes an `Agent`."""
         self.domain = domain
@@ -311,6 +331,7 @@ class Agent:
         self.lock_store = self._create_lock_store(lock_store)
         self.action_endpoint = action_endpoint
         self.http_interpreter = http_interpreter
+        self.inference_executor = InferenceExecutor.create(inference_executor)
 
         self._set_fingerprint(fingerprint)
         self.model_server = model_server
@@ -329,6 +350,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ) -> Agent:
         """Constructs a new agent and loads the processer and model."""
         agent = Agent(
@@ -341,6 +363,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             http_interpreter=http_interpreter,
+            inference_executor=inference_executor,
         )
         agent.load_model(model_path=model_path, fingerprint=fingerprint)
         return agent
@@ -349,14 +372,50 @@ class Agent:
         self, model_path: Union[Text, Path], fingerprint: Optional[Text] = None
     ) -> None:
         """Loads the agent's model and processor given a new model path."""
-        self.processor = MessageProcessor(
+        self._set_processor(self._create_processor(model_path), fingerprint)
+
+    async def load_model_in_thread(
+        self, model_path: Union[Text, Path], fingerprint: Optional[Text] = None
+    ) -> None:
+        """Loads a new model in a worker thread and swaps it in once it's ready.
+
+        The event loop keeps handling messages with the current model while the new
+        model is loaded and warmed up. Messages which are already being handled when
+        the models are swapped finish with the previous model.
+
+        Args:
+            model_path: Path to the model or a directory containing models.
+            fingerprint: Fingerprint of the model.
+        """
+        processor = await asyncio.get_running_loop().run_in_executor(
+            None, self._create_warmed_up_processor, model_path
+        )
+        self._set_processor(processor, fingerprint)
+
+    def _create_processor(self, model_path: Union[Text, Path]) -> MessageProcessor:
+        return MessageProcessor(
             model_path=model_path,
             tracker_store=self.tracker_store,
             lock_store=self.lock_store,
             action_endpoint=self.action_endpoint,
             generator=self.nlg,
             http_interpreter=self.http_interpreter,
+            inference_executor=self.inference_executor,
         )
+
+    def _create_warmed_up_processor(
+        self, model_path: Union[Text, Path]
+    ) -> MessageProcessor:
+        processor = self._create_processor(model_path)
+        processor.warm_up()
+        return processor
+
+    def _set_processor(
+        self, processor: MessageProcessor, fingerprint: Optional[Text] = None
+    ) -> None:
+        # This doesn't `await` anything so that no message is handled while the
+        # agent is only partially updated.
+        self.processor = processor
         self.domain = self.processor.domain
 
         self._set_fingerprint(fingerprint)
@@ -376,6 +435,19 @@ class Agent:
         """Returns the model name from processor's model_path."""
         return self.processor.model_path.name if self.processor else None
 
+    def http_endpoints(self) -> Dict[Text, EndpointConfig]:
+        """Returns the configured HTTP endpoints the agent sends requests to."""
+        endpoints = {
+            "action_endpoint": self.action_endpoint,
+            "nlg": getattr(self.nlg, "nlg_endpoint", None),
+            "model_server": self.model_server,
+        }
+        return {
+            name: endpoint
+            for name, endpoint in endpoints.items()
+            if isinstance(endpoint, EndpointConfig)
+        }
+
     def is_ready(self) -> bool:
         """Check if all necessary components are instantiated to use agent."""
         return self.tracker_store is not None and self.processor is not None
@@ -64,6 +64,27 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    async def publish_async(self, event: Dict[Text, Any]) -> None:
+        """Publishes an event from within the event loop.
+
+        Defaults to `publish`. Event brokers which queue events can override this to
+        slow down the caller while their queue is full.
+
+        Args:
+            event: The serialized event.
+        """
+        self.publish(event)
+
+    def stats(self) -> Optional[Dict[Text, Any]]:
+        """Returns statistics about the published events.
+
+        Returns:
+            JSON serializable statistics or `None` if the event broker doesn't keep
+            track of its publishing. `None` by default, but this may be overridden by
+            subclasses.
+        """
+        return None
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
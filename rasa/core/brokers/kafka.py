@@ -1,11 +1,25 @@
 import asyncio
+import functools
 import os
 import json
 import logging
 import structlog
 import threading
 from asyncio import AbstractEventLoop
-from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Text,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Dict,
+    TYPE_CHECKING,
+)
 import time
 
 from rasa.core.brokers.broker import EventBroker
@@ -20,6 +34,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+DEFAULT_PUBLISH_QUEUE_SIZE = 10000
+DEFAULT_PUBLISH_BATCH_SIZE = 500
+DEFAULT_LINGER_MS = 5
+DEFAULT_BATCH_NUM_MESSAGES = 10000
+DEFAULT_CLOSE_TIMEOUT_IN_SECONDS = 10
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICY_DROP_NEWEST = "drop_newest"
+OVERFLOW_POLICY_WAIT = "wait"
+OVERFLOW_POLICIES = [
+    OVERFLOW_POLICY_DROP_OLDEST,
+    OVERFLOW_POLICY_DROP_NEWEST,
+    OVERFLOW_POLICY_WAIT,
+]
+
+# interval (in seconds) in which the background publisher serves delivery reports
+# while no new events are queued
+PRODUCER_POLL_INTERVAL_IN_SECONDS = 0.1
+# time (in seconds) to wait for the producer to free up space in its local queue
+PRODUCER_BUFFER_FULL_DELAY_IN_SECONDS = 0.1
+
+
+@dataclass
+class KafkaPublishStats:
+    """Snapshot of the background publishing of a `KafkaEventBroker`.
+
+    Attributes:
+        queue_depth: Number of events which are waiting to be handed to the producer.
+        produced_events: Number of events which were handed to the producer.
+        delivered_events: Number of events which Kafka acknowledged.
+        failed_events: Number of events which couldn't be published.
+        dropped_events: Number of events which were discarded because the queue was
+            full.
+        total_delivery_latency: Accumulated time (in seconds) between queueing
+            events and their acknowledgement by Kafka.
+        max_delivery_latency: Longest time (in seconds) between queueing a single
+            event and its acknowledgement by Kafka.
+    """
+
+    queue_depth: int = 0
+    produced_events: int = 0
+    delivered_events: int = 0
+    failed_events: int = 0
+    dropped_events: int = 0
+    total_delivery_latency: float = 0.0
+    max_delivery_latency: float = 0.0
+
+    @property
+    def average_delivery_latency(self) -> float:
+        """Returns the mean time (in seconds) until an event was acknowledged."""
+        if not self.delivered_events:
+            return 0.0
+        return self.total_delivery_latency / self.delivered_events
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the statistics in a JSON serializable format."""
+        return {
+            **asdict(self),
+            "average_delivery_latency": self.average_delivery_latency,
+        }
+
 
 class KafkaEventBroker(EventBroker):
     """Kafka event broker."""
@@ -38,6 +112,13 @@ class KafkaEventBroker(EventBroker):
         ssl_keyfile: Optional[Text] = None,
         ssl_check_hostname: bool = False,
         security_protocol: Text = "SASL_PLAINTEXT",
+        publish_queue_size: int = DEFAULT_PUBLISH_QUEUE_SIZE,
+        publish_batch_size: int = DEFAULT_PUBLISH_BATCH_SIZE,
+        overflow_policy: Text = OVERFLOW_POLICY_WAIT,
+        linger_ms: float = DEFAULT_LINGER_MS,
+        batch_num_messages: int = DEFAULT_BATCH_NUM_MESSAGES,
+        retry_delay_in_seconds: float = 5,
+        close_timeout_in_seconds: float = DEFAULT_CLOSE_TIMEOUT_IN_SECONDS,
         **kwargs: Any,
     ) -> None:
         """Kafka event broker.
@@ -75,7 +156,38 @@ class KafkaEventBroker(EventBroker):
 
             security_protocol : Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
+
+            publish_queue_size: Maximum number of events which are kept in memory
+                while they wait to be published in the background.
+
+            publish_batch_size: Maximum number of queued events which are handed to
+                the producer at once.
+
+            overflow_policy: What to do with new events if the queue is full.
+                Valid values are: `wait` (default), `drop_oldest` and `drop_newest`.
+                `wait` applies backpressure: `publish_async` waits until there is
+                space in the queue. `publish` can't wait and drops the newest event
+                in this case. Every dropped event is logged as a warning.
+
+            linger_ms: Time (in milliseconds) the producer waits for further
+                events before it sends a batch of events to Kafka.
+
+            batch_num_messages: Maximum number of events the producer sends to
+                Kafka in one request.
+
+            retry_delay_in_seconds: Time to wait before publishing is retried after
+                a failure of the background publisher.
+
+            close_timeout_in_seconds: Maximum time to wait for queued events to be
+                delivered when the event broker is closed.
         """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Cannot initialise `KafkaEventBroker`: "
+                f"Invalid `overflow_policy` ('{overflow_policy}'). Valid values "
+                f"are: {', '.join(OVERFLOW_POLICIES)}."
+            )
+
         self.producer: Optional[Producer] = None
         self.url = url
         self.topic = topic
@@ -90,6 +202,20 @@ class KafkaEventBroker(EventBroker):
         self.ssl_keyfile = ssl_keyfile
         self.queue_size = kwargs.get("queue_size")
         self.ssl_check_hostname = "https" if ssl_check_hostname else None
+        self.publish_queue_size = int(publish_queue_size)
+        self.publish_batch_size = int(publish_batch_size)
+        self.overflow_policy = overflow_policy
+        self.linger_ms = linger_ms
+        self.batch_num_messages = int(batch_num_messages)
+        self.retry_delay_in_seconds = retry_delay_in_seconds
+        self.close_timeout_in_seconds = close_timeout_in_seconds
+
+        # events published from within a running event loop are queued and handed
+        # to the producer by a background task so that neither connecting to Kafka
+        # nor retries ever block the event loop
+        self._queue: Optional["asyncio.Queue[Tuple[Dict[Text, Any], float]]"] = None
+        self._publisher: Optional[asyncio.Task] = None
+        self._stats = KafkaPublishStats()
 
         # Async producer implementation followed from confluent-kafka asyncio example:
         # https://github.com/confluentinc/confluent-kafka-python/blob/master/examples/asyncio_example.py#L88  # noqa: E501
@@ -116,7 +242,73 @@ class KafkaEventBroker(EventBroker):
         retries: int = 60,
         retry_delay_in_seconds: float = 5,
     ) -> None:
-        """Publishes events."""
+        """Publishes events.
+
+        If called from within a running event loop, the event is queued and
+        published by a background task. If the queue is full, the configured
+        `overflow_policy` decides which event is dropped. Otherwise the event is
+        published synchronously.
+
+        Args:
+            event: The serialized event.
+            retries: Number of attempts to publish the event.
+            retry_delay_in_seconds: Time to wait between synchronous attempts.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish_with_retries(event, retries, retry_delay_in_seconds)
+            return
+
+        queue = self._start_publisher()
+        if queue.full():
+            self._stats.dropped_events += 1
+            if self.overflow_policy != OVERFLOW_POLICY_DROP_OLDEST:
+                logger.warning(
+                    f"Kafka publish queue is full. Dropping the newest event "
+                    f"('{event.get('event')}' of '{event.get('sender_id')}')."
+                )
+                return
+
+            dropped_event, _ = queue.get_nowait()
+            queue.task_done()
+            logger.warning(
+                f"Kafka publish queue is full. Dropping the oldest event "
+                f"('{dropped_event.get('event')}' of "
+                f"'{dropped_event.get('sender_id')}')."
+            )
+
+        queue.put_nowait((event, time.perf_counter()))
+
+    async def publish_async(self, event: Dict[Text, Any]) -> None:
+        """Queues an event for publishing in the background.
+
+        With the `wait` overflow policy, no events are dropped. Instead, the caller
+        is slowed down until the background publisher caught up. Otherwise the
+        event is queued like in `publish`.
+
+        Args:
+            event: The serialized event.
+        """
+        if self.overflow_policy != OVERFLOW_POLICY_WAIT:
+            self.publish(event)
+            return
+
+        queue = self._start_publisher()
+        await queue.put((event, time.perf_counter()))
+
+    def stats(self) -> Dict[Text, Any]:
+        """Returns statistics about the background publishing."""
+        return self.publish_stats().as_dict()
+
+    def publish_stats(self) -> KafkaPublishStats:
+        """Returns a snapshot of the background publishing."""
+        queue_depth = self._queue.qsize() if self._queue is not None else 0
+        return KafkaPublishStats(**{**asdict(self._stats), "queue_depth": queue_depth})
+
+    def _publish_with_retries(
+        self, event: Dict[Text, Any], retries: int, retry_delay_in_seconds: float
+    ) -> None:
         from confluent_kafka import KafkaException
 
         if retries == 1:
@@ -139,7 +331,8 @@ class KafkaEventBroker(EventBroker):
                     f"Could not publish message to kafka url '{self.url}'. "
                     f"Failed with error: {e}"
                 )
-                self.producer.poll(1)
+                if self.producer is not None:
+                    self.producer.poll(1)
                 retries -= 1
             except Exception as e:
                 logger.error(
@@ -173,11 +366,13 @@ class KafkaEventBroker(EventBroker):
             self.producer.list_topics(timeout=5)
 
     def _get_kafka_config(self) -> Dict[Text, Any]:
-        config = {
+        config: Dict[Text, Any] = {
             "client.id": self.client_id,
             "bootstrap.servers": self.url,
             "error_cb": kafka_error_callback,
         }
+        config["linger.ms"] = self.linger_ms
+        config["batch.num.messages"] = self.batch_num_messages
         if self.queue_size:
             config["queue.buffering.max.messages"] = self.queue_size
 
@@ -228,7 +423,114 @@ class KafkaEventBroker(EventBroker):
                 f"Cannot initialise `KafkaEventBroker`: {e}"
             )
 
-    def _publish(self, event: Dict[Text, Any]) -> None:
+    def _start_publisher(self) -> "asyncio.Queue[Tuple[Dict[Text, Any], float]]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.publish_queue_size)
+        if self._publisher is None or self._publisher.done():
+            self._publisher = asyncio.ensure_future(self._run_publisher(self._queue))
+        return self._queue
+
+    async def _run_publisher(
+        self, queue: "asyncio.Queue[Tuple[Dict[Text, Any], float]]"
+    ) -> None:
+        """Hands queued events to the producer in batches."""
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    queue.get(), PRODUCER_POLL_INTERVAL_IN_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # serve delivery reports of events which are still in flight
+                if self.producer is not None:
+                    self.producer.poll(0)
+                continue
+
+            batch = [item]
+            while len(batch) < self.publish_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self._produce_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _produce_batch(self, batch: List[Tuple[Dict[Text, Any], float]]) -> None:
+        pending: Deque[Tuple[Dict[Text, Any], float]] = deque(batch)
+        loop = asyncio.get_running_loop()
+
+        while pending:
+            if self.producer is None and not await loop.run_in_executor(
+                None, self._connect
+            ):
+                await asyncio.sleep(self.retry_delay_in_seconds)
+                continue
+
+            event, queued_at = pending[0]
+            try:
+                self._publish(event, queued_at)
+            except BufferError:
+                # the local queue of the producer is full; serve delivery reports
+                # to free up space instead of blocking in `poll`
+                if self.producer is not None:
+                    self.producer.poll(0)
+                await asyncio.sleep(PRODUCER_BUFFER_FULL_DELAY_IN_SECONDS)
+                continue
+            except Exception as e:
+                logger.error(
+                    f"Could not publish message to kafka url '{self.url}'. "
+                    f"Failed with error: {e}"
+                )
+                self._stats.failed_events += 1
+                pending.popleft()
+                continue
+
+            self._stats.produced_events += 1
+            pending.popleft()
+
+        if self.producer is not None:
+            self.producer.poll(0)
+
+    def _connect(self) -> bool:
+        """Creates the producer and checks the connection to Kafka.
+
+        Returns:
+            `True` if Kafka is reachable.
+        """
+        from confluent_kafka import KafkaException
+
+        try:
+            self.producer = self._create_producer()
+            self._check_kafka_connection()
+        except (KafkaException, KafkaProducerInitializationError) as e:
+            logger.error(
+                f"Failed to connect to kafka url '{self.url}'. Retrying in "
+                f"{self.retry_delay_in_seconds} seconds. Error: {e}"
+            )
+            self.producer = None
+            return False
+
+        logger.debug("Connection to kafka successful.")
+        return True
+
+    def _on_delivery(
+        self, queued_at: float, err: Optional["KafkaError"], msg: "Message"
+    ) -> None:
+        if err is None:
+            latency = time.perf_counter() - queued_at
+            self._stats.delivered_events += 1
+            self._stats.total_delivery_latency += latency
+            self._stats.max_delivery_latency = max(
+                self._stats.max_delivery_latency, latency
+            )
+        else:
+            self._stats.failed_events += 1
+
+        delivery_report(err, msg)
+
+    def _publish(
+        self, event: Dict[Text, Any], queued_at: Optional[float] = None
+    ) -> None:
         if self.partition_by_sender:
             partition_key = bytes(event.get("sender_id"), encoding=DEFAULT_ENCODING)
         else:
@@ -255,14 +557,48 @@ class KafkaEventBroker(EventBroker):
 
         serialized_event = json.dumps(event).encode(DEFAULT_ENCODING)
 
+        on_delivery: Callable[[Any, "Message"], None]
+        if queued_at is None:
+            on_delivery = delivery_report
+        else:
+            on_delivery = functools.partial(self._on_delivery, queued_at)
+
         if self.producer is not None:
             self.producer.produce(
                 self.topic,
                 value=serialized_event,
                 key=partition_key,
                 headers=headers,
-                on_delivery=delivery_report,
+                on_delivery=on_delivery,
+            )
+
+    async def close(self) -> None:
+        """Publishes the queued events and closes the producer.
+
+        Events which weren't delivered within `close_timeout_in_seconds` are lost.
+        """
+        if self._queue is not None and self._publisher is not None:
+            try:
+                await asyncio.wait_for(
+                    self._queue.join(), self.close_timeout_in_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Failed to publish {self._queue.qsize()} queued Kafka events "
+                    f"within {self.close_timeout_in_seconds} seconds."
+                )
+            self._publisher.cancel()
+            self._publisher = None
+
+        if self.producer is not None:
+            remaining = await asyncio.get_running_loop().run_in_executor(
+                None, self.producer.flush, self.close_timeout_in_seconds
             )
+            if remaining:
+                logger.error(f"Failed to deliver {remaining} Kafka events.")
+
+        logger.debug(f"Closed Kafka event broker. Statistics: {self.stats()}.")
+        self._close()
 
     def _close(self) -> None:
         self._cancelled = True
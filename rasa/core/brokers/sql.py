@@ -1,8 +1,9 @@
+import asyncio
 import contextlib
 import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Optional, Text, Generator
+from typing import Any, Dict, List, Optional, Text, Generator
 
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
@@ -14,6 +15,11 @@ from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FLUSH_INTERVAL_IN_SECONDS = 1
+# number of rows per `INSERT` statement (SQLite limits the number of bound
+# parameters per statement)
+MAX_ROWS_PER_INSERT = 400
+
 
 class SQLEventBroker(EventBroker):
     """Save events into an SQL database.
@@ -40,8 +46,25 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        buffer_size: int = 0,
+        flush_interval_in_seconds: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
     ) -> None:
-        """Initializes `SQLBrokerEvent`."""
+        """Initializes `SQLBrokerEvent`.
+
+        Args:
+            dialect: SQLAlchemy dialect of the database.
+            host: Database network host.
+            port: Database network port.
+            db: Name of the database.
+            username: Username used to connect to the database.
+            password: Password used to connect to the database.
+            buffer_size: If greater than `0`, events which are published from within a running
+                event loop are buffered and written by a background task as soon as
+                `buffer_size` events were buffered or `flush_interval_in_seconds`
+                passed. Otherwise every event is written in its own transaction.
+            flush_interval_in_seconds: Maximum time buffered events wait before
+                they are written.
+        """
         from rasa.core.tracker_store import SQLTrackerStore
         import sqlalchemy.orm
 
@@ -55,6 +78,13 @@ class SQLEventBroker(EventBroker):
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
+        self.buffer_size = int(buffer_size or 0)
+        self.flush_interval_in_seconds = float(flush_interval_in_seconds)
+        self._buffer: List[Dict[Text, Any]] = []
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
     @classmethod
     async def from_endpoint_config(
         cls,
@@ -74,7 +104,20 @@ class SQLEventBroker(EventBroker):
             session.close()
 
     def publish(self, event: Dict[Text, Any]) -> None:
-        """Publishes a json-formatted Rasa Core event into an event queue."""
+        """Publishes a json-formatted Rasa Core event into an event queue.
+
+        In buffered mode, events which are published from within a running event
+        loop are only added to the buffer.
+        """
+        if self.buffer_size:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._buffer_event(event)
+                return
+
         with self.session_scope() as session:
             session.add(
                 self.SQLBrokerEvent(
@@ -82,3 +125,75 @@ class SQLEventBroker(EventBroker):
                 )
             )
             session.commit()
+
+    def _buffer_event(self, event: Dict[Text, Any]) -> None:
+        flush_requested = self._flush_requested
+        if flush_requested is None or self._flusher is None or self._flusher.done():
+            # The event is created here as it has to belong to the running event loop
+            flush_requested = asyncio.Event()
+            self._flush_requested = flush_requested
+            self._flusher = asyncio.ensure_future(self._run_flusher(flush_requested))
+
+        self._buffer.append(event)
+        if len(self._buffer) >= self.buffer_size:
+            flush_requested.set()
+
+    async def _run_flusher(self, flush_requested: asyncio.Event) -> None:
+        """Writes the buffered events whenever the buffer is full or times out.
+
+        Args:
+            flush_requested: Set when the buffered events should be written now.
+        """
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    flush_requested.wait(), self.flush_interval_in_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            flush_requested.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        events, self._buffer = self._buffer, []
+        if not events:
+            return
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._insert_events, events
+            )
+        except Exception as e:
+            logger.error(
+                f"SQLEventBroker: Failed to write {len(events)} buffered events. "
+                f"Error: {e}"
+            )
+
+    def _insert_events(self, events: List[Dict[Text, Any]]) -> None:
+        """Writes `events` with multi-row inserts in a single transaction."""
+        rows = [
+            {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+            for event in events
+        ]
+        table = self.SQLBrokerEvent.__table__
+
+        with self.session_scope() as session:
+            for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+                session.execute(
+                    table.insert().values(rows[start : start + MAX_ROWS_PER_INSERT])
+                )
+            session.commit()
+
+        logger.debug(f"SQLEventBroker: Wrote {len(rows)} buffered events.")
+
+    async def close(self) -> None:
+        """Writes the buffered events and stops the background task."""
+        if self._flusher is not None and self._flush_requested is not None:
+            # let the background task finish a write which might be in progress
+            self._closing = True
+            self._flush_requested.set()
+            await self._flusher
+            self._flusher = None
+            self._closing = False
+
+        await self._flush()
@@ -1,7 +1,13 @@
 from __future__ import annotations
+import asyncio
+import contextlib
+import multiprocessing
 import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
+    Deque,
     Dict,
     Iterator,
     Optional,
@@ -146,6 +152,9 @@ class EventMetaData:
 # marker applies.
 SessionEvaluation = Dict[Text, List[EventMetaData]]
 
+# number of trackers per process which can wait for their markers to be extracted
+MAX_PENDING_EVALUATIONS_PER_JOB = 2
+
 T = TypeVar("T")
 
 
@@ -600,9 +609,14 @@ class Marker(ABC):
         output_file: Path,
         session_stats_file: Optional[Path] = None,
         overall_stats_file: Optional[Path] = None,
+        jobs: int = 1,
     ) -> None:
         """Collect markers for each dialogue in each tracker loaded.
 
+        The extracted markers and the statistics per session are written to
+        `output_file` and `session_stats_file` while the trackers are processed, i.e.
+        neither the trackers nor the extracted markers are kept in memory.
+
         Args:
             trackers: An iterator over the trackers from which we want to extract
                 markers.
@@ -611,6 +625,8 @@ class Marker(ABC):
                 extracted markers for each session separately.
             overall_stats_file: (Optional) Path to write out statistics about the
                 markers extracted from all session data.
+            jobs: Number of processes which extract markers in parallel. If it's `1`,
+                markers are extracted in the current process.
 
         Raises:
             `FileExistsError` if any of the specified files already exists
@@ -625,59 +641,107 @@ class Marker(ABC):
                 raise NotADirectoryError(f"Expected directory {path.parent} to exist.")
 
         # Apply marker to each session stored in each tracker and save the results.
-        processed_trackers: Dict[Text, List[SessionEvaluation]] = {}
-        async for tracker in trackers:
-            if tracker:
-                tracker_result = self.evaluate_events(tracker.events)
-                processed_trackers[tracker.sender_id] = tracker_result
-
-        processed_trackers_count = len(processed_trackers)
-        telemetry.track_markers_extracted(processed_trackers_count)
-        Marker._save_results(output_file, processed_trackers)
-
-        # Compute and write statistics if requested.
-        if session_stats_file or overall_stats_file:
-            from rasa.core.evaluation.marker_stats import MarkerStatistics
-
-            stats = MarkerStatistics()
-            for sender_id, tracker_result in processed_trackers.items():
+        processed_trackers_count = 0
+        with contextlib.ExitStack() as files:
+            stats = None
+            if session_stats_file or overall_stats_file:
+                from rasa.core.evaluation.marker_stats import MarkerStatistics
+
+                # the statistics per session are discarded if they aren't requested
+                # instead of keeping them in memory
+                per_session_statistics = csv.writer(
+                    files.enter_context(
+                        session_stats_file.open(mode="w")
+                        if session_stats_file
+                        else open(os.devnull, mode="w")
+                    )
+                )
+                stats = MarkerStatistics(per_session_statistics)
+
+            table_writer = csv.writer(files.enter_context(output_file.open(mode="w")))
+            Marker._write_header(table_writer)
+            async for sender_id, tracker_result in self._evaluate_trackers(
+                trackers, jobs
+            ):
+                processed_trackers_count += 1
                 for session_idx, session_result in enumerate(tracker_result):
-                    stats.process(
-                        sender_id=sender_id,
-                        session_idx=session_idx,
-                        meta_data_on_relevant_events_per_marker=session_result,
+                    Marker._write_relevant_events(
+                        table_writer, sender_id, session_idx, session_result
                     )
+                    if stats:
+                        stats.process(
+                            sender_id=sender_id,
+                            session_idx=session_idx,
+                            meta_data_on_relevant_events_per_marker=session_result,
+                        )
+
+        telemetry.track_markers_extracted(processed_trackers_count)
 
+        # Write statistics if requested.
+        if stats:
             telemetry.track_markers_stats_computed(processed_trackers_count)
             if overall_stats_file:
                 stats.overall_statistic_to_csv(path=overall_stats_file)
-            if session_stats_file:
-                stats.per_session_statistics_to_csv(path=session_stats_file)
 
-    @staticmethod
-    def _save_results(path: Path, results: Dict[Text, List[SessionEvaluation]]) -> None:
-        """Save extracted marker results as CSV to specified path.
+    async def _evaluate_trackers(
+        self, trackers: AsyncIterator[Optional[DialogueStateTracker]], jobs: int
+    ) -> AsyncIterator[Tuple[Text, List[SessionEvaluation]]]:
+        """Extracts the markers of the trackers (in the order of the trackers).
 
         Args:
-            path: Path to write out the extracted markers.
-            results: Extracted markers from a selection of trackers.
+            trackers: An iterator over the trackers from which we want to extract
+                markers.
+            jobs: Number of processes which extract markers in parallel.
+
+        Returns:
+            The sender ID and the extracted markers per tracker.
         """
-        with path.open(mode="w") as f:
-            table_writer = csv.writer(f)
-            table_writer.writerow(
-                [
-                    "sender_id",
-                    "session_idx",
-                    "marker",
-                    "event_idx",
-                    "num_preceding_user_turns",
-                ]
-            )
-            for sender_id, results_per_session in results.items():
-                for session_idx, session_result in enumerate(results_per_session):
-                    Marker._write_relevant_events(
-                        table_writer, sender_id, session_idx, session_result
+        if jobs <= 1:
+            async for tracker in trackers:
+                if tracker:
+                    yield tracker.sender_id, self.evaluate_events(tracker.events)
+            return
+
+        loop = asyncio.get_running_loop()
+        evaluations: Deque[Tuple[Text, asyncio.Future]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_marker_process,
+            initargs=(self,),
+        ) as executor:
+            async for tracker in trackers:
+                if not tracker:
+                    continue
+
+                evaluations.append(
+                    (
+                        tracker.sender_id,
+                        loop.run_in_executor(
+                            executor, _evaluate_events_in_process, list(tracker.events)
+                        ),
                     )
+                )
+                # limit the number of trackers which are kept in memory
+                if len(evaluations) >= MAX_PENDING_EVALUATIONS_PER_JOB * jobs:
+                    sender_id, evaluation = evaluations.popleft()
+                    yield sender_id, await evaluation
+
+            while evaluations:
+                sender_id, evaluation = evaluations.popleft()
+                yield sender_id, await evaluation
+
+    @staticmethod
+    def _write_header(table_writer: WriteRow) -> None:
+        table_writer.writerow(
+            [
+                "sender_id",
+                "session_idx",
+                "marker",
+                "event_idx",
+                "num_preceding_user_turns",
+            ]
+        )
 
     @staticmethod
     def _write_relevant_events(
@@ -696,6 +760,25 @@ class Marker(ABC):
                 )
 
 
+# the marker which is used by `_evaluate_events_in_process`
+_process_marker: Optional[Marker] = None
+
+
+def _init_marker_process(marker: Marker) -> None:
+    global _process_marker
+    _process_marker = marker
+
+
+def _evaluate_events_in_process(events: List[Event]) -> List[SessionEvaluation]:
+    """Extracts markers in a process created by `Marker.evaluate_trackers`."""
+    if _process_marker is None:
+        raise RuntimeError(
+            "The marker of this process wasn't set. Please use `Marker.evaluate_"
+            "trackers` to extract markers in several processes."
+        )
+    return _process_marker.evaluate_events(events)
+
+
 class OperatorMarker(Marker, ABC):
     """Combines several markers into one."""
 
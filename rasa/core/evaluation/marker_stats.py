@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Text, Union, List, Tuple
+import io
+from collections import Counter
+from typing import Dict, Optional, Text, Union, List
 
 from rasa.utils.io import WriteRow
 from pathlib import Path
@@ -24,6 +26,45 @@ def compute_statistics(
     }
 
 
+def compute_statistics_from_counts(
+    counts: Counter[int],
+) -> Dict[Text, Union[int, float, np.floating]]:
+    """Computes the same statistics as `compute_statistics` from value counts.
+
+    Args:
+        counts: maps each value to the number of times it occurred
+
+    Returns:
+        the statistics of all the counted values
+    """
+    count = sum(counts.values())
+    if not count:
+        return compute_statistics([])
+
+    values = sorted(counts)
+    return {
+        "count": count,
+        "mean": sum(value * counts[value] for value in values) / count,
+        "median": _median_from_counts(values, counts, count),
+        "min": values[0],
+        "max": values[-1],
+    }
+
+
+def _median_from_counts(values: List[int], counts: Counter[int], count: int) -> float:
+    # the values at these positions (in the sorted list of all values) are averaged
+    lower, upper = (count - 1) // 2, count // 2
+    lower_value: Optional[int] = None
+    position = 0
+    for value in values:
+        position += counts[value]
+        if lower_value is None and position > lower:
+            lower_value = value
+        if lower_value is not None and position > upper:
+            return (lower_value + value) / 2
+    raise ValueError(f"Expected {count} values but only {position} were counted.")
+
+
 class MarkerStatistics:
     """Computes some statistics on marker extraction results.
 
@@ -52,6 +93,12 @@ class MarkerStatistics:
     This means, we compute how many events the marker applies in total and we
     compute an estimate of the expected number of user turns preceding that
     precede an (relevant) event where a marker applies.
+
+    The statistics per session are written as soon as a session is processed and
+    the overall statistics are computed from how often each number of preceding
+    user turns occurred. Hence, if the statistics per session are written to a
+    `per_session_statistics` writer, the memory usage doesn't grow with the number
+    of sessions.
     """
 
     NO_MARKER = "-"
@@ -70,18 +117,28 @@ class MarkerStatistics:
     ALL_SESSIONS = np.nan
     ALL_SENDERS = "all"
 
-    def __init__(self) -> None:
-        """Creates a new marker statistics object."""
+    def __init__(self, per_session_statistics: Optional[WriteRow] = None) -> None:
+        """Creates a new marker statistics object.
+
+        Args:
+            per_session_statistics: if given, the statistics of each processed
+                session are written to it (see `process`). Otherwise they are kept
+                in memory until they are exported with
+                `per_session_statistics_to_csv`.
+        """
         # to ensure consistency of processed rows
         self._marker_names: List[Text] = []
 
-        # (1) For collecting the per-session analysis:
-        # NOTE: we could stream / compute them later instead of collecting them...
-        self.session_results: Dict[Text, Dict[Text, List[Union[int, float]]]] = {}
-        self.session_identifier: List[Tuple[Text, int]] = []
+        # (1) For writing the per-session analysis:
+        self._per_session_statistics_buffer: Optional[io.StringIO] = None
+        if per_session_statistics is None:
+            self._per_session_statistics_buffer = io.StringIO()
+            per_session_statistics = csv.writer(self._per_session_statistics_buffer)
+        self._per_session_statistics = per_session_statistics
+        per_session_statistics.writerow(self._header())
 
         # (2) For the overall statistics:
-        self.num_preceding_user_turns_collected: Dict[Text, List[int]] = {}
+        self.num_preceding_user_turns_counts: Dict[Text, Counter[int]] = {}
         self.count_if_applied_at_least_once: Dict[Text, int] = {}
         self.num_sessions = 0
 
@@ -94,9 +151,11 @@ class MarkerStatistics:
         """Processes the meta data that was extracted from a single session.
 
         Internally, this method ..
-        1. computes some statistics for the given meta data and saves it for later
-        2. keeps track of the total number of sessions processed and the
-           collects all metadata to be able to compute meta data over *all*
+        1. computes some statistics for the given meta data and writes them to the
+           per session statistics (if given)
+        2. keeps track of the total number of sessions processed and counts the
+           numbers of preceding user turns to be able to compute statistics over
+           *all* sessions
 
         Args:
             sender_id: an id that, together with the `session_idx` identifies
@@ -114,14 +173,8 @@ class MarkerStatistics:
             self.count_if_applied_at_least_once = {
                 marker_name: 0 for marker_name in self._marker_names
             }
-            self.num_preceding_user_turns_collected = {
-                marker_name: [] for marker_name in self._marker_names
-            }
-            # NOTE: we could stream / compute them later instead of collecting them...
-            stat_names = sorted(compute_statistics([]).keys())
-            self.session_results = {
-                marker_name: {stat_name: [] for stat_name in stat_names}
-                for marker_name in self._marker_names
+            self.num_preceding_user_turns_counts = {
+                marker_name: Counter() for marker_name in self._marker_names
             }
         else:
             given_markers = meta_data_on_relevant_events_per_marker.keys()
@@ -133,23 +186,28 @@ class MarkerStatistics:
                     f"the marker extracted so far (i.e. {sorted(self._marker_names)})."
                 )
 
-        # update session identifiers / count
+        # update session count
         self.num_sessions += 1
-        self.session_identifier.append((sender_id, session_idx))
-
-        for marker_name, meta_data in meta_data_on_relevant_events_per_marker.items():
 
+        for marker_name in self._marker_names:
             num_preceding_user_turns = [
-                event_meta_data.preceding_user_turns for event_meta_data in meta_data
+                event_meta_data.preceding_user_turns
+                for event_meta_data in meta_data_on_relevant_events_per_marker[
+                    marker_name
+                ]
             ]
 
-            # update per session statistics
-            statistics = compute_statistics(num_preceding_user_turns)
-            for stat_name, stat_value in statistics.items():
-                self.session_results[marker_name][stat_name].append(stat_value)
+            # write per session statistics
+            self._write_per_session_statistics(
+                self._per_session_statistics,
+                sender_id,
+                session_idx,
+                marker_name,
+                num_preceding_user_turns,
+            )
 
             # update overall statistics
-            self.num_preceding_user_turns_collected[marker_name].extend(
+            self.num_preceding_user_turns_counts[marker_name].update(
                 num_preceding_user_turns
             )
             if len(num_preceding_user_turns):
@@ -173,19 +231,25 @@ class MarkerStatistics:
     def per_session_statistics_to_csv(
         self, path: Path, overwrite: bool = False
     ) -> None:
-        """Exports the resulting statistics to a csv file.
+        """Exports the statistics of each processed session to a csv file.
 
         Args:
             path: path to where the csv file should be written.
             overwrite: set to `True` to enable overwriting an existing file
+
+        Raises:
+            `RuntimeError` if the statistics were already written to the
+                `per_session_statistics` which were passed to the constructor
         """
+        if self._per_session_statistics_buffer is None:
+            raise RuntimeError(
+                "The statistics per session were already written while the "
+                "sessions were processed."
+            )
         if path.is_file() and not overwrite:
             raise FileExistsError(f"Expected that there was no file at {path}.")
         with path.open(mode="w") as f:
-            table_writer = csv.writer(f)
-            table_writer.writerow(self._header())
-            # NOTE: we could stream / compute them later instead of collecting them...
-            self._write_per_session_statistics(table_writer)
+            f.write(self._per_session_statistics_buffer.getvalue())
 
     @staticmethod
     def _header() -> List[Text]:
@@ -223,8 +287,8 @@ class MarkerStatistics:
             )
 
     def _write_overall_statistics(self, table_writer: WriteRow) -> None:
-        for marker_name, num_list in self.num_preceding_user_turns_collected.items():
-            for statistic_name, value in compute_statistics(num_list).items():
+        for marker_name, counts in self.num_preceding_user_turns_counts.items():
+            for statistic_name, value in compute_statistics_from_counts(counts).items():
                 MarkerStatistics._write_row(
                     table_writer=table_writer,
                     sender_id=self.ALL_SENDERS,
@@ -234,26 +298,16 @@ class MarkerStatistics:
                     statistic_value=value,
                 )
 
-    def _write_per_session_statistics(self, table_writer: WriteRow) -> None:
-        for marker_name, collected_statistics in self.session_results.items():
-            for statistic_name, values in collected_statistics.items():
-                self._write_per_session_statistic(
-                    table_writer=table_writer,
-                    marker_name=marker_name,
-                    statistic_name=statistic_name,
-                    session_identifiers=self.session_identifier,
-                    values=values,
-                )
-
     @staticmethod
-    def _write_per_session_statistic(
+    def _write_per_session_statistics(
         table_writer: WriteRow,
+        sender_id: Text,
+        session_idx: int,
         marker_name: Text,
-        statistic_name: Text,
-        session_identifiers: List[Tuple[Text, int]],
-        values: List[Union[float, int]],
+        num_preceding_user_turns: List[int],
     ) -> None:
-        for record_idx, (sender_id, session_idx) in enumerate(session_identifiers):
+        statistics = compute_statistics(num_preceding_user_turns)
+        for statistic_name in sorted(statistics):
             MarkerStatistics._write_row(
                 table_writer=table_writer,
                 sender_id=sender_id,
@@ -262,7 +316,7 @@ class MarkerStatistics:
                 statistic_name=MarkerStatistics._add_num_user_turns_str_to(
                     statistic_name
                 ),
-                statistic_value=values[record_idx],
+                statistic_value=statistics[statistic_name],
             )
 
     @staticmethod
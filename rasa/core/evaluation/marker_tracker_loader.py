@@ -1,7 +1,10 @@
+import asyncio
+import itertools
 import random
+from collections import deque
 from rasa.shared.exceptions import RasaException
 from rasa.shared.core.trackers import DialogueStateTracker
-from typing import Any, Iterable, List, Text, Optional, AsyncIterator
+from typing import Any, Deque, Iterable, List, Text, Optional, AsyncIterator
 from rasa.core.tracker_store import TrackerStore
 import rasa.shared.utils.io
 
@@ -9,6 +12,9 @@ STRATEGY_ALL = "all"
 STRATEGY_FIRST_N = "first_n"
 STRATEGY_SAMPLE_N = "sample_n"
 
+# number of trackers which are retrieved from the tracker store concurrently
+DEFAULT_PREFETCH_SIZE = 10
+
 
 def strategy_all(keys: List[Text], count: int) -> Iterable[Text]:
     """Selects all keys from the set of keys."""
@@ -40,6 +46,7 @@ class MarkerTrackerLoader:
         strategy: str,
         count: int = None,
         seed: Any = None,
+        prefetch: int = DEFAULT_PREFETCH_SIZE,
     ) -> None:
         """Creates a MarkerTrackerLoader.
 
@@ -50,9 +57,16 @@ class MarkerTrackerLoader:
             count: Number of trackers to return, can only be None if strategy is 'all'.
             seed: Optional seed to set up random number generator,
                   only useful if strategy is 'sample_n'.
+            prefetch: Number of trackers which are retrieved from the tracker store
+                      ahead of the tracker which is currently processed.
         """
         self.tracker_store = tracker_store
 
+        if prefetch < 1:
+            raise RasaException("Parameter 'prefetch' must be greater than 0.")
+
+        self.prefetch = prefetch
+
         if strategy not in MarkerTrackerLoader._STRATEGY_MAP:
             raise RasaException(
                 f"Invalid strategy for loading markers - '{strategy}' was given, \
@@ -88,16 +102,61 @@ class MarkerTrackerLoader:
                 )
 
     async def load(self) -> AsyncIterator[Optional[DialogueStateTracker]]:
-        """Loads trackers according to strategy."""
-        stored_keys = list(await self.tracker_store.keys())
-        if self.count is not None and self.count > len(stored_keys):
-            # Warn here as user may have overestimated size of data set
-            rasa.shared.utils.io.raise_warning(
-                "'count' exceeds number of trackers in the store -\
-                    all trackers will be processed."
+        """Loads trackers according to strategy.
+
+        Trackers are retrieved concurrently (up to `prefetch` at a time) but they
+        are returned in the order of their keys. Only these trackers are kept in
+        memory. Note that the tracker stores return all of their keys at once, so
+        the keys of all conversations are held in memory while they are loaded.
+        """
+        keys = await self._selected_keys()
+        retrievals: Deque[asyncio.Future] = deque()
+        try:
+            for sender in keys:
+                retrievals.append(
+                    asyncio.ensure_future(
+                        self.tracker_store.retrieve_full_tracker(sender)
+                    )
+                )
+                if len(retrievals) >= self.prefetch:
+                    yield await retrievals.popleft()
+
+            while retrievals:
+                yield await retrievals.popleft()
+        finally:
+            for retrieval in retrievals:
+                retrieval.cancel()
+
+    async def _selected_keys(self) -> Iterable[Text]:
+        stored_keys = await self.tracker_store.keys()
+        if self.strategy is strategy_all:
+            return stored_keys
+
+        if self.strategy is strategy_first_n:
+            return self._warn_if_fewer_keys(
+                itertools.islice(stored_keys, self.count), self.count
             )
+
+        stored_keys = list(stored_keys)
+        if self.count is not None and self.count > len(stored_keys):
+            self._warn_count_exceeds_store()
             self.count = len(stored_keys)
 
-        keys = self.strategy(stored_keys, self.count)
-        for sender in keys:
-            yield await self.tracker_store.retrieve_full_tracker(sender)
+        return self.strategy(stored_keys, self.count)
+
+    def _warn_if_fewer_keys(self, keys: Iterable[Text], count: int) -> Iterable[Text]:
+        number_of_keys = 0
+        for key in keys:
+            number_of_keys += 1
+            yield key
+
+        if number_of_keys < count:
+            self._warn_count_exceeds_store()
+
+    @staticmethod
+    def _warn_count_exceeds_store() -> None:
+        # Warn here as user may have overestimated size of data set
+        rasa.shared.utils.io.raise_warning(
+            "'count' exceeds number of trackers in the store -\
+                all trackers will be processed."
+        )
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Text, Union
+
+import rasa.shared.utils.common
+from rasa.engine.runner.interface import GraphRunner
+from rasa.shared.exceptions import RasaException
+from rasa.utils.endpoints import EndpointConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFERENCE_MAX_WORKERS = 1
+DEFAULT_NLU_BATCH_SIZE = 1  # a batch size of 1 disables micro-batching
+DEFAULT_NLU_BATCH_MAX_WAIT_TIME = 0.005  # in seconds
+
+
+class InferenceExecutorError(RasaException):
+    """Raised if an inference executor can't be created from its configuration."""
+
+
+@dataclass
+class InferenceStats:
+    """Snapshot of the load on an `InferenceExecutor`.
+
+    Attributes:
+        queue_depth: Number of graph runs which were submitted but didn't start yet.
+        in_flight: Number of graph runs which are currently executing.
+        completed_runs: Number of graph runs which finished (successfully or not).
+        total_wait_time: Accumulated time (in seconds) graph runs spent waiting
+            for a free worker.
+        max_wait_time: Longest time (in seconds) a single graph run spent waiting
+            for a free worker.
+    """
+
+    queue_depth: int = 0
+    in_flight: int = 0
+    completed_runs: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Returns the mean time (in seconds) a graph run waited for a worker."""
+        if not self.completed_runs:
+            return 0.0
+        return self.total_wait_time / self.completed_runs
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the statistics in a JSON serializable format."""
+        return {**asdict(self), "average_wait_time": self.average_wait_time}
+
+
+class InferenceExecutor:
+    """Runs the prediction graph on behalf of the `MessageProcessor`.
+
+    Running a graph (e.g. a forward pass of `DIETClassifier` or `TEDPolicy`) is
+    CPU bound. Executors decide where this work happens so that `async` request
+    handlers can `await` graph runs.
+    """
+
+    def __init__(
+        self,
+        nlu_batch_size: int = DEFAULT_NLU_BATCH_SIZE,
+        nlu_batch_max_wait_time: float = DEFAULT_NLU_BATCH_MAX_WAIT_TIME,
+    ) -> None:
+        """Initializes the executor.
+
+        Args:
+            nlu_batch_size: Maximum number of concurrently received user messages
+                which are parsed in a single graph run.
+            nlu_batch_max_wait_time: Time (in seconds) to wait for further user
+                messages before a batch which is not full is parsed.
+        """
+        if int(nlu_batch_size) < 1:
+            raise InferenceExecutorError(
+                f"The NLU batch size needs to be at least 1, but 'nlu_batch_size' "
+                f"was set to {nlu_batch_size}."
+            )
+        self.nlu_batch_size = int(nlu_batch_size)
+        self.nlu_batch_max_wait_time = float(nlu_batch_max_wait_time)
+        self._stats = InferenceStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def create(
+        obj: Union[InferenceExecutor, EndpointConfig, None]
+    ) -> InferenceExecutor:
+        """Factory to create an inference executor."""
+        if isinstance(obj, InferenceExecutor):
+            return obj
+
+        return _create_from_endpoint_config(obj)
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        """Runs `graph_runner` with the given inputs and targets.
+
+        Args:
+            graph_runner: The runner of the loaded prediction graph.
+            inputs: Input nodes to be added to the graph.
+            targets: Nodes whose output is needed.
+
+        Returns:
+            A mapping of target node name to output value.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> InferenceStats:
+        """Returns a snapshot of the current load on the executor."""
+        with self._stats_lock:
+            return InferenceStats(**asdict(self._stats))
+
+    def shutdown(self) -> None:
+        """Releases the resources held by the executor."""
+        pass
+
+    def _run_and_record(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Optional[Dict[Text, Any]],
+        targets: Optional[List[Text]],
+        submitted_at: float,
+    ) -> Dict[Text, Any]:
+        wait_time = time.perf_counter() - submitted_at
+        with self._stats_lock:
+            self._stats.queue_depth -= 1
+            self._stats.in_flight += 1
+            self._stats.total_wait_time += wait_time
+            self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+
+        try:
+            return graph_runner.run(inputs=inputs, targets=targets)
+        finally:
+            with self._stats_lock:
+                self._stats.in_flight -= 1
+                self._stats.completed_runs += 1
+
+    def _record_submission(self) -> float:
+        with self._stats_lock:
+            self._stats.queue_depth += 1
+        return time.perf_counter()
+
+
+class InlineInferenceExecutor(InferenceExecutor):
+    """Runs the graph directly on the event loop.
+
+    This blocks the event loop for the duration of each graph run and is only
+    suitable for development setups or workers which handle one conversation at
+    a time.
+    """
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        """Runs the graph (see parent class for full docstring)."""
+        submitted_at = self._record_submission()
+        return self._run_and_record(graph_runner, inputs, targets, submitted_at)
+
+
+class ThreadPoolInferenceExecutor(InferenceExecutor):
+    """Runs the graph in a pool of worker threads.
+
+    The event loop stays responsive while a graph run is in progress. TensorFlow
+    and numpy release the GIL for the heavy lifting, so several workers can also
+    run graphs for different conversations in parallel.
+    """
+
+    def __init__(
+        self, max_workers: int = DEFAULT_INFERENCE_MAX_WORKERS, **kwargs: Any
+    ) -> None:
+        """Creates the executor.
+
+        Args:
+            max_workers: Number of graph runs which can execute at the same time.
+            kwargs: Batching configuration which is passed to the parent class.
+        """
+        super().__init__(**kwargs)
+        if int(max_workers) < 1:
+            raise InferenceExecutorError(
+                f"The inference executor needs at least one worker, but "
+                f"'max_workers' was set to {max_workers}."
+            )
+        self.max_workers = int(max_workers)
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="rasa_inference"
+        )
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        """Runs the graph (see parent class for full docstring)."""
+        submitted_at = self._record_submission()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._pool,
+            self._run_and_record,
+            graph_runner,
+            inputs,
+            targets,
+            submitted_at,
+        )
+
+    def shutdown(self) -> None:
+        """Waits for pending graph runs and stops the worker threads."""
+        self._pool.shutdown(wait=True)
+
+
+def _create_from_endpoint_config(
+    endpoint_config: Optional[EndpointConfig] = None,
+) -> InferenceExecutor:
+    """Given an endpoint configuration, create a proper `InferenceExecutor`."""
+    if endpoint_config is None:
+        return InlineInferenceExecutor()
+
+    batching_kwargs = {
+        "nlu_batch_size": endpoint_config.kwargs.get(
+            "nlu_batch_size", DEFAULT_NLU_BATCH_SIZE
+        ),
+        "nlu_batch_max_wait_time": endpoint_config.kwargs.get(
+            "nlu_batch_max_wait_time", DEFAULT_NLU_BATCH_MAX_WAIT_TIME
+        ),
+    }
+
+    if endpoint_config.type is None or endpoint_config.type == "inline":
+        # this is the default type if no inference executor type is set
+        executor: InferenceExecutor = InlineInferenceExecutor(**batching_kwargs)
+    elif endpoint_config.type == "thread":
+        executor = ThreadPoolInferenceExecutor(
+            max_workers=endpoint_config.kwargs.get(
+                "max_workers", DEFAULT_INFERENCE_MAX_WORKERS
+            ),
+            **batching_kwargs,
+        )
+    else:
+        executor = _load_from_module_name_in_endpoint_config(endpoint_config)
+
+    logger.debug(f"Using inference executor '{executor.__class__.__name__}'.")
+
+    return executor
+
+
+def _load_from_module_name_in_endpoint_config(
+    endpoint_config: EndpointConfig,
+) -> InferenceExecutor:
+    """Retrieve an `InferenceExecutor` based on its class name."""
+    try:
+        executor_class = rasa.shared.utils.common.class_from_module_path(
+            endpoint_config.type
+        )
+        return executor_class(endpoint_config=endpoint_config)
+    except (AttributeError, ImportError) as e:
+        raise InferenceExecutorError(
+            f"Could not find a class based on the module path "
+            f"'{endpoint_config.type}'. Failed to create an `InferenceExecutor` "
+            f"instance. Error: {e}"
+        )
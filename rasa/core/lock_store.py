@@ -5,7 +5,7 @@ import json
 import logging
 import os
 
-from typing import AsyncGenerator, Dict, Optional, Text, Union
+from typing import Any, AsyncGenerator, Dict, Optional, Text, Union
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
@@ -24,6 +24,8 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+# prefix of the channels on which `RedisLockStore` publishes served tickets
+REDIS_LOCK_RELEASE_CHANNEL_PREFIX = "released:"
 
 
 # noinspection PyUnresolvedReferences
@@ -95,8 +97,9 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Try acquiring lock whenever a ticket of the lock was served, but at least
+        every `wait_time_in_seconds` seconds. Raise a `LockError` if lock has
+        expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
         try:
@@ -133,14 +136,40 @@ class LockStore:
                 f"Retrying in {wait_time_in_seconds} seconds ..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
-            self.update_lock(conversation_id)
+            # if no ticket was served in the meantime, the tickets ahead of this one
+            # might have expired
+            if not await self._wait_for_lock_release(
+                conversation_id, ticket, wait_time_in_seconds
+            ):
+                self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> bool:
+        """Waits until a ticket of the lock for `conversation_id` was served.
+
+        Lock stores which can notify waiting tickets override this method. By
+        default, the lock store waits for `timeout` seconds.
+
+        Args:
+            conversation_id: The conversation ID of the lock.
+            ticket: The ticket which is waiting.
+            timeout: Maximum time (in seconds) to wait.
+
+        Returns:
+            `True` if a ticket was served, `False` if `timeout` passed.
+        """
+        await asyncio.sleep(timeout)
+        return False
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Notifies the tickets waiting for `conversation_id` that one was served."""
+        pass
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
         lock = self.get_lock(conversation_id)
@@ -181,7 +210,9 @@ class LockStore:
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
         self.finish_serving(conversation_id, ticket_number)
-        if not self.is_someone_waiting(conversation_id):
+        if self.is_someone_waiting(conversation_id):
+            self._notify_lock_release(conversation_id)
+        else:
             self.delete_lock(conversation_id)
 
     @staticmethod
@@ -227,8 +258,9 @@ class RedisLockStore(LockStore):
                 in case Redis doesn't respond within `socket_timeout` seconds.
         """
         import redis
+        import redis.asyncio
 
-        self.red = redis.StrictRedis(
+        connection_args: Dict[Text, Any] = dict(
             host=host,
             port=int(port),
             db=int(db),
@@ -239,6 +271,9 @@ class RedisLockStore(LockStore):
             ssl_ca_certs=ssl_ca_certs,
             socket_timeout=socket_timeout,
         )
+        self.red = redis.StrictRedis(**connection_args)
+        # waiting tickets subscribe to notifications without blocking the event loop
+        self.async_red = redis.asyncio.StrictRedis(**connection_args)
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -272,6 +307,47 @@ class RedisLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
 
+    def _release_channel(self, conversation_id: Text) -> Text:
+        return self.key_prefix + REDIS_LOCK_RELEASE_CHANNEL_PREFIX + conversation_id
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Publishes that a ticket for `conversation_id` was served."""
+        self.red.publish(self._release_channel(conversation_id), conversation_id)
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> bool:
+        """Waits for a notification that a ticket for `conversation_id` was served.
+
+        Args:
+            conversation_id: The conversation ID of the lock.
+            ticket: The ticket which is waiting.
+            timeout: Maximum time (in seconds) to wait.
+
+        Returns:
+            `True` if a ticket was served, `False` if `timeout` passed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        pubsub = self.async_red.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._release_channel(conversation_id))
+
+            # the ticket might have been served before the subscription was active
+            lock = self.get_lock(conversation_id)
+            if not lock or not lock.is_locked(ticket):
+                return True
+
+            while loop.time() < deadline:
+                message = await pubsub.get_message(timeout=deadline - loop.time())
+                if message is not None:
+                    return True
+
+            return False
+        finally:
+            await pubsub.reset()
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
@@ -279,6 +355,7 @@ class InMemoryLockStore(LockStore):
     def __init__(self) -> None:
         """Initialise dictionary of locks."""
         self.conversation_locks: Dict[Text, TicketLock] = {}
+        self._lock_releases: Dict[Text, asyncio.Event] = {}
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
@@ -288,6 +365,7 @@ class InMemoryLockStore(LockStore):
     def delete_lock(self, conversation_id: Text) -> None:
         """Delete lock for conversation."""
         deleted_lock = self.conversation_locks.pop(conversation_id, None)
+        self._lock_releases.pop(conversation_id, None)
         self._log_deletion(
             conversation_id, deletion_successful=deleted_lock is not None
         )
@@ -296,6 +374,34 @@ class InMemoryLockStore(LockStore):
         """Save lock in store."""
         self.conversation_locks[lock.conversation_id] = lock
 
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Wakes up the tickets waiting for `conversation_id`."""
+        # every waiting ticket waits for the same event, later tickets wait for a
+        # new one
+        release = self._lock_releases.pop(conversation_id, None)
+        if release is not None:
+            release.set()
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, timeout: float
+    ) -> bool:
+        """Waits until a ticket for `conversation_id` was served.
+
+        Args:
+            conversation_id: The conversation ID of the lock.
+            ticket: The ticket which is waiting.
+            timeout: Maximum time (in seconds) to wait.
+
+        Returns:
+            `True` if a ticket was served, `False` if `timeout` passed.
+        """
+        release = self._lock_releases.setdefault(conversation_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(release.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional, Set, Text, Tuple
+
+from rasa.core.channels.channel import UserMessage
+from rasa.core.inference_executor import InferenceExecutor
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.exceptions import GraphRunError
+from rasa.engine.graph import GraphSchema
+from rasa.engine.runner.interface import GraphRunner
+from rasa.shared.nlu.training_data.message import Message
+
+logger = logging.getLogger(__name__)
+
+
+class NLUMessageBatcher:
+    """Coalesces concurrently received user messages into batched NLU graph runs.
+
+    Every NLU component processes a list of messages. Instead of running the
+    graph once per user message, messages which arrive within
+    `max_wait_time` seconds of each other are parsed together in one graph run
+    and the parsed messages are handed back to the individual callers.
+    """
+
+    def __init__(
+        self,
+        inference_executor: InferenceExecutor,
+        graph_runner: GraphRunner,
+        nlu_target: Text,
+        max_batch_size: int,
+        max_wait_time: float,
+    ) -> None:
+        """Creates the batcher.
+
+        Args:
+            inference_executor: The executor which runs the batched graph runs.
+            graph_runner: The runner of the loaded prediction graph.
+            nlu_target: The graph node which outputs the parsed messages.
+            max_batch_size: Maximum number of messages which are parsed together.
+            max_wait_time: Time (in seconds) to wait for further messages before
+                a batch which is not full is parsed.
+        """
+        self._inference_executor = inference_executor
+        self._graph_runner = graph_runner
+        self._nlu_target = nlu_target
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+
+        self._pending: List[Tuple[UserMessage, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running_batches: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def supports_batching(predict_schema: GraphSchema, nlu_target: Text) -> bool:
+        """Checks whether the NLU part of a graph can parse messages in batches.
+
+        Messages of different conversations can only share a graph run if none
+        of the NLU components depends on the conversation tracker.
+
+        Args:
+            predict_schema: The prediction graph of the model.
+            nlu_target: The graph node which outputs the parsed messages.
+
+        Returns:
+            `True` if the messages can be batched.
+        """
+        nlu_schema = predict_schema.minimal_graph_schema([nlu_target])
+        return not any(
+            PLACEHOLDER_TRACKER in node.needs.values()
+            for node in nlu_schema.nodes.values()
+        )
+
+    async def parse(self, message: UserMessage) -> Message:
+        """Parses `message` as part of the next batch.
+
+        Args:
+            message: The user message to parse.
+
+        Returns:
+            The parsed message.
+        """
+        loop = asyncio.get_running_loop()
+        parsed_message: asyncio.Future = loop.create_future()
+        self._pending.append((message, parsed_message))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_time, self._flush)
+
+        return await parsed_message
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._parse_batch(batch))
+            # keep a reference so that the task isn't garbage collected while running
+            self._running_batches.add(task)
+            task.add_done_callback(self._running_batches.discard)
+
+    async def _parse_batch(
+        self, batch: List[Tuple[UserMessage, asyncio.Future]]
+    ) -> None:
+        logger.debug(f"Parsing a batch of {len(batch)} user message(s).")
+        try:
+            results = await self._inference_executor.run(
+                self._graph_runner,
+                inputs={
+                    PLACEHOLDER_MESSAGE: [message for message, _ in batch],
+                    PLACEHOLDER_TRACKER: None,
+                },
+                targets=[self._nlu_target],
+            )
+            parsed_messages = results[self._nlu_target]
+            if len(parsed_messages) != len(batch):
+                raise GraphRunError(
+                    f"Expected {len(batch)} parsed messages from node "
+                    f"'{self._nlu_target}', but received {len(parsed_messages)}."
+                )
+        except Exception as e:
+            for _, parsed_message in batch:
+                if not parsed_message.done():
+                    parsed_message.set_exception(e)
+            return
+
+        for (_, parsed_message), result in zip(batch, parsed_messages):
+            # the caller might have been cancelled in the meantime
+            if not parsed_message.done():
+                parsed_message.set_result(result)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import copy
+import hashlib
+import struct
 import zlib
 
 import base64
@@ -8,7 +10,7 @@ import logging
 import structlog
 
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, List, Text, Tuple
 from pathlib import Path
 
 import rasa.utils.io
@@ -38,6 +40,97 @@ from rasa.shared.core.constants import ACTION_LISTEN_NAME
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+# feature keys which are hashes of interned state features
+FEATURE_KEY_FORMAT_HASHED = "hashed"
+# feature keys which are (compressed) json dumps of the states
+FEATURE_KEY_FORMAT_JSON = "json"
+
+StateFeature = Tuple[Text, Text, Any]
+
+
+class FeatureKeyEncoder:
+    """Encodes states as fixed-width keys.
+
+    Every feature of a state (e.g. the intent of the user or the value of a slot)
+    is interned as an integer id. The ids of the states' features are hashed into
+    the key, so that creating a key doesn't require to serialize the states.
+    States which contain a feature which wasn't interned can't have a key.
+    """
+
+    # separates the features of consecutive states
+    _STATE_SEPARATOR = 0
+
+    def __init__(self, features: Optional[List[List[Any]]] = None) -> None:
+        """Creates the encoder.
+
+        Args:
+            features: Features which were interned before (see `as_list`).
+        """
+        self._feature_ids: Dict[StateFeature, int] = {}
+        for state_type, key, value in features or []:
+            self._intern((state_type, key, self._hashable(value)))
+
+    @staticmethod
+    def _hashable(value: Any) -> Any:
+        # json dumps and loads tuples as lists
+        return tuple(value) if isinstance(value, list) else value
+
+    def _intern(self, feature: StateFeature) -> int:
+        feature_id = self._feature_ids.get(feature)
+        if feature_id is None:
+            feature_id = len(self._feature_ids) + 1
+            self._feature_ids[feature] = feature_id
+        return feature_id
+
+    def intern_features(self, states: List[State]) -> None:
+        """Interns all features of `states` so that keys can be created for them.
+
+        Args:
+            states: The states whose features should be interned.
+        """
+        for state in states:
+            for state_type, sub_state in state.items():
+                for key, value in sub_state.items():
+                    self._intern((state_type, key, self._hashable(value)))
+
+    def encode(self, states: List[State]) -> Optional[Text]:
+        """Creates the key for `states`.
+
+        Args:
+            states: The states to create the key for.
+
+        Returns:
+            The key or `None` if a feature of the states wasn't interned (or the
+            states are malformed).
+        """
+        ids: List[int] = []
+        for state in states:
+            state_ids = []
+            for state_type, sub_state in state.items():
+                if not isinstance(sub_state, dict):
+                    return None
+                for key, value in sub_state.items():
+                    try:
+                        feature_id = self._feature_ids.get(
+                            (state_type, key, self._hashable(value))
+                        )
+                    except TypeError:
+                        return None
+                    if feature_id is None:
+                        return None
+                    state_ids.append(feature_id)
+            # the order of the features within a state doesn't matter
+            ids.extend(sorted(state_ids))
+            ids.append(self._STATE_SEPARATOR)
+
+        return hashlib.blake2b(
+            struct.pack(f"<{len(ids)}I", *ids), digest_size=16
+        ).hexdigest()
+
+    def as_list(self) -> List[List[Any]]:
+        """Returns the interned features in a json serializable format."""
+        return [list(feature) for feature in self._feature_ids]
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
@@ -92,6 +185,8 @@ class MemoizationPolicy(Policy):
         """Initialize the policy."""
         super().__init__(config, model_storage, resource, execution_context, featurizer)
         self.lookup = lookup or {}
+        self.feature_key_format = FEATURE_KEY_FORMAT_HASHED
+        self.feature_key_encoder = FeatureKeyEncoder()
 
     def _create_lookup_from_states(
         self,
@@ -148,6 +243,9 @@ class MemoizationPolicy(Policy):
         if not states:
             return None
 
+        if self.feature_key_format == FEATURE_KEY_FORMAT_HASHED:
+            return self.feature_key_encoder.encode(states)
+
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
@@ -182,6 +280,12 @@ class MemoizationPolicy(Policy):
             trackers_as_states,
             trackers_as_actions,
         ) = self.featurizer.training_states_and_labels(training_trackers, domain)
+
+        self.feature_key_format = FEATURE_KEY_FORMAT_HASHED
+        self.feature_key_encoder = FeatureKeyEncoder()
+        for states in trackers_as_states:
+            self.feature_key_encoder.intern_features(states)
+
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
@@ -269,12 +373,33 @@ class MemoizationPolicy(Policy):
         return self._prediction(result)
 
     def _metadata(self) -> Dict[Text, Any]:
-        return {"lookup": self.lookup}
+        metadata: Dict[Text, Any] = {
+            "lookup": self.lookup,
+            "feature_key_format": self.feature_key_format,
+        }
+        if self.feature_key_format == FEATURE_KEY_FORMAT_HASHED:
+            metadata["features"] = self.feature_key_encoder.as_list()
+        return metadata
 
     @classmethod
     def _metadata_filename(cls) -> Text:
         return "memorized_turns.json"
 
+    def _restore_feature_keys(self, metadata: Dict[Text, Any]) -> None:
+        # models which were trained before feature keys were hashed only persisted
+        # the lookup with json feature keys
+        self.feature_key_format = metadata.get(
+            "feature_key_format", FEATURE_KEY_FORMAT_JSON
+        )
+        if self.feature_key_format == FEATURE_KEY_FORMAT_HASHED:
+            self.feature_key_encoder = FeatureKeyEncoder(metadata.get("features"))
+        else:
+            logger.debug(
+                f"Policy '{self.__class__.__name__}' uses json feature keys as the "
+                f"model was trained with an older version of Rasa. Retrain the "
+                f"model to use the faster hashed feature keys."
+            )
+
     def persist(self) -> None:
         """Persists the policy to storage."""
         with self._model_storage.write_to(self._resource) as path:
@@ -299,6 +424,7 @@ class MemoizationPolicy(Policy):
         """Loads a trained policy (see parent class for full docstring)."""
         featurizer = None
         lookup = None
+        metadata: Dict[Text, Any] = {}
 
         try:
             with model_storage.read_from(resource) as path:
@@ -315,7 +441,7 @@ class MemoizationPolicy(Policy):
                 f"metadata couldn't be loaded."
             )
 
-        return cls(
+        policy = cls(
             config,
             model_storage,
             resource,
@@ -323,6 +449,9 @@ class MemoizationPolicy(Policy):
             featurizer=featurizer,
             lookup=lookup,
         )
+        if lookup is not None:
+            policy._restore_feature_keys(metadata)
+        return policy
 
 
 @DefaultV1Recipe.register(
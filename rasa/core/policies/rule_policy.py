@@ -8,7 +8,7 @@ from typing import Any, List, DefaultDict, Dict, Text, Optional, Set, Tuple, cas
 from tqdm import tqdm
 import numpy as np
 import json
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
@@ -93,6 +93,89 @@ class InvalidRule(RasaException):
         )
 
 
+RuleFeature = Tuple[Text, Text, Any]
+
+
+class _RuleIndex:
+    """Rule keys of a lookup indexed by the features of their latest state.
+
+    Each rule is indexed by the feature of its latest state which is the rarest
+    one among all rules. Only rules whose indexed feature is present in the
+    latest conversation state need to be checked against the conversation.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        self.lookup = lookup
+        self.size = len(lookup)
+        # rule states with the latest state first
+        self.reversed_rule_states: Dict[Text, List[State]] = {
+            rule_key: list(reversed(json.loads(rule_key))) for rule_key in lookup
+        }
+
+        # rules whose latest state is a conversation start
+        self._conversation_start_rules: List[Text] = []
+        # rules which don't require any feature to be present
+        self._unindexed_rules: List[Text] = []
+        self._rules_by_feature: DefaultDict[RuleFeature, List[Text]] = defaultdict(list)
+
+        required_features = {}
+        for rule_key, rule_states in self.reversed_rule_states.items():
+            if not rule_states or not rule_states[0].get(PREVIOUS_ACTION):
+                self._conversation_start_rules.append(rule_key)
+            else:
+                required_features[rule_key] = self._required_features(rule_states[0])
+
+        frequencies = Counter(
+            feature
+            for features in required_features.values()
+            for feature in set(features)
+        )
+        for rule_key, features in required_features.items():
+            if not features:
+                self._unindexed_rules.append(rule_key)
+                continue
+            rarest_feature = min(features, key=lambda feature: frequencies[feature])
+            self._rules_by_feature[rarest_feature].append(rule_key)
+
+    @staticmethod
+    def _required_features(rule_state: State) -> List[RuleFeature]:
+        features = []
+        for state_type, rule_sub_state in rule_state.items():
+            for key, value in rule_sub_state.items():
+                if not value or value == SHOULD_NOT_BE_SET:
+                    continue
+                if isinstance(value, list):
+                    # json dumps and loads tuples as lists,
+                    # so we need to convert them back
+                    value = tuple(value)
+                features.append((state_type, key, value))
+        return features
+
+    def candidates(self, conversation_state: State) -> List[Text]:
+        """Returns the rules which might apply to the latest conversation state.
+
+        Args:
+            conversation_state: The latest state of the conversation.
+
+        Returns:
+            Keys of the rules whose latest state might match `conversation_state`.
+        """
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return self._conversation_start_rules
+
+        candidates = list(self._unindexed_rules)
+        for state_type, sub_state in conversation_state.items():
+            for key, value in sub_state.items():
+                try:
+                    candidates.extend(
+                        self._rules_by_feature.get((state_type, key, value), [])
+                    )
+                except TypeError:
+                    # unhashable values can't match any of the indexed features
+                    continue
+        return candidates
+
+
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
 )
@@ -164,6 +247,8 @@ class RulePolicy(MemoizationPolicy):
         self._rules_sources: DefaultDict[Text, List[Tuple[Text, Text]]] = defaultdict(
             list
         )
+        self._rule_indices: Dict[Text, _RuleIndex] = {}
+        self._index_rules()
 
     @classmethod
     def raise_if_incompatible_with_domain(
@@ -824,6 +909,7 @@ class RulePolicy(MemoizationPolicy):
             )
 
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
+        self._index_rules()
 
         self.persist()
 
@@ -865,22 +951,23 @@ class RulePolicy(MemoizationPolicy):
     def _rule_key_to_state(rule_key: Text) -> List[State]:
         return json.loads(rule_key)
 
+    @classmethod
     def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
+        cls,
+        reversed_rule_states: List[State],
+        turn_index: int,
+        conversation_state: State,
     ) -> bool:
         """Checks if rule is satisfied with current state at turn.
 
         Args:
-            rule_key: the textual representation of learned rule
-            turn_index: index of a current dialogue turn
+            reversed_rule_states: the states of the rule with the latest state first
+            turn_index: index of a current dialogue turn (it goes back in time)
             conversation_state: the state that corresponds to turn_index
 
         Returns:
             a boolean that says whether the rule is applicable to current state
         """
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
         # the rule must be applicable because we got (without any applicability issues)
         # further in the conversation history than the rule's length
         if turn_index >= len(reversed_rule_states):
@@ -906,21 +993,44 @@ class RulePolicy(MemoizationPolicy):
             return False
 
         # check: current rule state features are present in current conversation state
-        return self._does_rule_match_state(
+        return cls._does_rule_match_state(
             reversed_rule_states[turn_index], conversation_state
         )
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
-                )
-            )
+    def _index_rules(self) -> None:
+        for lookup_key in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+            if lookup_key in self.lookup:
+                self._rule_index(lookup_key)
+
+    def _rule_index(self, lookup_key: Text) -> _RuleIndex:
+        lookup = self.lookup[lookup_key]
+        rule_index = self._rule_indices.get(lookup_key)
+        # rules might get removed while the rules are checked for contradictions
+        if (
+            rule_index is None
+            or rule_index.lookup is not lookup
+            or rule_index.size != len(lookup)
+        ):
+            rule_index = _RuleIndex(lookup)
+            self._rule_indices[lookup_key] = rule_index
+        return rule_index
+
+    def _get_possible_keys(self, lookup_key: Text, states: List[State]) -> Set[Text]:
+        if not states:
+            return set(self.lookup[lookup_key].keys())
+
+        rule_index = self._rule_index(lookup_key)
+        reversed_states = list(reversed(states))
+
+        possible_keys = set()
+        for rule_key in rule_index.candidates(reversed_states[0]):
+            reversed_rule_states = rule_index.reversed_rule_states[rule_key]
+            # the rule is applicable to all turns which go back further than the rule
+            if all(
+                self._is_rule_applicable(reversed_rule_states, i, state)
+                for i, state in enumerate(reversed_states[: len(reversed_rule_states)])
+            ):
+                possible_keys.add(rule_key)
         return possible_keys
 
     @staticmethod
@@ -1033,7 +1143,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -1047,7 +1157,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -1256,6 +1366,11 @@ class RulePolicy(MemoizationPolicy):
     def _metadata_filename(cls) -> Text:
         return "rule_policy.json"
 
+    def _restore_feature_keys(self, metadata: Dict[Text, Any]) -> None:
+        # rule keys are always json dumps of the states as they are parsed again
+        # when rules are checked
+        pass
+
     def _get_rule_only_data(self) -> Dict[Text, Any]:
         """Gets the slots and loops that are used only in rule data.
 
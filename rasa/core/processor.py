@@ -7,9 +7,11 @@ from pathlib import Path
 import tarfile
 import time
 from types import LambdaType
-from typing import Any, Dict, List, Optional, Text, Tuple, Union
+from typing import Any, Dict, List, Optional, Text, Tuple, Union, cast
 
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
+from rasa.core.inference_executor import InferenceExecutor, InlineInferenceExecutor
+from rasa.core.nlu_batcher import NLUMessageBatcher
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
 from rasa.engine.runner.dask import DaskGraphRunner
@@ -80,6 +82,7 @@ logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
 MAX_NUMBER_OF_PREDICTIONS = int(os.environ.get("MAX_NUMBER_OF_PREDICTIONS", "10"))
+WARM_UP_SENDER_ID = "warm_up"
 
 
 class MessageProcessor:
@@ -95,6 +98,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ) -> None:
         """Initializes a `MessageProcessor`."""
         self.nlg = generator
@@ -120,6 +124,31 @@ class MessageProcessor:
         self.model_path = Path(model_path)
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
+        self.inference_executor = inference_executor or InlineInferenceExecutor()
+        self._nlu_batcher = self._create_nlu_batcher()
+
+    def _create_nlu_batcher(self) -> Optional[NLUMessageBatcher]:
+        """Creates a batcher for NLU parsing if micro-batching is configured."""
+        if self.inference_executor.nlu_batch_size <= 1:
+            return None
+
+        if not NLUMessageBatcher.supports_batching(
+            self.model_metadata.predict_schema, self.model_metadata.nlu_target
+        ):
+            rasa.shared.utils.io.raise_warning(
+                "The NLU pipeline of this model contains a component which depends "
+                "on the conversation tracker. User messages will be parsed one by "
+                "one instead of in batches."
+            )
+            return None
+
+        return NLUMessageBatcher(
+            self.inference_executor,
+            self.graph_runner,
+            self.model_metadata.nlu_target,
+            max_batch_size=self.inference_executor.nlu_batch_size,
+            max_wait_time=self.inference_executor.nlu_batch_max_wait_time,
+        )
 
     @staticmethod
     def _load_model(
@@ -150,6 +179,34 @@ class MessageProcessor:
             except tarfile.ReadError:
                 raise ModelNotFound(f"Model {model_path} can not be loaded.")
 
+    def warm_up(self) -> None:
+        """Runs a sample message through the model.
+
+        This initializes anything the components load lazily (e.g. compiled
+        TensorFlow functions) so that the first real message isn't slowed down by it.
+        Failures are only logged as the model might still be able to handle actual
+        conversations.
+        """
+        targets = [self.model_metadata.nlu_target]
+        if self.model_metadata.core_target:
+            targets.append(self.model_metadata.core_target)
+
+        tracker = DialogueStateTracker.from_events(
+            WARM_UP_SENDER_ID, [], slots=self.domain.slots
+        )
+        try:
+            self.graph_runner.run(
+                inputs={
+                    PLACEHOLDER_MESSAGE: [
+                        UserMessage("hello", sender_id=tracker.sender_id)
+                    ],
+                    PLACEHOLDER_TRACKER: tracker,
+                },
+                targets=targets,
+            )
+        except Exception as e:  # skipcq: PYL-W0703
+            logger.warning(f"Failed to warm up model '{self.model_filename}': {e}")
+
     async def handle_message(
         self, message: UserMessage
     ) -> Optional[List[Dict[Text, Any]]]:
@@ -242,7 +299,18 @@ class MessageProcessor:
             The prediction for the next action. `None` if no domain or policies loaded.
         """
         tracker = await self.fetch_tracker_and_update_session(sender_id)
-        result = self.predict_next_with_tracker(tracker)
+
+        if self.model_metadata.training_type == TrainingType.NLU:
+            rasa.shared.utils.io.raise_warning(
+                "No core model. Skipping action prediction and execution.",
+                docs=DOCS_URL_POLICIES,
+            )
+            result = None
+        else:
+            prediction = await self._async_predict_next_with_tracker(tracker)
+            result = self._prediction_as_dict(
+                tracker, prediction, EventVerbosity.AFTER_RESTART
+            )
 
         # save tracker state to continue conversation from this state
         await self.save_tracker(tracker)
@@ -272,6 +340,14 @@ class MessageProcessor:
 
         prediction = self._predict_next_with_tracker(tracker)
 
+        return self._prediction_as_dict(tracker, prediction, verbosity)
+
+    def _prediction_as_dict(
+        self,
+        tracker: DialogueStateTracker,
+        prediction: PolicyPrediction,
+        verbosity: EventVerbosity,
+    ) -> Dict[Text, Any]:
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names_or_texts, prediction.probabilities)
@@ -521,6 +597,26 @@ class MessageProcessor:
         Raises:
             ActionLimitReached if the limit of actions to predict has been reached.
         """
+        self._raise_if_action_limit_reached(tracker)
+        prediction = self._predict_next_with_tracker(tracker)
+        return self._action_for_prediction(prediction), prediction
+
+    async def _async_predict_next_with_tracker_if_should(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
+        """Predicts the next action without blocking the event loop.
+
+        Same as `predict_next_with_tracker_if_should` but the prediction graph is
+        run by the processor's `InferenceExecutor`.
+
+        Raises:
+            ActionLimitReached if the limit of actions to predict has been reached.
+        """
+        self._raise_if_action_limit_reached(tracker)
+        prediction = await self._async_predict_next_with_tracker(tracker)
+        return self._action_for_prediction(prediction), prediction
+
+    def _raise_if_action_limit_reached(self, tracker: DialogueStateTracker) -> None:
         should_predict_another_action = self.should_predict_another_action(
             tracker.latest_action_name
         )
@@ -530,8 +626,9 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
-
+    def _action_for_prediction(
+        self, prediction: PolicyPrediction
+    ) -> rasa.core.actions.action.Action:
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
         )
@@ -541,7 +638,7 @@ class MessageProcessor:
             f"{prediction.max_confidence:.2f}."
         )
 
-        return action, prediction
+        return action
 
     @staticmethod
     def _is_reminder(e: Event, name: Text) -> bool:
@@ -725,7 +822,7 @@ class MessageProcessor:
             )
             # Intent is not explicitly present. Pass message to graph.
             if msg.data.get(INTENT) is None:
-                parse_data = self._parse_message_with_graph(
+                parse_data = await self._parse_message_with_graph(
                     message, tracker, only_output_properties
                 )
             else:
@@ -738,6 +835,78 @@ class MessageProcessor:
                     msg.as_dict(only_output_properties=only_output_properties)
                 )
 
+        self._log_and_check_parse_data(parse_data)
+
+        return parse_data
+
+    async def parse_messages(
+        self,
+        messages: List[UserMessage],
+        trackers: Optional[List[Optional[DialogueStateTracker]]] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Interprets several messages with a single run of the NLU graph.
+
+        The result is the same as calling `parse_message` for every message.
+        Messages are only parsed one by one if they can't share a graph run, i.e.
+        if an HTTP interpreter is used or if the NLU pipeline depends on the
+        conversation tracker and trackers are given.
+
+        Args:
+            messages: Messages to handle.
+            trackers: Trackers to use (one per message).
+            only_output_properties: If `True`, restrict the output to
+                Message.only_output_properties.
+
+        Returns:
+            Parsed data extracted from the messages.
+        """
+        trackers = trackers or [None] * len(messages)
+        if self.http_interpreter or (
+            any(tracker is not None for tracker in trackers)
+            and not NLUMessageBatcher.supports_batching(
+                self.model_metadata.predict_schema, self.model_metadata.nlu_target
+            )
+        ):
+            return [
+                await self.parse_message(message, tracker, only_output_properties)
+                for message, tracker in zip(messages, trackers)
+            ]
+
+        results: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+        messages_for_graph = []
+        for index, (message, tracker) in enumerate(zip(messages, trackers)):
+            msg = YAMLStoryReader.unpack_regex_message(
+                message=Message({TEXT: message.text})
+            )
+            if msg.data.get(INTENT) is None:
+                messages_for_graph.append((index, message))
+            else:
+                # messages with an explicit intent don't need the graph
+                results[index] = await self.parse_message(
+                    message, tracker, only_output_properties
+                )
+
+        if messages_for_graph:
+            graph_results = await self.inference_executor.run(
+                self.graph_runner,
+                inputs={
+                    PLACEHOLDER_MESSAGE: [message for _, message in messages_for_graph],
+                    PLACEHOLDER_TRACKER: None,
+                },
+                targets=[self.model_metadata.nlu_target],
+            )
+            parsed_messages = graph_results[self.model_metadata.nlu_target]
+            for (index, _), parsed_message in zip(messages_for_graph, parsed_messages):
+                parse_data = self._parse_data_from_message(
+                    parsed_message, only_output_properties
+                )
+                self._log_and_check_parse_data(parse_data)
+                results[index] = parse_data
+
+        return cast(List[Dict[Text, Any]], results)
+
+    def _log_and_check_parse_data(self, parse_data: Dict[Text, Any]) -> None:
         structlogger.debug(
             "processor.message.parse",
             parse_data_text=copy.deepcopy(parse_data["text"]),
@@ -747,9 +916,7 @@ class MessageProcessor:
 
         self._check_for_unseen_features(parse_data)
 
-        return parse_data
-
-    def _parse_message_with_graph(
+    async def _parse_message_with_graph(
         self,
         message: UserMessage,
         tracker: Optional[DialogueStateTracker] = None,
@@ -766,12 +933,22 @@ class MessageProcessor:
         Returns:
             Parsed data extracted from the message.
         """
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: tracker},
-            targets=[self.model_metadata.nlu_target],
-        )
-        parsed_messages = results[self.model_metadata.nlu_target]
-        parsed_message = parsed_messages[0]
+        if self._nlu_batcher:
+            parsed_message = await self._nlu_batcher.parse(message)
+        else:
+            results = await self.inference_executor.run(
+                self.graph_runner,
+                inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: tracker},
+                targets=[self.model_metadata.nlu_target],
+            )
+            parsed_messages = results[self.model_metadata.nlu_target]
+            parsed_message = parsed_messages[0]
+        return self._parse_data_from_message(parsed_message, only_output_properties)
+
+    @staticmethod
+    def _parse_data_from_message(
+        parsed_message: Message, only_output_properties: bool = True
+    ) -> Dict[Text, Any]:
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -858,7 +1035,10 @@ class MessageProcessor:
         while should_predict_another_action and self._should_handle_message(tracker):
             # this actually just calls the policy's method by the same name
             try:
-                action, prediction = self.predict_next_with_tracker_if_should(tracker)
+                (
+                    action,
+                    prediction,
+                ) = await self._async_predict_next_with_tracker_if_should(tracker)
             except ActionLimitReached:
                 logger.warning(
                     "Circuit breaker tripped. Stopped predicting "
@@ -1104,6 +1284,35 @@ class MessageProcessor:
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
+        followup_prediction = self._get_followup_prediction(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        target = self._get_core_target()
+        results = self.graph_runner.run(
+            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        )
+        policy_prediction = results[target]
+        return policy_prediction
+
+    async def _async_predict_next_with_tracker(
+        self, tracker: DialogueStateTracker
+    ) -> PolicyPrediction:
+        """Collects predictions from the ensemble using the inference executor."""
+        followup_prediction = self._get_followup_prediction(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        target = self._get_core_target()
+        results = await self.inference_executor.run(
+            self.graph_runner, inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        )
+        policy_prediction = results[target]
+        return policy_prediction
+
+    def _get_followup_prediction(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[PolicyPrediction]:
         followup_action = tracker.followup_action
         if followup_action:
             tracker.clear_followup_action()
@@ -1119,12 +1328,10 @@ class MessageProcessor:
                 "and predict the next action."
             )
 
+        return None
+
+    def _get_core_target(self) -> Text:
         target = self.model_metadata.core_target
         if not target:
             raise ValueError("Cannot predict next action if there is no core target.")
-
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
-        )
-        policy_prediction = results[target]
-        return policy_prediction
+        return target
@@ -267,6 +267,12 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
         app: The Sanic application.
         _: The current Sanic worker event loop.
     """
+    from rasa.core.channels.callback import CallbackInput
+
+    for channel in getattr(app.ctx, "input_channels", None) or []:
+        if isinstance(channel, CallbackInput):
+            await channel.callback_endpoint.close()
+
     current_agent = getattr(app.ctx, "agent", None)
     if not current_agent:
         logger.debug("No agent found when shutting down server.")
@@ -275,3 +281,8 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         await event_broker.close()
+
+    current_agent.inference_executor.shutdown()
+
+    for endpoint in current_agent.http_endpoints().values():
+        await endpoint.close()
@@ -93,6 +93,7 @@ class WarningPredictedAction(ActionExecuted):
     """The model predicted the correct action with warning."""
 
     type_name = "warning_predicted"
+    __slots__ = ("action_name_prediction",)
 
     def __init__(
         self,
@@ -123,6 +124,7 @@ class WronglyPredictedAction(ActionExecuted):
     """
 
     type_name = "wrong_action"
+    __slots__ = ("action_name_prediction", "predicted_action_unlikely_intent")
 
     def __init__(
         self,
@@ -354,6 +356,8 @@ class EndToEndUserUtterance(UserUttered):
     `failed_test_stories.yml` output file.
     """
 
+    __slots__ = ()
+
     def as_story_string(self, e2e: bool = True) -> Text:
         """Returns the story equivalent representation."""
         return super().as_story_string(e2e=True)
@@ -366,6 +370,7 @@ class WronglyClassifiedUserUtterance(UserUttered):
     dump them as stories."""
 
     type_name = "wrong_utterance"
+    __slots__ = ("predicted_intent", "target_entities", "predicted_entities")
 
     def __init__(self, event: UserUttered, eval_store: EvaluationStore) -> None:
         """Set `predicted_intent` and `predicted_entities` attributes."""
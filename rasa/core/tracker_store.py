@@ -1,9 +1,11 @@
 from __future__ import annotations
+import asyncio
 import contextlib
 import itertools
 import json
 import logging
 import os
+from collections import OrderedDict
 from inspect import isawaitable, iscoroutinefunction
 
 from time import sleep
@@ -14,13 +16,16 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
     Generator,
     TypeVar,
     Generic,
+    cast,
 )
 
 from boto3.dynamodb.conditions import Key
@@ -31,7 +36,7 @@ import rasa.shared.utils.cli
 import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.plugin import plugin_manager
-from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
@@ -69,6 +74,19 @@ POSTGRESQL_DEFAULT_POOL_SIZE = 50
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
 
+# fields of the conversation documents in MongoTrackerStore which keep track of the
+# stored events
+MONGO_NUMBER_OF_EVENTS_KEY = "number_of_events"
+MONGO_SESSION_START_KEY = "session_start"
+
+# key prefixes of the event lists and session indices in AsyncRedisTrackerStore
+REDIS_EVENTS_KEY_PREFIX = "events:"
+REDIS_SESSIONS_KEY_PREFIX = "sessions:"
+
+# name of the tracker store option which enables the `CachedTrackerStore`
+TRACKER_CACHE_SIZE = "cache_size"
+DEFAULT_TRACKER_CACHE_SIZE = 1000
+
 
 def check_if_tracker_store_async(tracker_store: TrackerStore) -> bool:
     """Evaluates if a tracker store object is async based on implementation of methods.
@@ -94,6 +112,10 @@ class TrackerDeserialisationException(RasaException):
     """Raised when an error is encountered while deserialising a tracker."""
 
 
+class TrackerDivergedException(RasaException):
+    """Raised when a tracker doesn't continue the stored events of its conversation."""
+
+
 SerializationType = TypeVar("SerializationType")
 
 
@@ -143,11 +165,13 @@ class TrackerStore:
             domain: The `Domain` to initialize the `DialogueStateTracker`.
             event_broker: An event broker to publish any new events to another
                 destination.
-            kwargs: Additional kwargs.
+            kwargs: Additional kwargs. If `compact_events` is `True`, the events
+                of retrieved trackers are compacted to reduce their memory usage.
         """
         self._domain = domain or Domain.empty()
         self.event_broker = event_broker
         self.max_event_history: Optional[int] = None
+        self.compact_events = bool(kwargs.get("compact_events", False))
 
     @staticmethod
     def create(
@@ -218,6 +242,7 @@ class TrackerStore:
             sender_id,
             self.domain.slots,
             max_event_history=self.max_event_history,
+            compact_events=self.compact_events,
         )
 
     async def create_tracker(
@@ -243,8 +268,16 @@ class TrackerStore:
 
         return tracker
 
-    async def save(self, tracker: DialogueStateTracker) -> None:
-        """Save method that will be overridden by specific tracker."""
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        """Save method that will be overridden by specific tracker.
+
+        Args:
+            tracker: The tracker to save.
+
+        Returns:
+            The version of the stored tracker (see `tracker_version`) which was
+            written by this save or `None` if the tracker store doesn't know it.
+        """
         raise NotImplementedError()
 
     async def exists(self, conversation_id: Text) -> bool:
@@ -274,6 +307,21 @@ class TrackerStore:
         """
         raise NotImplementedError()
 
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Returns a token which changes whenever new events are stored.
+
+        The token is used to check cheaply whether a cached tracker is still up to
+        date. This method may be overridden by the specific tracker store.
+
+        Args:
+            sender_id: Conversation ID to fetch the version for.
+
+        Returns:
+            The version of the stored tracker or `None` if the tracker store can't
+            determine it without retrieving the tracker.
+        """
+        return None
+
     async def retrieve_full_tracker(
         self, conversation_id: Text
     ) -> Optional[DialogueStateTracker]:
@@ -334,7 +382,7 @@ class TrackerStore:
         for event in new_events:
             body = {"sender_id": sender_id}
             body.update(event.as_dict())
-            event_broker.publish(body)
+            await event_broker.publish_async(body)
 
     async def keys(self) -> Iterable[Text]:
         """Returns the set of values for the tracker store's primary key."""
@@ -615,6 +663,273 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
         return merged
 
 
+class AsyncRedisTrackerStore(TrackerStore, SerializedTrackerAsText):
+    """Stores conversation history in Redis using an asyncio Redis client.
+
+    The events of a conversation are stored as a Redis list to which only the new
+    events are appended. The positions of the `SessionStarted` events are stored in
+    a second list, so that only the events of the latest session have to be fetched
+    when retrieving a tracker.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        host: Text = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[Text] = None,
+        event_broker: Optional[EventBroker] = None,
+        record_exp: Optional[float] = None,
+        key_prefix: Optional[Text] = None,
+        use_ssl: bool = False,
+        ssl_keyfile: Optional[Text] = None,
+        ssl_certfile: Optional[Text] = None,
+        ssl_ca_certs: Optional[Text] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Initializes the tracker store."""
+        import redis.asyncio
+
+        self.red = redis.asyncio.StrictRedis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            ssl=use_ssl,
+            ssl_keyfile=ssl_keyfile,
+            ssl_certfile=ssl_certfile,
+            ssl_ca_certs=ssl_ca_certs,
+            decode_responses=True,
+        )
+        self.record_exp = record_exp
+
+        self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
+        if key_prefix:
+            logger.debug(f"Setting non-default redis key prefix: '{key_prefix}'.")
+            self._set_key_prefix(key_prefix)
+
+        super().__init__(domain, event_broker, **kwargs)
+
+    def _set_key_prefix(self, key_prefix: Text) -> None:
+        if isinstance(key_prefix, str) and key_prefix.isalnum():
+            self.key_prefix = key_prefix + ":" + DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
+        else:
+            logger.warning(
+                f"Omitting provided non-alphanumeric redis key prefix: '{key_prefix}'. "
+                f"Using default '{self.key_prefix}' instead."
+            )
+
+    def _events_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + REDIS_EVENTS_KEY_PREFIX + sender_id
+
+    def _sessions_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + REDIS_SESSIONS_KEY_PREFIX + sender_id
+
+    @staticmethod
+    def _is_same_event(event: Event, serialised_event: Optional[Text]) -> bool:
+        if serialised_event is None:
+            return False
+        stored = json.loads(serialised_event)
+        return (
+            stored.get("event") == event.type_name
+            and stored.get("timestamp") == event.timestamp
+        )
+
+    async def save(
+        self, tracker: DialogueStateTracker, timeout: Optional[float] = None
+    ) -> Optional[Text]:
+        """Appends the events which aren't stored yet to the conversation.
+
+        Returns:
+            The number of stored events after saving.
+        """
+        if not timeout and self.record_exp:
+            timeout = self.record_exp
+
+        import redis.exceptions
+
+        events_key = self._events_key(tracker.sender_id)
+        sessions_key = self._sessions_key(tracker.sender_id)
+
+        async with self.red.pipeline(transaction=True) as pipe:
+            while True:
+                # The stored events are watched so that the transaction fails (and
+                # is retried) if another save appended events in the meantime.
+                # Otherwise both saves would append the same events.
+                await pipe.watch(events_key, sessions_key)
+                number_of_events = await pipe.llen(events_key)
+                session_starts = await pipe.lrange(sessions_key, 0, -1)
+                last_event = await pipe.lindex(events_key, -1)
+
+                offset = self._number_of_stored_events(
+                    tracker,
+                    number_of_events,
+                    [int(session_start) for session_start in session_starts],
+                    last_event,
+                )
+                new_events = list(
+                    itertools.islice(tracker.events, offset, len(tracker.events))
+                )
+
+                pipe.multi()
+                if new_events:
+                    pipe.rpush(
+                        events_key,
+                        *[json.dumps(event.as_dict()) for event in new_events],
+                    )
+                    new_session_starts = [
+                        number_of_events + index
+                        for index, event in enumerate(new_events)
+                        if isinstance(event, SessionStarted)
+                    ]
+                    if new_session_starts:
+                        pipe.rpush(sessions_key, *new_session_starts)
+                if timeout:
+                    pipe.expire(events_key, int(timeout))
+                    pipe.expire(sessions_key, int(timeout))
+
+                try:
+                    results = await pipe.execute()
+                    break
+                except redis.exceptions.WatchError:
+                    logger.debug(
+                        f"Events of conversation ID '{tracker.sender_id}' changed "
+                        f"while they were saved. Retrying."
+                    )
+
+        if self.event_broker:
+            await self._stream_new_events(
+                self.event_broker, new_events, tracker.sender_id
+            )
+
+        # `rpush` returns the length of the list after appending the events
+        return str(results[0] if new_events else number_of_events)
+
+    def _number_of_stored_events(
+        self,
+        tracker: DialogueStateTracker,
+        number_of_events: int,
+        session_starts: List[int],
+        last_event: Optional[Text],
+    ) -> int:
+        """Returns how many events of `tracker` are already stored.
+
+        The tracker starts with the stored events of the latest session (see
+        `retrieve`), of all sessions (see `retrieve_full_tracker`) or of any
+        session in between, followed by the new events.
+
+        Args:
+            tracker: The tracker to save.
+            number_of_events: The number of stored events of all sessions.
+            session_starts: The positions of the events which start a session.
+            last_event: The last stored event.
+
+        Returns:
+            The number of events at the start of the tracker which are stored.
+
+        Raises:
+            TrackerDivergedException: If the tracker doesn't contain the last stored
+                event at any of the possible positions. Which of its events are new
+                can't be determined then.
+        """
+        if number_of_events == 0:
+            return 0
+
+        for session_start in itertools.chain(reversed(session_starts), [0]):
+            number_of_stored_events = number_of_events - session_start
+            if len(tracker.events) >= number_of_stored_events and (
+                self._is_same_event(
+                    tracker.events[number_of_stored_events - 1], last_event
+                )
+            ):
+                return number_of_stored_events
+
+        raise TrackerDivergedException(
+            f"The tracker for conversation ID '{tracker.sender_id}' doesn't continue "
+            f"the stored events of this conversation. Its events weren't saved to "
+            f"avoid storing them twice or losing any of them. Please retrieve the "
+            f"tracker again and re-apply the new events."
+        )
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from the latest conversation sessions.
+        """
+        return await self._retrieve(sender_id, fetch_all_sessions=False)
+
+    async def retrieve_full_tracker(
+        self, sender_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for all conversation sessions.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from all conversation sessions.
+        """
+        return await self._retrieve(sender_id, fetch_all_sessions=True)
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        """Returns tracker matching sender_id.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+            fetch_all_sessions: Whether to fetch all sessions or only the last one.
+        """
+        session_start = None
+        if not fetch_all_sessions:
+            session_start = await self.red.lindex(self._sessions_key(sender_id), -1)
+
+        serialised_events = await self.red.lrange(
+            self._events_key(sender_id),
+            int(session_start) if session_start is not None else 0,
+            -1,
+        )
+        if not serialised_events:
+            logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
+            return None
+
+        events = [
+            Event.from_parameters(json.loads(serialised_event))
+            for serialised_event in serialised_events
+        ]
+        tracker = self.init_tracker(sender_id)
+        tracker.recreate_from_dialogue(Dialogue(sender_id, events))
+
+        return tracker
+
+    async def exists(self, conversation_id: Text) -> bool:
+        """Checks if tracker exists for the specified ID.
+
+        Args:
+            conversation_id: Conversation ID to check if the tracker exists.
+
+        Returns:
+            `True` if the tracker exists, `False` otherwise.
+        """
+        return bool(await self.red.exists(self._events_key(conversation_id)))
+
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Returns the number of stored events (see parent class for details)."""
+        return str(await self.red.llen(self._events_key(sender_id)))
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns the conversation IDs of the stored trackers."""
+        prefix = self.key_prefix + REDIS_EVENTS_KEY_PREFIX
+        return [
+            key[len(prefix) :] async for key in self.red.scan_iter(match=prefix + "*")
+        ]
+
+
 class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
     """Stores conversation history in DynamoDB."""
 
@@ -740,7 +1055,9 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         else:
             slots = self.domain.slots
 
-        return DialogueStateTracker.from_dict(sender_id, events_with_floats, slots)
+        return DialogueStateTracker.from_dict(
+            sender_id, events_with_floats, slots, compact_events=self.compact_events
+        )
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
@@ -757,6 +1074,285 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         return sender_ids
 
 
+class SessionDynamoTrackerStore(DynamoTrackerStore):
+    """Stores conversation history in DynamoDB with one item per session.
+
+    Every conversation session is stored as a separate item which is keyed by the
+    conversation ID and the number of the session. New events are appended to
+    the items with `UpdateItem` instead of writing the whole conversation on every
+    turn, and the latest session is retrieved by reading a single item.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        table_name: Text = "conversation_sessions",
+        region: Text = "us-east-1",
+        event_broker: Optional[EndpointConfig] = None,
+        **kwargs: Dict[Text, Any],
+    ) -> None:
+        """Initialize `SessionDynamoTrackerStore`.
+
+        Args:
+            domain: Domain associated with this tracker store.
+            table_name: The name of the DynamoDB table, does not need to be present a
+                priori.
+            region: The name of the region associated with the client.
+                A client is associated with a single region.
+            event_broker: An event broker used to publish events.
+            kwargs: Additional kwargs.
+        """
+        super().__init__(domain, table_name, region, event_broker, **kwargs)
+
+    def get_or_create_table(
+        self, table_name: Text
+    ) -> "boto3.resources.factory.dynamodb.Table":
+        """Returns table or creates one if the table name is not in the table list."""
+        import boto3
+
+        dynamo = boto3.resource("dynamodb", region_name=self.region)
+        try:
+            description = self.client.describe_table(TableName=table_name)
+        except self.client.exceptions.ResourceNotFoundException:
+            table = dynamo.create_table(
+                TableName=self.table_name,
+                KeySchema=[
+                    {"AttributeName": "sender_id", "KeyType": "HASH"},
+                    {"AttributeName": "session_number", "KeyType": "RANGE"},
+                ],
+                AttributeDefinitions=[
+                    {"AttributeName": "sender_id", "AttributeType": "S"},
+                    {"AttributeName": "session_number", "AttributeType": "N"},
+                ],
+                ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+            )
+
+            # Wait until the table exists.
+            table.meta.client.get_waiter("table_exists").wait(TableName=table_name)
+            return table
+
+        key_attributes = {
+            key["AttributeName"] for key in description["Table"]["KeySchema"]
+        }
+        if key_attributes != {"sender_id", "session_number"}:
+            raise RasaException(
+                f"The DynamoDB table '{table_name}' can't be used to store "
+                f"conversation sessions as its key isn't made up of the attributes "
+                f"'sender_id' and 'session_number'. Please use a different table."
+            )
+
+        return dynamo.Table(table_name)
+
+    @staticmethod
+    def _split_into_sessions(events: List[Event]) -> List[List[Event]]:
+        # sessions start with a `SessionStarted` event like the latest session which
+        # is retrieved by the other tracker stores. Events before the first
+        # `SessionStarted` event belong to the first session.
+        sessions: List[List[Event]] = []
+        session_started = False
+        for event in events:
+            if not sessions or (session_started and isinstance(event, SessionStarted)):
+                sessions.append([])
+            session_started = session_started or isinstance(event, SessionStarted)
+            sessions[-1].append(event)
+        return sessions
+
+    def _latest_stored_session(self, sender_id: Text) -> Optional[Dict[Text, Any]]:
+        items = self.db.query(
+            KeyConditionExpression=Key("sender_id").eq(sender_id),
+            ProjectionExpression=(
+                "session_number, number_of_events, last_event_timestamp"
+            ),
+            ScanIndexForward=False,
+            Limit=1,
+        )["Items"]
+        return items[0] if items else None
+
+    def _first_new_session(
+        self,
+        tracker: DialogueStateTracker,
+        sessions: List[List[Event]],
+        latest_stored_session: Dict[Text, Any],
+    ) -> Optional[int]:
+        """Returns which session of the tracker is the latest stored session.
+
+        The tracker starts with the stored events of the latest session (see
+        `retrieve`), of all sessions (see `retrieve_full_tracker`) or of any
+        session in between, followed by the new events.
+
+        Args:
+            tracker: The tracker to save.
+            sessions: The events of the tracker split into sessions.
+            latest_stored_session: The item of the latest stored session.
+
+        Returns:
+            The index of the tracker session which is the latest stored session or
+            `None` if the tracker diverged from the stored events (e.g. because its
+            events were replaced).
+        """
+        number_of_events = int(latest_stored_session["number_of_events"])
+        last_event_timestamp = latest_stored_session.get("last_event_timestamp")
+
+        for index in reversed(range(len(sessions))):
+            session = sessions[index]
+            if len(session) >= number_of_events and (
+                core_utils.replace_floats_with_decimals(
+                    session[number_of_events - 1].timestamp
+                )
+                == last_event_timestamp
+            ):
+                return index
+
+        return None
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Appends the events which aren't stored yet to the session items."""
+        await self.stream_events(tracker)
+
+        sessions = self._split_into_sessions(list(tracker.events))
+        if not sessions:
+            return
+
+        latest_stored_session = self._latest_stored_session(tracker.sender_id)
+        if latest_stored_session is None:
+            session_number = 0
+            new_sessions = sessions
+        else:
+            index = self._first_new_session(tracker, sessions, latest_stored_session)
+            if index is None:
+                logger.debug(
+                    f"Tracker for conversation ID '{tracker.sender_id}' diverged "
+                    f"from the stored events. Replacing all stored sessions."
+                )
+                self._replace_sessions(tracker.sender_id, sessions)
+                return
+
+            session_number = int(latest_stored_session["session_number"])
+            new_sessions = sessions[index:]
+            new_sessions[0] = new_sessions[0][
+                int(latest_stored_session["number_of_events"]) :
+            ]
+
+        for new_events in new_sessions:
+            if new_events:
+                self._append_events(tracker.sender_id, session_number, new_events)
+            session_number += 1
+
+    def _replace_sessions(self, sender_id: Text, sessions: List[List[Event]]) -> None:
+        """Overwrites the stored sessions of a conversation with `sessions`."""
+        for session_number, events in enumerate(sessions):
+            self.db.put_item(
+                Item=core_utils.replace_floats_with_decimals(
+                    {
+                        "sender_id": sender_id,
+                        "session_number": session_number,
+                        "events": [event.as_dict() for event in events],
+                        "number_of_events": len(events),
+                        "last_event_timestamp": events[-1].timestamp,
+                    }
+                )
+            )
+
+        # remove sessions which the tracker doesn't contain anymore
+        query = {
+            "KeyConditionExpression": (
+                Key("sender_id").eq(sender_id)
+                & Key("session_number").gte(len(sessions))
+            ),
+            "ProjectionExpression": "session_number",
+        }
+        response = self.db.query(**query)
+        stale_sessions = response["Items"]
+        while response.get("LastEvaluatedKey"):
+            response = self.db.query(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **query
+            )
+            stale_sessions.extend(response["Items"])
+
+        with self.db.batch_writer() as batch:
+            for item in stale_sessions:
+                batch.delete_item(
+                    Key={
+                        "sender_id": sender_id,
+                        "session_number": item["session_number"],
+                    }
+                )
+
+    def _append_events(
+        self, sender_id: Text, session_number: int, events: List[Event]
+    ) -> None:
+        self.db.update_item(
+            Key={"sender_id": sender_id, "session_number": session_number},
+            UpdateExpression=(
+                "SET #events = list_append(if_not_exists(#events, :empty), :events), "
+                "number_of_events = if_not_exists(number_of_events, :zero) + :count, "
+                "last_event_timestamp = :last_event_timestamp"
+            ),
+            ExpressionAttributeNames={"#events": "events"},
+            ExpressionAttributeValues={
+                ":empty": [],
+                ":zero": 0,
+                # DynamoDB cannot store `float`s, so we convert them to `Decimal`s
+                ":events": core_utils.replace_floats_with_decimals(
+                    [event.as_dict() for event in events]
+                ),
+                ":count": len(events),
+                ":last_event_timestamp": core_utils.replace_floats_with_decimals(
+                    events[-1].timestamp
+                ),
+            },
+        )
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        """Returns tracker matching sender_id.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+            fetch_all_sessions: Whether to fetch all sessions or only the last one.
+        """
+        query: Dict[Text, Any]
+        if fetch_all_sessions:
+            query = {"ScanIndexForward": True}
+        else:
+            query = {"ScanIndexForward": False, "Limit": 1}
+
+        response = self.db.query(
+            KeyConditionExpression=Key("sender_id").eq(sender_id), **query
+        )
+        sessions = response["Items"]
+        while fetch_all_sessions and response.get("LastEvaluatedKey"):
+            response = self.db.query(
+                KeyConditionExpression=Key("sender_id").eq(sender_id),
+                ExclusiveStartKey=response["LastEvaluatedKey"],
+                **query,
+            )
+            sessions.extend(response["Items"])
+
+        if not sessions:
+            return None
+
+        # `float`s are stored as `Decimal` objects - we need to convert them back
+        events = core_utils.replace_decimals_with_floats(
+            [event for session in sessions for event in session.get("events", [])]
+        )
+
+        if self.domain is None:
+            slots = []
+        else:
+            slots = self.domain.slots
+
+        return DialogueStateTracker.from_dict(
+            sender_id, events, slots, compact_events=self.compact_events
+        )
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the `SessionDynamoTrackerStore`."""
+        # every session of a conversation is a separate item
+        return list(dict.fromkeys(await super().keys()))
+
+
 class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
     """Stores conversation history in Mongo.
 
@@ -812,23 +1408,56 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         return state
 
-    async def save(self, tracker: DialogueStateTracker) -> None:
-        """Saves the current conversation state."""
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        """Saves the current conversation state.
+
+        Returns:
+            The number of stored events after saving.
+        """
+        from pymongo import ReturnDocument
+
         await self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        additional_events = list(self._additional_events(tracker))
+        state = self._current_tracker_state_without_events(tracker)
 
-        self.conversations.update_one(
+        # The counters are incremented in the same operation which appends the
+        # events, so they match the stored events even if the conversation is
+        # saved concurrently.
+        stored = self.conversations.find_one_and_update(
             {"sender_id": tracker.sender_id},
             {
-                "$set": self._current_tracker_state_without_events(tracker),
+                "$set": state,
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
+                "$inc": {MONGO_NUMBER_OF_EVENTS_KEY: len(additional_events)},
             },
+            projection={MONGO_NUMBER_OF_EVENTS_KEY: 1},
             upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
 
+        session_starts = [
+            index
+            for index, event in enumerate(additional_events)
+            if isinstance(event, SessionStarted)
+        ]
+        if session_starts:
+            first_new_event = stored[MONGO_NUMBER_OF_EVENTS_KEY] - len(
+                additional_events
+            )
+            self.conversations.update_one(
+                {"sender_id": tracker.sender_id},
+                {
+                    "$max": {
+                        MONGO_SESSION_START_KEY: first_new_event + session_starts[-1]
+                    }
+                },
+            )
+
+        return str(stored[MONGO_NUMBER_OF_EVENTS_KEY])
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -839,66 +1468,101 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             List of serialised events that aren't currently stored.
 
         """
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        number_of_events, session_start = self._event_counters(tracker.sender_id) or (
+            0,
+            0,
         )
 
         return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+            tracker.events, number_of_events - session_start, len(tracker.events)
         )
 
-    @staticmethod
-    def _events_from_serialized_tracker(serialised: Dict) -> List[Dict]:
-        return serialised.get("events", [])
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Returns the number of stored events (see parent class for details)."""
+        counters = self._event_counters(sender_id)
+        return str(counters[0]) if counters else "0"
 
-    @staticmethod
-    def _events_since_last_session_start(events: List[Dict]) -> List[Dict]:
-        """Retrieve events since and including the latest `SessionStart` event.
+    def _event_counters(self, sender_id: Text) -> Optional[Tuple[int, int]]:
+        """Returns the number of stored events and the start of the latest session.
 
         Args:
-            events: All events for a conversation ID.
+            sender_id: Conversation ID to fetch the counters for.
 
         Returns:
-            List of serialised events since and including the latest `SessionStarted`
-            event. Returns all events if no such event is found.
-
+            The number of stored events and the position of the latest
+            `SessionStarted` event (`0` if there is none) or `None` if there is no
+            stored conversation.
         """
-        events_after_session_start = []
-        for event in reversed(events):
-            events_after_session_start.append(event)
-            if event["event"] == SessionStarted.type_name:
-                break
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            {MONGO_NUMBER_OF_EVENTS_KEY: 1, MONGO_SESSION_START_KEY: 1},
+        )
+        if stored is None:
+            return None
 
-        return list(reversed(events_after_session_start))
+        if MONGO_NUMBER_OF_EVENTS_KEY in stored:
+            return (
+                stored[MONGO_NUMBER_OF_EVENTS_KEY],
+                stored.get(MONGO_SESSION_START_KEY, 0),
+            )
+
+        # conversations which were stored by older versions of Rasa don't have
+        # counters, so they have to be determined from the types of the events
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, {"events.event": 1}
+        )
+        event_types = [event.get("event") for event in stored.get("events", [])]
+        session_start = max(
+            (
+                index
+                for index, event_type in enumerate(event_types)
+                if event_type == SessionStarted.type_name
+            ),
+            default=0,
+        )
+
+        # store the counters so that they can be incremented from now on
+        self.conversations.update_one(
+            {"sender_id": sender_id, MONGO_NUMBER_OF_EVENTS_KEY: {"$exists": False}},
+            {
+                "$set": {
+                    MONGO_NUMBER_OF_EVENTS_KEY: len(event_types),
+                    MONGO_SESSION_START_KEY: session_start,
+                }
+            },
+        )
+
+        return len(event_types), session_start
 
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        counters = self._event_counters(sender_id)
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
-        if not stored and sender_id.isdigit():
-            from pymongo import ReturnDocument
-
-            stored = self.conversations.find_one_and_update(
+        if counters is None and sender_id.isdigit():
+            self.conversations.update_one(
                 {"sender_id": int(sender_id)},
                 {"$set": {"sender_id": str(sender_id)}},
-                return_document=ReturnDocument.AFTER,
             )
+            counters = self._event_counters(sender_id)
 
-        if not stored:
+        if counters is None:
             return None
 
-        events = self._events_from_serialized_tracker(stored)
+        number_of_events, session_start = counters
+        if fetch_events_from_all_sessions or not number_of_events:
+            projection: Dict[Text, Any] = {"events": 1}
+        else:
+            # only fetch the events since the latest `SessionStarted` event
+            projection = {
+                "events": {"$slice": [session_start, number_of_events - session_start]}
+            }
 
-        if not fetch_events_from_all_sessions:
-            events = self._events_since_last_session_start(events)
+        stored = self.conversations.find_one({"sender_id": sender_id}, projection)
 
-        return events
+        return stored.get("events", []) if stored else None
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
@@ -907,7 +1571,9 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        return DialogueStateTracker.from_dict(
+            sender_id, events, self.domain.slots, compact_events=self.compact_events
+        )
 
     async def retrieve_full_tracker(
         self, conversation_id: Text
@@ -921,12 +1587,18 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             return None
 
         return DialogueStateTracker.from_dict(
-            conversation_id, events, self.domain.slots
+            conversation_id,
+            events,
+            self.domain.slots,
+            compact_events=self.compact_events,
         )
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
-        return [c["sender_id"] for c in self.conversations.find()]
+        return [
+            c["sender_id"]
+            for c in self.conversations.find({}, {"sender_id": 1, "_id": 0})
+        ]
 
 
 def _create_sequence(table_name: Text) -> "Sequence":
@@ -1247,6 +1919,22 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
             return [sender_id for (sender_id,) in sender_ids]
 
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Returns the id of the latest stored event (see parent class for details)."""
+        return self._latest_event_id(sender_id)
+
+    def _latest_event_id(self, sender_id: Text) -> Text:
+        with self.session_scope() as session:
+            return self._query_latest_event_id(session, sender_id)
+
+    def _query_latest_event_id(self, session: "Session", sender_id: Text) -> Text:
+        latest_event_id = (
+            session.query(sa.func.max(self.SQLEvent.id))
+            .filter(self.SQLEvent.sender_id == sender_id)
+            .scalar()
+        )
+        return str(latest_event_id or 0)
+
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
         return await self._retrieve(sender_id, fetch_events_from_all_sessions=False)
@@ -1275,7 +1963,10 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
                 return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
+                    sender_id,
+                    events,
+                    self.domain.slots,
+                    compact_events=self.compact_events,
                 )
             else:
                 logger.debug(
@@ -1325,8 +2016,12 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         return event_query.order_by(self.SQLEvent.timestamp)
 
-    async def save(self, tracker: DialogueStateTracker) -> None:
-        """Update database with events from the current conversation."""
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        """Update database with events from the current conversation.
+
+        Returns:
+            The id of the latest stored event of the conversation.
+        """
         await self.stream_events(tracker)
 
         with self.session_scope() as session:
@@ -1334,27 +2029,15 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             events = self._additional_events(session, tracker)
 
             for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
                 # noinspection PyArgumentList
                 session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+                    self.SQLEvent(**self._event_columns(tracker.sender_id, event))
                 )
+            version = self._query_latest_event_id(session, tracker.sender_id)
             session.commit()
 
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+        return version
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
@@ -1368,6 +2051,344 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             tracker.events, number_of_events_since_last_session, len(tracker.events)
         )
 
+    @staticmethod
+    def _event_columns(sender_id: Text, event: Event) -> Dict[Text, Any]:
+        """Returns the column values of the row which stores `event`."""
+        data = event.as_dict()
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": data.get("timestamp"),
+            "intent_name": data.get("parse_data", {})
+            .get("intent", {})
+            .get(INTENT_NAME_KEY),
+            "action_name": data.get("name"),
+            "data": json.dumps(data),
+        }
+
+
+class AsyncSQLTrackerStore(SQLTrackerStore):
+    """Store which saves and retrieves trackers from an SQL database without blocking.
+
+    Database calls run in a worker thread so that they don't block the event loop.
+    The number of stored events and the start of the latest conversation session
+    are kept per conversation in a separate table. New events are inserted in one
+    batch without counting the stored events first and the latest conversation
+    session is fetched with a single range scan over the event ids.
+
+    Events are stored in the same table as in the `SQLTrackerStore`.
+    """
+
+    SessionBase: DeclarativeMeta = declarative_base()
+
+    class SQLConversationSession(SessionBase):
+        """Points to the latest conversation session of a conversation."""
+
+        __tablename__ = "conversation_sessions"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        number_of_events = sa.Column(sa.Integer, nullable=False)
+        # id and position of the `SessionStarted` event of the latest session
+        session_start_id = sa.Column(sa.Integer)
+        session_start_index = sa.Column(sa.Integer)
+        last_event_type = sa.Column(sa.String(255))
+        last_event_timestamp = sa.Column(sa.Float)
+
+    def __init__(self, domain: Optional[Domain] = None, **kwargs: Any) -> None:
+        """Initializes the tracker store."""
+        import sqlalchemy.exc
+
+        super().__init__(domain, **kwargs)
+
+        try:
+            self.SessionBase.metadata.create_all(self.engine)
+        except (
+            sqlalchemy.exc.OperationalError,
+            sqlalchemy.exc.ProgrammingError,
+        ) as e:
+            logger.error(f"Could not create tables: {e}")
+
+    @staticmethod
+    async def _run_in_thread(func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def keys(self) -> Iterable[Text]:
+        """Returns sender_ids of the AsyncSQLTrackerStore."""
+        return await self._run_in_thread(self._sender_ids)
+
+    def _sender_ids(self) -> List[Text]:
+        with self.session_scope() as session:
+            sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
+            return [sender_id for (sender_id,) in sender_ids]
+
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Returns the id of the latest stored event (see parent class for details)."""
+        return await self._run_in_thread(self._latest_event_id, sender_id)
+
+    async def _retrieve(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        events = await self._run_in_thread(
+            self._retrieve_events, sender_id, fetch_events_from_all_sessions
+        )
+
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            return DialogueStateTracker.from_dict(
+                sender_id, events, self.domain.slots, compact_events=self.compact_events
+            )
+
+        logger.debug(
+            f"Can't retrieve tracker matching "
+            f"sender id '{sender_id}' from SQL storage. "
+            f"Returning `None` instead."
+        )
+        return None
+
+    def _retrieve_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> List[Dict[Text, Any]]:
+        with self.session_scope() as session:
+            event_query = session.query(self.SQLEvent.data).filter(
+                self.SQLEvent.sender_id == sender_id
+            )
+            if not fetch_events_from_all_sessions:
+                session_start_id = (
+                    session.query(
+                        sa.func.coalesce(
+                            self.SQLConversationSession.session_start_id, 0
+                        )
+                    )
+                    .filter(self.SQLConversationSession.sender_id == sender_id)
+                    .scalar_subquery()
+                )
+                # no rows are found if there is no pointer to the latest session
+                event_query = event_query.filter(self.SQLEvent.id >= session_start_id)
+
+            serialised_events = event_query.order_by(self.SQLEvent.id).all()
+
+            if not serialised_events and not fetch_events_from_all_sessions:
+                # the events might have been stored by the `SQLTrackerStore`
+                serialised_events = self._event_query(
+                    session, sender_id, fetch_events_from_all_sessions=False
+                ).all()
+
+            return [json.loads(event.data) for event in serialised_events]
+
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        """Inserts the events which aren't stored yet into the database.
+
+        Returns:
+            The id of the latest stored event of the conversation.
+        """
+        new_events, version = await self._run_in_thread(self._save, tracker)
+
+        if self.event_broker:
+            await self._stream_new_events(
+                self.event_broker, new_events, tracker.sender_id
+            )
+
+        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+        return version
+
+    def _save(self, tracker: DialogueStateTracker) -> Tuple[List[Event], Text]:
+        import sqlalchemy.exc
+
+        try:
+            return self._save_new_events(tracker)
+        except sqlalchemy.exc.IntegrityError:
+            # the pointer to the conversation session was created by a concurrent
+            # save, which is locked properly once the pointer exists
+            logger.debug(
+                f"Conversation session of '{tracker.sender_id}' was created "
+                f"concurrently. Retrying to save the tracker."
+            )
+            return self._save_new_events(tracker)
+
+    def _save_new_events(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[List[Event], Text]:
+        with self.session_scope() as session:
+            conversation_session = self._conversation_session(
+                session, tracker.sender_id
+            )
+            number_of_stored_events = self._number_of_stored_events(
+                tracker, conversation_session
+            )
+            new_events = list(
+                itertools.islice(
+                    tracker.events, number_of_stored_events, len(tracker.events)
+                )
+            )
+            if not new_events:
+                return [], self._query_latest_event_id(session, tracker.sender_id)
+
+            session.execute(
+                self.SQLEvent.__table__.insert(),
+                [self._event_columns(tracker.sender_id, event) for event in new_events],
+            )
+
+            values: Dict[Text, Any] = {
+                "last_event_type": new_events[-1].type_name,
+                "last_event_timestamp": new_events[-1].timestamp,
+            }
+            session_starts = [
+                index
+                for index, event in enumerate(new_events)
+                if isinstance(event, SessionStarted)
+            ]
+            if session_starts:
+                values["session_start_id"] = self._latest_session_start_id(
+                    session, tracker.sender_id
+                )
+                values["session_start_index"] = (
+                    conversation_session.number_of_events + session_starts[-1]
+                )
+
+            if sa.inspect(conversation_session).persistent:
+                # increment the number of events in the database instead of
+                # overwriting it with the number which was read before
+                session.execute(
+                    sa.update(self.SQLConversationSession)
+                    .where(self.SQLConversationSession.sender_id == tracker.sender_id)
+                    .values(
+                        number_of_events=self.SQLConversationSession.number_of_events
+                        + len(new_events),
+                        **values,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                for key, value in values.items():
+                    setattr(conversation_session, key, value)
+                conversation_session.number_of_events += len(new_events)
+                session.add(conversation_session)
+            version = self._query_latest_event_id(session, tracker.sender_id)
+            session.commit()
+
+            return new_events, version
+
+    def _latest_session_start_id(
+        self, session: "Session", sender_id: Text
+    ) -> Optional[int]:
+        return (
+            session.query(sa.func.max(self.SQLEvent.id))
+            .filter(
+                self.SQLEvent.sender_id == sender_id,
+                self.SQLEvent.type_name == SessionStarted.type_name,
+            )
+            .scalar()
+        )
+
+    def _conversation_session(
+        self, session: "Session", sender_id: Text
+    ) -> "AsyncSQLTrackerStore.SQLConversationSession":
+        """Returns the pointer to the latest session of a conversation.
+
+        If there is no pointer yet (e.g. because the events were stored by the
+        `SQLTrackerStore`), it is created from the stored events.
+
+        Args:
+            session: Current database session.
+            sender_id: The conversation ID.
+
+        Returns:
+            The pointer to the latest conversation session.
+        """
+        # the pointer is locked until the end of the transaction so that concurrent
+        # saves of the same conversation don't store the same events
+        conversation_session = session.get(
+            self.SQLConversationSession, sender_id, with_for_update=True
+        )
+        if conversation_session is not None:
+            return conversation_session
+
+        conversation_session = self.SQLConversationSession(
+            sender_id=sender_id,
+            number_of_events=session.query(sa.func.count(self.SQLEvent.id))
+            .filter(self.SQLEvent.sender_id == sender_id)
+            .scalar(),
+        )
+        if not conversation_session.number_of_events:
+            return conversation_session
+
+        session_start_id = self._latest_session_start_id(session, sender_id)
+        if session_start_id is not None:
+            conversation_session.session_start_id = session_start_id
+            conversation_session.session_start_index = (
+                session.query(sa.func.count(self.SQLEvent.id))
+                .filter(
+                    self.SQLEvent.sender_id == sender_id,
+                    self.SQLEvent.id < session_start_id,
+                )
+                .scalar()
+            )
+
+        (
+            conversation_session.last_event_type,
+            conversation_session.last_event_timestamp,
+        ) = (
+            session.query(self.SQLEvent.type_name, self.SQLEvent.timestamp)
+            .filter(self.SQLEvent.sender_id == sender_id)
+            .order_by(self.SQLEvent.id.desc())
+            .first()
+        )
+
+        return conversation_session
+
+    @staticmethod
+    def _number_of_stored_events(
+        tracker: DialogueStateTracker,
+        conversation_session: "AsyncSQLTrackerStore.SQLConversationSession",
+    ) -> int:
+        """Returns how many events of `tracker` are already stored.
+
+        The tracker starts with the stored events of the latest session (see
+        `retrieve`), of all sessions (see `retrieve_full_tracker`) or of any
+        session in between, followed by the new events. Hence, one of the
+        `SessionStarted` events of the tracker is the start of the latest stored
+        session.
+
+        Args:
+            tracker: The tracker to save.
+            conversation_session: The pointer to the latest stored session.
+
+        Returns:
+            The number of events at the start of the tracker which are stored.
+        """
+        number_of_events = conversation_session.number_of_events
+        if not number_of_events:
+            return 0
+
+        session_start_index = conversation_session.session_start_index
+        if session_start_index is None:
+            return number_of_events
+
+        number_of_session_events = number_of_events - session_start_index
+        tracker_session_starts = [
+            index
+            for index, event in enumerate(tracker.events)
+            if isinstance(event, SessionStarted)
+        ]
+        for tracker_session_start in reversed(tracker_session_starts):
+            number_of_stored_events = tracker_session_start + number_of_session_events
+            if number_of_stored_events > len(tracker.events):
+                continue
+
+            last_stored_event = tracker.events[number_of_stored_events - 1]
+            if (
+                last_stored_event.type_name == conversation_session.last_event_type
+                and last_stored_event.timestamp
+                == conversation_session.last_event_timestamp
+            ):
+                return number_of_stored_events
+
+        logger.debug(
+            f"Tracker for conversation ID '{tracker.sender_id}' diverged from the "
+            f"stored events. Inserting the events after the latest stored session."
+        )
+        return number_of_session_events
+
 
 class FailSafeTrackerStore(TrackerStore):
     """Tracker store wrapper.
@@ -1486,6 +2507,150 @@ class FailSafeTrackerStore(TrackerStore):
             )
 
 
+class _CachedTracker(NamedTuple):
+    """A tracker which was saved by a `CachedTrackerStore`."""
+
+    tracker: DialogueStateTracker
+    number_of_events: int
+    last_event: Optional[Event]
+    version: Optional[Text]
+
+
+class CachedTrackerStore(TrackerStore):
+    """Tracker store wrapper which keeps recently saved trackers in memory.
+
+    Saved trackers are written to the wrapped tracker store and kept in a
+    least-recently-used cache. If the next turn of a conversation is handled by
+    the same process, the tracker is taken from the cache instead of being
+    retrieved and deserialised again. A cached tracker is only used if its events
+    didn't change since it was saved and the version of the stored tracker (see
+    `TrackerStore.tracker_version`) is still the one which `TrackerStore.save`
+    returned. If the wrapped tracker store can't provide versions, cached trackers
+    are only valid as long as no other process handles the same conversation (e.g.
+    with sticky sessions).
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        max_cached_trackers: int = DEFAULT_TRACKER_CACHE_SIZE,
+    ) -> None:
+        """Create a `CachedTrackerStore`.
+
+        Args:
+            tracker_store: The wrapped tracker store.
+            max_cached_trackers: Maximum number of trackers to keep in memory.
+        """
+        if max_cached_trackers < 1:
+            raise RasaException(
+                f"The tracker cache size has to be at least 1, "
+                f"but was {max_cached_trackers}."
+            )
+
+        self._tracker_store = tracker_store
+        self.max_cached_trackers = max_cached_trackers
+        self._cache: OrderedDict[Text, _CachedTracker] = OrderedDict()
+
+        super().__init__(
+            tracker_store.domain,
+            tracker_store.event_broker,
+            compact_events=tracker_store.compact_events,
+        )
+
+    @property
+    def domain(self) -> Domain:
+        """Returns the domain of the wrapped tracker store."""
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        self._tracker_store.domain = domain or Domain.empty()
+        # cached trackers might contain slots of the previous domain
+        self._cache.clear()
+
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        """Saves the tracker to the wrapped tracker store and caches it."""
+        self._cache.pop(tracker.sender_id, None)
+        version = await self._tracker_store.save(tracker)
+
+        if self._contains_several_sessions(tracker):
+            # the wrapped tracker store would only return the latest session
+            return version
+
+        if (
+            version is None
+            and await self._tracker_store.tracker_version(tracker.sender_id) is not None
+        ):
+            # The version has to be the one which was written by this save. Reading
+            # it afterwards could return the version of another server's save.
+            return version
+
+        self._cache[tracker.sender_id] = _CachedTracker(
+            tracker,
+            len(tracker.events),
+            tracker.events[-1] if tracker.events else None,
+            version,
+        )
+        while len(self._cache) > self.max_cached_trackers:
+            self._cache.popitem(last=False)
+
+        return version
+
+    @staticmethod
+    def _contains_several_sessions(tracker: DialogueStateTracker) -> bool:
+        return any(
+            isinstance(event, ActionExecuted)
+            and event.action_name == ACTION_SESSION_START_NAME
+            for event in itertools.islice(tracker.events, 1, None)
+        )
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Returns the cached tracker if it's up to date.
+
+        The tracker is removed from the cache as the caller might modify it. It's
+        added again when it's saved.
+        """
+        cached = self._cache.pop(sender_id, None)
+        if cached is not None and await self._is_up_to_date(sender_id, cached):
+            logger.debug(f"Using cached tracker for conversation ID '{sender_id}'.")
+            return cached.tracker
+
+        return await self._tracker_store.retrieve(sender_id)
+
+    async def _is_up_to_date(self, sender_id: Text, cached: _CachedTracker) -> bool:
+        tracker = cached.tracker
+        if len(tracker.events) != cached.number_of_events or (
+            tracker.events and tracker.events[-1] is not cached.last_event
+        ):
+            # the tracker was modified after it was saved
+            return False
+
+        if cached.version is None:
+            return True
+
+        return await self._tracker_store.tracker_version(sender_id) == cached.version
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Calls `retrieve_full_tracker` method of the wrapped tracker store."""
+        return await self._tracker_store.retrieve_full_tracker(conversation_id)
+
+    async def exists(self, conversation_id: Text) -> bool:
+        """Checks if a tracker exists for the specified ID."""
+        return conversation_id in self._cache or await self._tracker_store.exists(
+            conversation_id
+        )
+
+    async def keys(self) -> Iterable[Text]:
+        """Calls `keys` method of the wrapped tracker store."""
+        return await self._tracker_store.keys()
+
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        """Calls `tracker_version` method of the wrapped tracker store."""
+        return await self._tracker_store.tracker_version(sender_id)
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
     domain: Optional[Domain] = None,
@@ -1504,6 +2669,13 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "async_redis":
+        tracker_store = AsyncRedisTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "mongod":
         tracker_store = MongoTrackerStore(
             domain=domain,
@@ -1518,10 +2690,21 @@ def _create_from_endpoint_config(
             event_broker=event_broker,
             **endpoint_config.kwargs,
         )
+    elif endpoint_config.type.lower() == "async_sql":
+        tracker_store = AsyncSQLTrackerStore(
+            domain=domain,
+            host=endpoint_config.url,
+            event_broker=event_broker,
+            **endpoint_config.kwargs,
+        )
     elif endpoint_config.type.lower() == "dynamo":
         tracker_store = DynamoTrackerStore(
             domain=domain, event_broker=event_broker, **endpoint_config.kwargs
         )
+    elif endpoint_config.type.lower() == "dynamo_sessions":
+        tracker_store = SessionDynamoTrackerStore(
+            domain=domain, event_broker=event_broker, **endpoint_config.kwargs
+        )
     else:
         tracker_store = _load_from_module_name_in_endpoint_config(
             domain, endpoint_config, event_broker
@@ -1582,6 +2765,11 @@ def create_tracker_store(
         )
         tracker_store = AwaitableTrackerStore(tracker_store)
 
+    if endpoint_config and endpoint_config.kwargs.get(TRACKER_CACHE_SIZE):
+        tracker_store = CachedTrackerStore(
+            tracker_store, int(endpoint_config.kwargs[TRACKER_CACHE_SIZE])
+        )
+
     return tracker_store
 
 
@@ -1643,10 +2831,13 @@ class AwaitableTrackerStore(TrackerStore):
         result = self._tracker_store.keys()
         return await result if isawaitable(result) else result
 
-    async def save(self, tracker: DialogueStateTracker) -> None:
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
         """Wrapper to call `save` method of primary tracker store."""
         result = self._tracker_store.save(tracker)
-        return await result if isawaitable(result) else result
+        if isawaitable(result):
+            return await result
+        # tracker stores which don't implement the interface might save synchronously
+        return cast(Optional[Text], result)
 
     async def retrieve_full_tracker(
         self, conversation_id: Text
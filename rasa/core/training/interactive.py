@@ -1593,13 +1593,15 @@ def _serve_application(
 
     async def run_interactive_io(running_app: Sanic) -> None:
         """Small wrapper to shut down the server once cmd io is done."""
-
-        await record_messages(
-            endpoint=endpoint,
-            file_importer=file_importer,
-            skip_visualization=skip_visualization,
-            conversation_id=conversation_id,
-        )
+        try:
+            await record_messages(
+                endpoint=endpoint,
+                file_importer=file_importer,
+                skip_visualization=skip_visualization,
+                conversation_id=conversation_id,
+            )
+        finally:
+            await endpoint.close()
 
         logger.info("Killing Sanic server now.")
 
@@ -1685,6 +1687,7 @@ def run_interactive_learning(
         partial(run.load_agent_on_start, server_args.get("model"), endpoints, None),
         "before_server_start",
     )
+    app.register_listener(run.close_resources, "after_server_stop")
 
     telemetry.track_interactive_learning_start(skip_visualization, SAVE_IN_E2E)
 
@@ -35,6 +35,10 @@ CACHE_LOCATION_ENV = "RASA_CACHE_DIRECTORY"
 CACHE_DB_NAME_ENV = "RASA_CACHE_NAME"
 CACHE_SIZE_ENV = "RASA_MAX_CACHE_SIZE"
 
+# Prefix of the directories which store cached results. Only directories with this
+# prefix are removed from the cache directory if the cache database doesn't know them.
+CACHED_RESULT_DIRECTORY_PREFIX = "rasa-cached-result-"
+
 
 class TrainingCache(abc.ABC):
     """Stores training results in a persistent cache.
@@ -158,10 +162,11 @@ class LocalTrainingCache(TrainingCache):
 
         fingerprint_key = sa.Column(sa.String(), primary_key=True)
         output_fingerprint_key = sa.Column(sa.String(), nullable=False, index=True)
-        last_used = sa.Column(sa.DateTime(timezone=True), nullable=False)
+        last_used = sa.Column(sa.DateTime(timezone=True), nullable=False, index=True)
         rasa_version = sa.Column(sa.String(255), nullable=False)
         result_location = sa.Column(sa.String())
         result_type = sa.Column(sa.String())
+        result_size_in_mb = sa.Column(sa.Float())
 
     def __init__(self) -> None:
         """Creates cache.
@@ -206,9 +211,34 @@ class LocalTrainingCache(TrainingCache):
             URL.create(drivername="sqlite", database=database), future=True
         )
         self.Base.metadata.create_all(engine)
+        self._migrate_database(engine)
 
         return sa.orm.sessionmaker(engine)
 
+    def _migrate_database(self, engine: sa.engine.Engine) -> None:
+        """Adds the result sizes to caches which were created by older versions."""
+        columns = {
+            column["name"]
+            for column in sa.inspect(engine).get_columns(self.CacheEntry.__tablename__)
+        }
+        if "result_size_in_mb" in columns:
+            return
+
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    f"ALTER TABLE {self.CacheEntry.__tablename__} "
+                    "ADD COLUMN result_size_in_mb FLOAT"
+                )
+            )
+        for index in self.CacheEntry.__table__.indexes:
+            index.create(engine, checkfirst=True)
+
+        with sa.orm.Session(engine) as session, session.begin():
+            entries = session.execute(sa.select(self.CacheEntry)).scalars().all()
+            for entry in entries:
+                entry.result_size_in_mb = self._result_size_in_mb(entry)
+
     def _drop_cache_entries_from_incompatible_versions(self) -> None:
         incompatible_entries = self._find_incompatible_cache_entries()
 
@@ -249,11 +279,40 @@ class LocalTrainingCache(TrainingCache):
             )
             session.execute(delete_query)
 
+    def _drop_untracked_results(self, session: sa.orm.Session) -> None:
+        """Deletes cached results which the cache database doesn't know.
+
+        These are e.g. left over from interrupted trainings. The cache size is computed
+        from the database, hence they would otherwise never be evicted. Other files in
+        the cache directory are never touched.
+        """
+        tracked_locations = {
+            Path(location).name
+            for location in session.execute(
+                sa.select(self.CacheEntry.result_location).where(
+                    self.CacheEntry.result_location != sa.null()
+                )
+            ).scalars()
+        }
+
+        for item in self._cache_location.glob(f"{CACHED_RESULT_DIRECTORY_PREFIX}*"):
+            if item.name in tracked_locations or not item.is_dir():
+                continue
+
+            logger.debug(f"Deleting '{item}' from the cache as it's not tracked.")
+            shutil.rmtree(item)
+
     @staticmethod
     def _delete_cached_result(entry: LocalTrainingCache.CacheEntry) -> None:
         if entry.result_location and Path(entry.result_location).is_dir():
             shutil.rmtree(entry.result_location)
 
+    @staticmethod
+    def _result_size_in_mb(entry: LocalTrainingCache.CacheEntry) -> float:
+        if entry.result_location and Path(entry.result_location).is_dir():
+            return rasa.utils.common.directory_size_in_mb(Path(entry.result_location))
+        return 0.0
+
     def cache_output(
         self,
         fingerprint_key: Text,
@@ -265,13 +324,15 @@ class LocalTrainingCache(TrainingCache):
         if self._is_disabled():
             return
 
-        cache_dir, output_type = None, None
+        cache_dir, output_type, output_size = None, None, 0.0
         if isinstance(output, Cacheable):
-            cache_dir, output_type = self._cache_output_to_disk(output, model_storage)
+            cache_dir, output_type, output_size = self._cache_output_to_disk(
+                output, model_storage
+            )
 
         try:
             self._add_cache_entry(
-                cache_dir, fingerprint_key, output_fingerprint, output_type
+                cache_dir, fingerprint_key, output_fingerprint, output_type, output_size
             )
         except OperationalError:
             if cache_dir:
@@ -285,8 +346,14 @@ class LocalTrainingCache(TrainingCache):
         fingerprint_key: Text,
         output_fingerprint: Text,
         output_type: Text,
+        output_size: float = 0.0,
     ) -> None:
         with self._sessionmaker.begin() as session:
+            replaced_entry = session.get(self.CacheEntry, fingerprint_key)
+            if replaced_entry and replaced_entry.result_location != cache_dir:
+                # the replaced result can't be found anymore
+                self._delete_cached_result(replaced_entry)
+
             cache_entry = self.CacheEntry(
                 fingerprint_key=fingerprint_key,
                 output_fingerprint_key=output_fingerprint,
@@ -294,6 +361,7 @@ class LocalTrainingCache(TrainingCache):
                 rasa_version=rasa.__version__,
                 result_location=cache_dir,
                 result_type=output_type,
+                result_size_in_mb=output_size,
             )
             session.merge(cache_entry)
 
@@ -302,8 +370,10 @@ class LocalTrainingCache(TrainingCache):
 
     def _cache_output_to_disk(
         self, output: Cacheable, model_storage: ModelStorage
-    ) -> Tuple[Optional[Text], Optional[Text]]:
-        tempdir_name = rasa.utils.common.get_temp_dir_name()
+    ) -> Tuple[Optional[Text], Optional[Text], float]:
+        tempdir_name = rasa.utils.common.get_temp_dir_name(
+            prefix=CACHED_RESULT_DIRECTORY_PREFIX
+        )
 
         # Use `TempDirectoryPath` instead of `tempfile.TemporaryDirectory` as this
         # leads to errors on Windows when the context manager tries to delete an
@@ -322,7 +392,7 @@ class LocalTrainingCache(TrainingCache):
                     f"Caching output of type '{type(output).__name__}' failed with the "
                     f"following error:\n{e}"
                 )
-                return None, None
+                return None, None, 0.0
 
             output_size = rasa.utils.common.directory_size_in_mb(tmp_path)
             if output_size > self._max_cache_size:
@@ -331,56 +401,64 @@ class LocalTrainingCache(TrainingCache):
                     f"because it exceeds the maximum cache size of "
                     f"{self._max_cache_size} MiB."
                 )
-                return None, None
+                return None, None, 0.0
 
-            while (
-                rasa.utils.common.directory_size_in_mb(
-                    self._cache_location,
-                    filenames_to_exclude=[self._cache_database_name],
-                )
-                + output_size
-                > self._max_cache_size
-            ):
-                self._drop_least_recently_used_item()
+            self._drop_least_recently_used_items(output_size)
 
             output_type = rasa.shared.utils.common.module_path_from_instance(output)
             cache_path = shutil.move(temp_dir, self._cache_location)
 
-            return cache_path, output_type
+            return cache_path, output_type, output_size
 
-    def _drop_least_recently_used_item(self) -> None:
-        with self._sessionmaker.begin() as session:
-            query_for_least_recently_used_entry = sa.select(self.CacheEntry).order_by(
-                self.CacheEntry.last_used.asc()
-            )
-            oldest_cache_item = (
-                session.execute(query_for_least_recently_used_entry).scalars().first()
-            )
+    def _current_cache_size_in_mb(self, session: sa.orm.Session) -> float:
+        """Returns the size of all cached results according to the cache database.
+
+        The size is read from the database every time so that results which were
+        added or removed by other processes using the same cache are accounted for.
+        """
+        query_for_cache_size = sa.select(
+            sa.func.coalesce(sa.func.sum(self.CacheEntry.result_size_in_mb), 0.0)
+        )
+        return session.execute(query_for_cache_size).scalar()
 
-            if not oldest_cache_item:
-                self._purge_cache_dir_content()
+    def _drop_least_recently_used_items(self, required_size_in_mb: float) -> None:
+        """Deletes the least recently used items until the required space is free.
+
+        Args:
+            required_size_in_mb: The size of the item which should fit into the cache.
+        """
+        with self._sessionmaker.begin() as session:
+            cache_size_in_mb = self._current_cache_size_in_mb(session)
+            if cache_size_in_mb + required_size_in_mb <= self._max_cache_size:
                 return
 
-            self._delete_cached_result(oldest_cache_item)
-            delete_query = sa.delete(self.CacheEntry).where(
-                self.CacheEntry.fingerprint_key == oldest_cache_item.fingerprint_key
-            )
-            session.execute(delete_query)
+            self._drop_untracked_results(session)
 
-            logger.debug(
-                f"Deleted item with fingerprint "
-                f"'{oldest_cache_item.fingerprint_key}' to free space."
+            query_for_least_recently_used_entries = sa.select(self.CacheEntry).order_by(
+                self.CacheEntry.last_used.asc()
             )
 
-    def _purge_cache_dir_content(self) -> None:
-        for item in self._cache_location.glob("*"):
-            if item.name == self._cache_database_name:
-                continue
+            dropped_fingerprint_keys = []
+            for entry in session.execute(
+                query_for_least_recently_used_entries
+            ).scalars():
+                if cache_size_in_mb + required_size_in_mb <= self._max_cache_size:
+                    break
 
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
+                self._delete_cached_result(entry)
+                cache_size_in_mb -= entry.result_size_in_mb or 0.0
+                dropped_fingerprint_keys.append(entry.fingerprint_key)
+
+                logger.debug(
+                    f"Deleted item with fingerprint '{entry.fingerprint_key}' to free "
+                    f"space."
+                )
+
+            if dropped_fingerprint_keys:
+                delete_query = sa.delete(self.CacheEntry).where(
+                    self.CacheEntry.fingerprint_key.in_(dropped_fingerprint_keys)
+                )
+                session.execute(delete_query)
 
     def get_cached_output_fingerprint(self, fingerprint_key: Text) -> Optional[Text]:
         """Returns cached output fingerprint (see parent class for full docstring)."""
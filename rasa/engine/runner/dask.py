@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Text
-
-import dask
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Text, Tuple
 
 from rasa.engine.exceptions import GraphRunError
 from rasa.engine.graph import ExecutionContext, GraphNode, GraphNodeHook, GraphSchema
@@ -13,8 +11,21 @@ from rasa.engine.storage.storage import ModelStorage
 logger = logging.getLogger(__name__)
 
 
+class _ExecutionStep(NamedTuple):
+    """A node of a compiled execution plan."""
+
+    node_name: Text
+    node: GraphNode
+    dependencies: Tuple[Text, ...]
+
+
 class DaskGraphRunner(GraphRunner):
-    """Dask implementation of a `GraphRunner`."""
+    """Runs a `GraphSchema` in-process.
+
+    The nodes which are needed for a set of targets are resolved once into an
+    execution plan (the nodes in topological order with their inputs wired up).
+    Subsequent runs with the same targets execute the cached plan directly.
+    """
 
     def __init__(
         self,
@@ -38,6 +49,9 @@ class DaskGraphRunner(GraphRunner):
             graph_schema, model_storage, execution_context, hooks
         )
         self._execution_context: ExecutionContext = execution_context
+        self._execution_plans: Dict[
+            Tuple[Tuple[Text, ...], FrozenSet[Text]], List[_ExecutionStep]
+        ] = {}
 
     @classmethod
     def create(
@@ -64,20 +78,57 @@ class DaskGraphRunner(GraphRunner):
             for node_name, schema_node in graph_schema.nodes.items()
         }
 
-    def _build_dask_graph(self, schema: GraphSchema) -> Dict[Text, Any]:
-        """Builds a dask graph from the instantiated graph.
+    def _compile_execution_plan(
+        self, targets: Tuple[Text, ...], overridden_nodes: FrozenSet[Text]
+    ) -> List[_ExecutionStep]:
+        """Resolves the nodes which are needed to compute `targets`.
 
-        For more information about dask graphs
-        see: https://docs.dask.org/en/latest/spec.html
+        Args:
+            targets: Nodes whose output is needed.
+            overridden_nodes: Nodes whose output is provided as input to the run.
+
+        Returns:
+            The needed nodes in topological order together with the names of the
+            nodes which provide their inputs.
         """
-        run_graph = {
-            node_name: (
-                self._instantiated_nodes[node_name],
-                *schema_node.needs.values(),
+        plan: List[_ExecutionStep] = []
+        visited: Set[Text] = set()
+
+        def visit(node_name: Text) -> None:
+            if node_name in visited:
+                return
+            visited.add(node_name)
+
+            schema_node = self._graph_schema.nodes.get(node_name)
+            # Input placeholders and overridden nodes are provided with the inputs.
+            if schema_node is None or node_name in overridden_nodes:
+                return
+
+            for dependency in schema_node.needs.values():
+                visit(dependency)
+
+            plan.append(
+                _ExecutionStep(
+                    node_name,
+                    self._instantiated_nodes[node_name],
+                    tuple(schema_node.needs.values()),
+                )
             )
-            for node_name, schema_node in schema.nodes.items()
-        }
-        return run_graph
+
+        for target in targets:
+            visit(target)
+
+        return plan
+
+    def _get_execution_plan(
+        self, targets: Tuple[Text, ...], overridden_nodes: FrozenSet[Text]
+    ) -> List[_ExecutionStep]:
+        plan_key = (targets, overridden_nodes)
+        plan = self._execution_plans.get(plan_key)
+        if plan is None:
+            plan = self._compile_execution_plan(targets, overridden_nodes)
+            self._execution_plans[plan_key] = plan
+        return plan
 
     def run(
         self,
@@ -85,34 +136,49 @@ class DaskGraphRunner(GraphRunner):
         targets: Optional[List[Text]] = None,
     ) -> Dict[Text, Any]:
         """Runs the graph (see parent class for full docstring)."""
-        run_targets = targets if targets else self._graph_schema.target_names
-        minimal_schema = self._graph_schema.minimal_graph_schema(run_targets)
-        run_graph = self._build_dask_graph(minimal_schema)
+        run_targets = tuple(targets if targets else self._graph_schema.target_names)
+        inputs = inputs or {}
 
-        if inputs:
-            self._add_inputs_to_graph(inputs, run_graph)
-
-        logger.debug(
-            f"Running graph with inputs: {inputs}, targets: {targets} "
-            f"and {self._execution_context}."
+        overridden_nodes = frozenset(
+            input_name
+            for input_name in inputs.keys()
+            if input_name in self._graph_schema.nodes
         )
+        plan = self._get_execution_plan(run_targets, overridden_nodes)
+        self._validate_inputs(inputs, plan)
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Running graph with inputs: {inputs}, targets: {targets} "
+                f"and {self._execution_context}."
+            )
+
+        # Every node outputs a tuple of its name and its actual output.
+        node_outputs: Dict[Text, Any] = {
+            input_name: (input_name, input_value)
+            for input_name, input_value in inputs.items()
+        }
         try:
-            dask_result = dask.get(run_graph, run_targets)
-            return dict(dask_result)
+            for node_name, node, dependencies in plan:
+                # Dependencies which couldn't be resolved are passed by name so that
+                # the `GraphNode` can report them.
+                node_outputs[node_name] = node(
+                    *(
+                        node_outputs.get(dependency, dependency)
+                        for dependency in dependencies
+                    )
+                )
+            return dict(node_outputs[target] for target in run_targets)
         except RuntimeError as e:
             raise GraphRunError("Error running runner.") from e
 
     @staticmethod
-    def _add_inputs_to_graph(inputs: Optional[Dict[Text, Any]], graph: Any) -> None:
-        if inputs is None:
-            return
-
-        for input_name, input_value in inputs.items():
-            if isinstance(input_value, str) and input_value in graph.keys():
+    def _validate_inputs(inputs: Dict[Text, Any], plan: List[_ExecutionStep]) -> None:
+        node_names = {step.node_name for step in plan}.union(inputs.keys())
+        for input_value in inputs.values():
+            if isinstance(input_value, str) and input_value in node_names:
                 raise GraphRunError(
                     f"Input value '{input_value}' clashes with a node name. Make sure "
                     f"that none of the input names passed to the `run` method are the "
                     f"same as node names in the graph schema."
                 )
-            graph[input_name] = (input_name, input_value)
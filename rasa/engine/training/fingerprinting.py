@@ -1,3 +1,4 @@
+import functools
 import inspect
 import logging
 from typing import Any, Dict, Text, Type
@@ -36,18 +37,14 @@ def calculate_fingerprint_key(
     Returns:
         The fingerprint key.
     """
-    dependency_versions = {
-        package: pkg_resources.get_distribution(
-            import_name_to_package_map.get(package, package)
-        ).version
-        for package in graph_component_class.required_packages()
-    }
     fingerprint_data = {
         "node_name": rasa.utils.common.module_path_from_class(graph_component_class),
-        "component_implementation": inspect.getsource(graph_component_class),
+        "component_implementation": _component_implementation_fingerprint(
+            graph_component_class
+        ),
         "config": config,
         "inputs": inputs,
-        "dependency_versions": dependency_versions,
+        "dependency_versions": _dependency_versions(graph_component_class),
     }
 
     fingerprint_addon = graph_component_class.fingerprint_addon(config)
@@ -62,3 +59,24 @@ def calculate_fingerprint_key(
     )
 
     return fingerprint_key
+
+
+@functools.lru_cache(maxsize=None)
+def _component_implementation_fingerprint(
+    graph_component_class: Type[GraphComponent],
+) -> Text:
+    # Reading the source code is slow and the source of loaded classes doesn't change
+    # during the lifetime of a process.
+    return rasa.shared.utils.io.get_text_hash(inspect.getsource(graph_component_class))
+
+
+@functools.lru_cache(maxsize=None)
+def _dependency_versions(
+    graph_component_class: Type[GraphComponent],
+) -> Dict[Text, Text]:
+    return {
+        package: pkg_resources.get_distribution(
+            import_name_to_package_map.get(package, package)
+        ).version
+        for package in graph_component_class.required_packages()
+    }
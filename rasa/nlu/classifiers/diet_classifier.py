@@ -117,6 +117,9 @@ LABEL_SUB_KEY = IDS
 
 POSSIBLE_TAGS = [ENTITY_ATTRIBUTE_TYPE, ENTITY_ATTRIBUTE_ROLE, ENTITY_ATTRIBUTE_GROUP]
 
+# maximum number of messages which are predicted with a single model call
+PREDICTION_BATCH_SIZE = 64
+
 
 DIETClassifierT = TypeVar("DIETClassifierT", bound="DIETClassifier")
 
@@ -971,6 +974,55 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
             return None
         return self.model.run_inference(model_data)
 
+    def _predict_messages(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]]:
+        """Predicts several messages with as few model calls as possible.
+
+        Only messages whose features have the same shape are predicted together.
+        No padding is needed for them, so the predictions are the same as if every
+        message was predicted on its own.
+        """
+        if (
+            self.model is None
+            or len(messages) <= 1
+            or self._execution_context.should_add_diagnostic_data
+        ):
+            return [self._predict(message) for message in messages]
+
+        messages_by_feature_shapes: Dict[Tuple, List[int]] = defaultdict(list)
+        for index, message in enumerate(messages):
+            messages_by_feature_shapes[self._feature_shapes(message)].append(index)
+
+        predictions: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+        for indices in messages_by_feature_shapes.values():
+            for start in range(0, len(indices), PREDICTION_BATCH_SIZE):
+                batch = indices[start : start + PREDICTION_BATCH_SIZE]
+                model_data = self._create_model_data(
+                    [messages[index] for index in batch], training=False
+                )
+                if model_data.is_empty():
+                    continue
+
+                out = self.model.run_inference(model_data, batch_size=len(batch))
+                for position, index in enumerate(batch):
+                    # the diagnostic data (a dictionary) isn't split per message
+                    predictions[index] = {
+                        key: value[position : position + 1]
+                        for key, value in out.items()
+                        if key != DIAGNOSTIC_DATA and isinstance(value, np.ndarray)
+                    }
+
+        return predictions
+
+    def _feature_shapes(self, message: Message) -> Tuple:
+        featurizers = self.component_config[FEATURIZERS]
+        return tuple(
+            features.features.shape if features is not None else None
+            for features in message.get_sparse_features(TEXT, featurizers)
+            + message.get_dense_features(TEXT, featurizers)
+        )
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -1039,9 +1091,7 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Augments the message with intents, entities, and diagnostic data."""
-        for message in messages:
-            out = self._predict(message)
-
+        for message, out in zip(messages, self._predict_messages(messages)):
             if self.component_config[INTENT_CLASSIFICATION]:
                 label, label_ranking = self._predict_label(out)
 
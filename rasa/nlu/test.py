@@ -1,5 +1,7 @@
+import asyncio
 import copy
 import itertools
+import multiprocessing
 import os
 import logging
 import structlog
@@ -7,8 +9,10 @@ from pathlib import Path
 
 import numpy as np
 from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 from typing import (
+    AsyncIterator,
     Iterable,
     Iterator,
     Tuple,
@@ -28,13 +32,22 @@ from rasa.core.agent import Agent
 from rasa.core.channels import UserMessage
 from rasa.core.processor import MessageProcessor
 from rasa.plugin import plugin_manager
+from rasa.shared.exceptions import RasaException
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils.common import TempDirectoryPath, get_temp_dir_name
 import rasa.shared.utils.io
 import rasa.utils.plotting as plot_utils
 import rasa.utils.io as io_utils
 
-from rasa.constants import TEST_DATA_FILE, TRAIN_DATA_FILE, NLG_DATA_FILE
+from rasa.constants import (
+    ENV_CPU_INTER_OP_CONFIG,
+    ENV_CPU_INTRA_OP_CONFIG,
+    NLG_DATA_FILE,
+    TEST_DATA_FILE,
+    TRAIN_DATA_FILE,
+)
 import rasa.nlu.classifiers.fallback_classifier
 from rasa.nlu.constants import (
     RESPONSE_SELECTOR_DEFAULT_INTENT,
@@ -85,6 +98,9 @@ ENTITY_PROCESSORS = {"EntitySynonymMapper", "ResponseSelector"}
 
 EXTRACTORS_WITH_CONFIDENCES = {"CRFEntityExtractor", "DIETClassifier"}
 
+# number of test examples which are parsed with a single run of the model
+DEFAULT_EVALUATION_BATCH_SIZE = 128
+
 
 class CVEvaluationResult(NamedTuple):
     """Stores NLU cross-validation results."""
@@ -112,6 +128,14 @@ EntityEvaluationResult = namedtuple(
 IntentMetrics = Dict[Text, List[float]]
 EntityMetrics = Dict[Text, Dict[Text, List[float]]]
 ResponseSelectionMetrics = Dict[Text, List[float]]
+FoldResult = Tuple[
+    IntentMetrics,
+    EntityMetrics,
+    ResponseSelectionMetrics,
+    List[IntentEvaluationResult],
+    List[EntityEvaluationResult],
+    List[ResponseSelectionEvaluationResult],
+]
 
 
 def log_evaluation_table(
@@ -1251,7 +1275,9 @@ def align_all_entity_predictions(
 
 
 async def get_eval_data(
-    processor: MessageProcessor, test_data: TrainingData
+    processor: MessageProcessor,
+    test_data: TrainingData,
+    batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
 ) -> Tuple[
     List[IntentEvaluationResult],
     List[ResponseSelectionEvaluationResult],
@@ -1267,6 +1293,7 @@ async def get_eval_data(
     Args:
         processor: the processor
         test_data: test data
+        batch_size: number of test examples which are parsed together
 
     Returns: intent, response, and entity evaluation results
     """
@@ -1284,21 +1311,9 @@ async def get_eval_data(
     should_eval_response_selection = len(response_labels) >= 2
     should_eval_entities = len(test_data.entity_examples) > 0
 
-    for example in tqdm(test_data.nlu_examples):
-        tracker = plugin_manager().hook.mock_tracker_for_evaluation(
-            example=example, model_metadata=processor.model_metadata
-        )
-        # if the user overwrites the default implementation take the last tracker
-        if isinstance(tracker, list):
-            if len(tracker) > 0:
-                tracker = tracker[-1]
-            else:
-                tracker = None
-        result = await processor.parse_message(
-            UserMessage(text=example.get(TEXT)),
-            tracker=tracker,
-            only_output_properties=False,
-        )
+    for example, result in await _parse_test_examples(
+        processor, test_data.nlu_examples, batch_size
+    ):
         _remove_entities_of_extractors(result, PRETRAINED_EXTRACTORS)
         if should_eval_intents:
             if fallback_classifier.is_fallback_classifier_prediction(result):
@@ -1360,6 +1375,48 @@ async def get_eval_data(
     return intent_results, response_selection_results, entity_results
 
 
+async def _parse_test_examples(
+    processor: MessageProcessor, examples: List[Message], batch_size: int
+) -> List[Tuple[Message, Dict[Text, Any]]]:
+    """Parses the test examples in batches.
+
+    Args:
+        processor: the processor
+        examples: test examples
+        batch_size: number of test examples which are parsed together
+
+    Returns: the test examples and their parse results
+    """
+    results: List[Tuple[Message, Dict[Text, Any]]] = []
+    with tqdm(total=len(examples)) as progress_bar:
+        for start in range(0, len(examples), batch_size):
+            batch = examples[start : start + batch_size]
+            parse_results = await processor.parse_messages(
+                [UserMessage(text=example.get(TEXT)) for example in batch],
+                trackers=[_mock_tracker_for_evaluation(processor, e) for e in batch],
+                only_output_properties=False,
+            )
+            results.extend(zip(batch, parse_results))
+            progress_bar.update(len(batch))
+
+    return results
+
+
+def _mock_tracker_for_evaluation(
+    processor: MessageProcessor, example: Message
+) -> Optional[DialogueStateTracker]:
+    tracker = plugin_manager().hook.mock_tracker_for_evaluation(
+        example=example, model_metadata=processor.model_metadata
+    )
+    # if the user overwrites the default implementation take the last tracker
+    if isinstance(tracker, list):
+        if len(tracker) > 0:
+            tracker = tracker[-1]
+        else:
+            tracker = None
+    return tracker
+
+
 def _get_active_entity_extractors(
     entity_results: List[EntityEvaluationResult],
 ) -> Set[Text]:
@@ -1545,6 +1602,57 @@ async def combine_result(
         current_response_selection_results,
     ) = await compute_metrics(processor, data)
 
+    return _combine_fold_result(
+        intent_metrics,
+        entity_metrics,
+        response_selection_metrics,
+        (
+            intent_current_metrics,
+            entity_current_metrics,
+            response_selection_current_metrics,
+            current_intent_results,
+            current_entity_results,
+            current_response_selection_results,
+        ),
+        intent_results,
+        entity_results,
+        response_selection_results,
+    )
+
+
+def _combine_fold_result(
+    intent_metrics: IntentMetrics,
+    entity_metrics: EntityMetrics,
+    response_selection_metrics: ResponseSelectionMetrics,
+    fold_result: FoldResult,
+    intent_results: Optional[List[IntentEvaluationResult]] = None,
+    entity_results: Optional[List[EntityEvaluationResult]] = None,
+    response_selection_results: Optional[
+        List[ResponseSelectionEvaluationResult]
+    ] = None,
+) -> Tuple[IntentMetrics, EntityMetrics, ResponseSelectionMetrics]:
+    """Adds the metrics and prediction results of a single fold (see `combine_result`).
+
+    Args:
+        intent_metrics: intent metrics
+        entity_metrics: entity metrics
+        response_selection_metrics: response selection metrics
+        fold_result: metrics and prediction results as returned by `compute_metrics`
+        intent_results: intent evaluation results
+        entity_results: entity evaluation results
+        response_selection_results: reponse selection evaluation results
+
+    Returns: intent, entity, and response selection metrics
+    """
+    (
+        intent_current_metrics,
+        entity_current_metrics,
+        response_selection_current_metrics,
+        current_intent_results,
+        current_entity_results,
+        current_response_selection_results,
+    ) = fold_result
+
     if intent_results is not None:
         intent_results += current_intent_results
 
@@ -1568,6 +1676,103 @@ async def combine_result(
     return intent_metrics, entity_metrics, response_selection_metrics
 
 
+async def _evaluate_folds_in_processes(
+    folds: Iterable[Tuple[TrainingData, TrainingData]], nlu_config: Text, jobs: int
+) -> AsyncIterator[Tuple[FoldResult, FoldResult]]:
+    """Trains and evaluates the folds of a cross validation in parallel processes.
+
+    Every process uses its own temporary directory and a share of the CPU cores.
+
+    Args:
+        folds: train and test data of the folds
+        nlu_config: path to the nlu config file
+        jobs: number of folds which are trained and evaluated in parallel
+
+    Returns: the train and test results of the folds (in the order of the folds)
+    """
+    logger.info(f"Running cross validation folds in {jobs} parallel processes.")
+    loop = asyncio.get_running_loop()
+    threads_per_job = max(1, (os.cpu_count() or 1) // jobs)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_fold_process,
+        initargs=(threads_per_job,),
+    ) as executor:
+        results = [
+            loop.run_in_executor(
+                executor, _evaluate_fold_in_process, train, test, nlu_config
+            )
+            for train, test in folds
+        ]
+        for result in results:
+            yield await result
+
+
+def _train_fold_model(
+    train: TrainingData, nlu_config: Text, tmp_path: Path
+) -> MessageProcessor:
+    import rasa.model_training
+
+    training_data_file = tmp_path / "training_data.yml"
+    RasaYAMLWriter().dump(training_data_file, train)
+
+    model_file = rasa.model_training.train_nlu(
+        nlu_config, str(training_data_file), str(tmp_path)
+    )
+
+    processor = Agent.load(model_file).processor
+    if processor is None:
+        raise RasaException(
+            f"Failed to load the model which was trained for a cross validation "
+            f"fold from '{model_file}'."
+        )
+    return processor
+
+
+def _init_fold_process(threads: int) -> None:
+    """Limits the number of threads TensorFlow uses in a cross validation process."""
+    import rasa.utils.tensorflow.environment
+
+    for variable in [ENV_CPU_INTER_OP_CONFIG, ENV_CPU_INTRA_OP_CONFIG]:
+        os.environ.setdefault(variable, str(threads))
+
+    rasa.utils.tensorflow.environment.setup_tf_environment()
+
+
+def _evaluate_fold_in_process(
+    train: TrainingData, test: TrainingData, nlu_config: Text
+) -> Tuple[FoldResult, FoldResult]:
+    """Evaluates a fold in a cross validation process with its own temp directory.
+
+    The fold also uses its own training cache within this directory. Otherwise the
+    processes would all write to the same cache database and directory.
+    """
+    from rasa.engine.caching import CACHE_LOCATION_ENV
+
+    with TempDirectoryPath(get_temp_dir_name()) as temp_dir:
+        os.environ[CACHE_LOCATION_ENV] = os.path.join(temp_dir, "cache")
+        processor = _train_fold_model(train, nlu_config, Path(temp_dir))
+        train_result = asyncio.run(compute_metrics(processor, train))
+        test_result = asyncio.run(compute_metrics(processor, test))
+
+    # the entity metrics are nested `defaultdict`s which can't be pickled
+    return _without_defaultdicts(train_result), _without_defaultdicts(test_result)
+
+
+def _without_defaultdicts(fold_result: FoldResult) -> FoldResult:
+    intent_metrics, entity_metrics, response_selection_metrics, *results = fold_result
+    entity_metrics = {
+        extractor: dict(metrics) for extractor, metrics in entity_metrics.items()
+    }
+    return (
+        intent_metrics,
+        entity_metrics,
+        response_selection_metrics,
+        *results,
+    )  # type: ignore[return-value]
+
+
 def _contains_entity_labels(entity_results: List[EntityEvaluationResult]) -> bool:
 
     for result in entity_results:
@@ -1585,6 +1790,7 @@ async def cross_validate(
     errors: bool = False,
     disable_plotting: bool = False,
     report_as_dict: Optional[bool] = None,
+    jobs: int = 1,
 ) -> Tuple[CVEvaluationResult, CVEvaluationResult, CVEvaluationResult]:
     """Stratified cross validation on data.
 
@@ -1600,13 +1806,13 @@ async def cross_validate(
             If `False` the report is returned in a human-readable text format. If `None`
             `report_as_dict` is considered as `True` in case an `output_directory` is
             given.
+        jobs: number of folds which are trained and evaluated in parallel (each in
+            its own process)
 
     Returns:
         dictionary with key, list structure, where each entry in list
               corresponds to the relevant result for one fold
     """
-    import rasa.model_training
-
     with TempDirectoryPath(get_temp_dir_name()) as temp_dir:
         tmp_path = Path(temp_dir)
 
@@ -1629,35 +1835,48 @@ async def cross_validate(
         entity_test_results: List[EntityEvaluationResult] = []
         response_selection_test_results: List[ResponseSelectionEvaluationResult] = []
 
-        for train, test in generate_folds(n_folds, data):
-            training_data_file = tmp_path / "training_data.yml"
-            RasaYAMLWriter().dump(training_data_file, train)
-
-            model_file = rasa.model_training.train_nlu(
-                nlu_config, str(training_data_file), str(tmp_path)
-            )
-
-            processor = Agent.load(model_file).processor
-
-            # calculate train accuracy
-            await combine_result(
-                intent_train_metrics,
-                entity_train_metrics,
-                response_selection_train_metrics,
-                processor,
-                train,
-            )
-            # calculate test accuracy
-            await combine_result(
-                intent_test_metrics,
-                entity_test_metrics,
-                response_selection_test_metrics,
-                processor,
-                test,
-                intent_test_results,
-                entity_test_results,
-                response_selection_test_results,
-            )
+        if jobs > 1:
+            async for train_result, test_result in _evaluate_folds_in_processes(
+                generate_folds(n_folds, data), nlu_config, jobs
+            ):
+                _combine_fold_result(
+                    intent_train_metrics,
+                    entity_train_metrics,
+                    response_selection_train_metrics,
+                    train_result,
+                )
+                _combine_fold_result(
+                    intent_test_metrics,
+                    entity_test_metrics,
+                    response_selection_test_metrics,
+                    test_result,
+                    intent_test_results,
+                    entity_test_results,
+                    response_selection_test_results,
+                )
+        else:
+            for train, test in generate_folds(n_folds, data):
+                processor = _train_fold_model(train, nlu_config, tmp_path)
+
+                # calculate train accuracy
+                await combine_result(
+                    intent_train_metrics,
+                    entity_train_metrics,
+                    response_selection_train_metrics,
+                    processor,
+                    train,
+                )
+                # calculate test accuracy
+                await combine_result(
+                    intent_test_metrics,
+                    entity_test_metrics,
+                    response_selection_test_metrics,
+                    processor,
+                    test,
+                    intent_test_results,
+                    entity_test_results,
+                    response_selection_test_results,
+                )
 
         intent_evaluation = {}
         if intent_test_results:
@@ -1724,14 +1943,7 @@ def _targets_predictions_from(
 
 async def compute_metrics(
     processor: MessageProcessor, training_data: TrainingData
-) -> Tuple[
-    IntentMetrics,
-    EntityMetrics,
-    ResponseSelectionMetrics,
-    List[IntentEvaluationResult],
-    List[EntityEvaluationResult],
-    List[ResponseSelectionEvaluationResult],
-]:
+) -> FoldResult:
     """Computes metrics for intent classification, response selection and entity
     extraction.
 
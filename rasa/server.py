@@ -704,13 +704,23 @@ def create_app(
     @ensure_loaded_agent(app)
     async def status(request: Request) -> HTTPResponse:
         """Respond with the model name and the fingerprint of that model."""
-        return response.json(
-            {
-                "model_file": app.ctx.agent.processor.model_filename,
-                "model_id": app.ctx.agent.model_id,
-                "num_active_training_jobs": app.ctx.active_training_processes.value,
-            }
-        )
+        status = {
+            "model_file": app.ctx.agent.processor.model_filename,
+            "model_id": app.ctx.agent.model_id,
+            "num_active_training_jobs": app.ctx.active_training_processes.value,
+            "inference": app.ctx.agent.inference_executor.stats().as_dict(),
+            "connections": {
+                name: endpoint.connection_stats().as_dict()
+                for name, endpoint in app.ctx.agent.http_endpoints().items()
+            },
+        }
+
+        event_broker = app.ctx.agent.tracker_store.event_broker
+        event_broker_stats = event_broker.stats() if event_broker else None
+        if event_broker_stats is not None:
+            status["event_broker"] = event_broker_stats
+
+        return response.json(status)
 
     @app.get("/conversations/<conversation_id:path>/tracker")
     @requires_auth(app, auth_token)
@@ -806,6 +806,8 @@ class Domain:
         self.store_entities_as_slots = store_entities_as_slots
         self._check_domain_sanity()
 
+        self._cached_fingerprint: Optional[Text] = None
+
     def __deepcopy__(self, memo: Optional[Dict[int, Any]]) -> "Domain":
         """Enables making a deep copy of the `Domain` using `copy.deepcopy`.
 
@@ -884,6 +886,13 @@ class Domain:
         Returns:
             fingerprint of the domain
         """
+        # The domain is fingerprinted by many graph nodes during training. It's not
+        # changed after its creation, so the fingerprint only needs to be computed once.
+        if self._cached_fingerprint is None:
+            self._cached_fingerprint = self._calculate_fingerprint()
+        return self._cached_fingerprint
+
+    def _calculate_fingerprint(self) -> Text:
         self_as_dict = self.as_dict()
         transformed_intents: List[Text] = []
         for intent in self_as_dict.get(KEY_INTENTS, []):
@@ -1349,48 +1358,16 @@ class Domain:
         Return:
             A list of states.
         """
-        states: List[State] = []
-        last_ml_action_sub_state = None
-        turn_was_hidden = False
+        history = TrackerHistoryStates(
+            self,
+            omit_unset_slots=omit_unset_slots,
+            ignore_rule_only_turns=ignore_rule_only_turns,
+            rule_only_data=rule_only_data,
+        )
         for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
-            if ignore_rule_only_turns:
-                # remember previous ml action based on the last non hidden turn
-                # we need this to override previous action in the ml state
-                if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
-
-                # followup action or happy path loop prediction
-                # don't change the fact whether dialogue turn should be hidden
-                if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
-                ):
-                    turn_was_hidden = hide_rule_turn
-
-                if turn_was_hidden:
-                    continue
-
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
-
-            if ignore_rule_only_turns:
-                # clean state from only rule features
-                self._remove_rule_only_features(state, rule_only_data)
-                # make sure user input is the same as for previous state
-                # for non action_listen turns
-                if states:
-                    self._substitute_rule_only_user_input(state, states[-1])
-                # substitute previous rule action with last_ml_action_sub_state
-                if last_ml_action_sub_state:
-                    # FIXME: better type annotation for `State` would require
-                    # a larger refactoring (e.g. switch to dataclass)
-                    state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
-                        SubState,
-                        last_ml_action_sub_state,
-                    )
-
-            states.append(self._clean_state(state))
+            history.add(tr, hide_rule_turn)
 
-        return states
+        return history.states
 
     def slots_for_entities(self, entities: List[Dict[Text, Any]]) -> List[SlotSet]:
         """Creates slot events for entities if from_entity mapping matches.
@@ -1917,6 +1894,92 @@ class Domain:
         return action_names
 
 
+class TrackerHistoryStates:
+    """Collects the states of a tracker's history one prior tracker at a time."""
+
+    def __init__(
+        self,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        """Creates an empty history.
+
+        Args:
+            domain: The domain which is used to turn trackers into states.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+        """
+        self.domain = domain
+        self.omit_unset_slots = omit_unset_slots
+        self.ignore_rule_only_turns = ignore_rule_only_turns
+        self.rule_only_data = rule_only_data
+
+        self.states: List[State] = []
+        self._last_ml_action_sub_state: Optional[Dict[Text, Text]] = None
+        self._turn_was_hidden = False
+
+    def add(self, tracker: "DialogueStateTracker", hide_rule_turn: bool) -> None:
+        """Adds the state of the next prior tracker to the history.
+
+        Args:
+            tracker: The tracker before the next action of the conversation (or the
+                tracker after the last event of the conversation).
+            hide_rule_turn: Whether the next action should be hidden in the
+                dialogue history created for ML-based policies.
+        """
+        if self.ignore_rule_only_turns:
+            # remember previous ml action based on the last non hidden turn
+            # we need this to override previous action in the ml state
+            if not self._turn_was_hidden:
+                self._last_ml_action_sub_state = self.domain._get_prev_action_sub_state(
+                    tracker
+                )
+
+            # followup action or happy path loop prediction
+            # don't change the fact whether dialogue turn should be hidden
+            if (
+                not tracker.followup_action
+                and not tracker.latest_action_name == tracker.active_loop_name
+            ):
+                self._turn_was_hidden = hide_rule_turn
+
+            if self._turn_was_hidden:
+                return
+
+        state = self.domain.get_active_state(
+            tracker, omit_unset_slots=self.omit_unset_slots
+        )
+
+        if self.ignore_rule_only_turns:
+            # clean state from only rule features
+            self.domain._remove_rule_only_features(state, self.rule_only_data)
+            # make sure user input is the same as for previous state
+            # for non action_listen turns
+            if self.states:
+                self.domain._substitute_rule_only_user_input(state, self.states[-1])
+            # substitute previous rule action with last_ml_action_sub_state
+            if self._last_ml_action_sub_state:
+                # FIXME: better type annotation for `State` would require
+                # a larger refactoring (e.g. switch to dataclass)
+                state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
+                    SubState,
+                    self._last_ml_action_sub_state,
+                )
+
+        self.states.append(self.domain._clean_state(state))
+
+    def copy(self) -> "TrackerHistoryStates":
+        """Returns a copy of the history which can be extended independently."""
+        history = copy.copy(self)
+        history.states = list(self.states)
+        return history
+
+
 def warn_about_duplicates_found_during_domain_merging(
     duplicates: Dict[Text, List[Text]]
 ) -> None:
@@ -4,6 +4,7 @@ import json
 import logging
 import structlog
 import re
+import sys
 from abc import ABC
 
 import jsonpickle
@@ -266,6 +267,15 @@ def remove_parse_data(event: Dict[Text, Any]) -> Dict[Text, Any]:
 E = TypeVar("E", bound="Event")
 
 
+def _intern(value: Any) -> Any:
+    """Interns `value` if it is a string.
+
+    Interned strings are shared by all events which refer to the same intent,
+    action or slot instead of being stored once per event.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Event(ABC):
     """Describes events in conversation and how the affect the conversation state.
 
@@ -275,6 +285,15 @@ class Event(ABC):
     """
 
     type_name = "event"
+    __slots__ = ("timestamp", "metadata")
+
+    # event classes by their `type_name`, filled on demand by `resolve_by_type`
+    _classes_by_type_name: Dict[Text, Type["Event"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Invalidates the lookup of event classes when a new event is defined."""
+        super().__init_subclass__(**kwargs)
+        Event._classes_by_type_name = {}
 
     def __init__(
         self,
@@ -376,8 +395,12 @@ class Event(ABC):
         type_name: Text, default: Optional[Type["Event"]] = None
     ) -> Optional[Type["Event"]]:
         """Returns a slots class by its type name."""
+        if type_name in Event._classes_by_type_name:
+            return Event._classes_by_type_name[type_name]
+
         for cls in rasa.shared.utils.common.all_subclasses(Event):
             if cls.type_name == type_name:
+                Event._classes_by_type_name[type_name] = cls
                 return cls
         if type_name == "topic":
             return None  # backwards compatibility to support old TopicSet evts
@@ -394,6 +417,14 @@ class Event(ABC):
         """
         pass
 
+    def compact(self) -> None:
+        """Reduces the memory which is used by the event.
+
+        Compacting doesn't change the event's behavior or its serialized form. It's
+        used by trackers which keep long conversation histories in memory.
+        """
+        pass
+
     @abc.abstractmethod
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
@@ -408,6 +439,8 @@ class Event(ABC):
 class AlwaysEqualEventMixin(Event, ABC):
     """Class to deduplicate common behavior for events without additional attributes."""
 
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
         if not isinstance(other, self.__class__):
@@ -419,6 +452,8 @@ class AlwaysEqualEventMixin(Event, ABC):
 class SkipEventInMDStoryMixin(Event, ABC):
     """Skips the visualization of an event in Markdown stories."""
 
+    __slots__ = ()
+
     def as_story_string(self) -> None:
         """Returns the event as story string.
 
@@ -435,6 +470,16 @@ class UserUttered(Event):
     """
 
     type_name = "user"
+    __slots__ = (
+        "text",
+        "intent",
+        "entities",
+        "input_channel",
+        "message_id",
+        "use_text_for_featurization",
+        "_parse_data",
+        "_compact_parse_data",
+    )
 
     def __init__(
         self,
@@ -482,7 +527,15 @@ class UserUttered(Event):
             # happens during training
             self.use_text_for_featurization = False
 
-        self.parse_data: "NLUPredictionData" = {
+        self._parse_data: Optional["NLUPredictionData"] = self._default_parse_data()
+        # the JSON encoded difference between `parse_data` and the default parse
+        # data in case the event was compacted
+        self._compact_parse_data: Optional[Text] = None
+        if parse_data:
+            self._parse_data.update(**parse_data)
+
+    def _default_parse_data(self) -> "NLUPredictionData":
+        return {
             INTENT: self.intent,  # type: ignore[misc]
             # Copy entities so that changes to `self.entities` don't affect
             # `self.parse_data` and hence don't get persisted
@@ -491,8 +544,73 @@ class UserUttered(Event):
             "message_id": self.message_id,
             "metadata": self.metadata,
         }
-        if parse_data:
-            self.parse_data.update(**parse_data)
+
+    @property
+    def parse_data(self) -> "NLUPredictionData":
+        """Returns the detailed NLU parsing result for the message."""
+        if self._parse_data is None:
+            # the event was compacted, restore the parse data as it might be
+            # modified by the caller
+            self._parse_data = self._materialized_parse_data()
+            self._compact_parse_data = None
+        return self._parse_data
+
+    @parse_data.setter
+    def parse_data(self, parse_data: "NLUPredictionData") -> None:
+        self._parse_data = parse_data
+        self._compact_parse_data = None
+
+    def _materialized_parse_data(self) -> "NLUPredictionData":
+        if self._parse_data is not None:
+            return self._parse_data
+
+        parse_data = self._default_parse_data()
+        parse_data.update(json.loads(self._compact_parse_data or "{}"))
+        return parse_data
+
+    def compact(self) -> None:
+        """Reduces the memory which is used by the event.
+
+        Intent and entity names are interned. Everything in `parse_data` which
+        can't be restored from the event's attributes (e.g. the intent ranking) is
+        kept as JSON string until `parse_data` is accessed.
+        """
+        self.intent = {key: _intern(value) for key, value in self.intent.items()}
+        for entity in self.entities:
+            if ENTITY_ATTRIBUTE_TYPE in entity:
+                entity[ENTITY_ATTRIBUTE_TYPE] = _intern(entity[ENTITY_ATTRIBUTE_TYPE])
+
+        if self._parse_data is None:
+            return
+
+        # the fields of `_default_parse_data` which are restored from the event's
+        # attributes when `parse_data` is accessed
+        default_parse_data: Dict[Text, Any] = {
+            INTENT: self.intent,
+            ENTITIES: self.entities,
+            TEXT: self.text,
+            "message_id": self.message_id,
+            "metadata": self.metadata,
+        }
+        if any(key not in self._parse_data for key in default_parse_data):
+            return
+
+        difference = {
+            key: value
+            for key, value in self._parse_data.items()
+            if key not in default_parse_data or default_parse_data[key] != value
+        }
+        try:
+            compact_parse_data = json.dumps(difference, separators=(",", ":"))
+        except (TypeError, ValueError):
+            # parse data which isn't JSON serializable is kept as is
+            return
+        if json.loads(compact_parse_data) != difference:
+            # e.g. tuples would be restored as lists
+            return
+
+        self._compact_parse_data = compact_parse_data
+        self._parse_data = None
 
     @staticmethod
     def _from_parse_data(
@@ -586,7 +704,7 @@ class UserUttered(Event):
         _dict.update(
             {
                 "text": self.text,
-                "parse_data": self.parse_data,
+                "parse_data": self._materialized_parse_data(),
                 "input_channel": getattr(self, "input_channel", None),
                 "message_id": getattr(self, "message_id", None),
                 "metadata": self.metadata,
@@ -716,6 +834,7 @@ class DefinePrevUserUtteredFeaturization(SkipEventInMDStoryMixin):
     """Stores information whether action was predicted based on text or intent."""
 
     type_name = "user_featurization"
+    __slots__ = ("use_text_for_featurization",)
 
     def __init__(
         self,
@@ -789,6 +908,7 @@ class EntitiesAdded(SkipEventInMDStoryMixin):
     """Event that is used to add extracted entities to the tracker state."""
 
     type_name = "entities"
+    __slots__ = ("entities",)
 
     def __init__(
         self,
@@ -869,6 +989,7 @@ class BotUttered(SkipEventInMDStoryMixin):
     """
 
     type_name = "bot"
+    __slots__ = ("text", "data")
 
     def __init__(
         self,
@@ -976,6 +1097,7 @@ class SlotSet(Event):
     """
 
     type_name = "slot"
+    __slots__ = ("key", "value")
 
     def __init__(
         self,
@@ -1048,6 +1170,10 @@ class SlotSet(Event):
         except KeyError as e:
             raise ValueError(f"Failed to parse set slot event. {e}")
 
+    def compact(self) -> None:
+        """Interns the slot name (see docstring of `Event`)."""
+        self.key = _intern(self.key)
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state."""
         tracker._set_slot(self.key, self.value)
@@ -1062,6 +1188,7 @@ class Restarted(AlwaysEqualEventMixin):
     """
 
     type_name = "restart"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1086,6 +1213,7 @@ class UserUtteranceReverted(AlwaysEqualEventMixin):
     """
 
     type_name = "rewind"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1110,6 +1238,7 @@ class AllSlotsReset(AlwaysEqualEventMixin):
     """
 
     type_name = "reset_slots"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1131,6 +1260,13 @@ class ReminderScheduled(Event):
     """
 
     type_name = "reminder"
+    __slots__ = (
+        "intent",
+        "entities",
+        "trigger_date_time",
+        "kill_on_user_message",
+        "name",
+    )
 
     def __init__(
         self,
@@ -1242,6 +1378,7 @@ class ReminderCancelled(Event):
     """Cancel certain jobs."""
 
     type_name = "cancel_reminder"
+    __slots__ = ("name", "intent", "entities")
 
     def __init__(
         self,
@@ -1360,6 +1497,7 @@ class ActionReverted(AlwaysEqualEventMixin):
     """
 
     type_name = "undo"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1379,6 +1517,7 @@ class StoryExported(Event):
     """Story should get dumped to a file."""
 
     type_name = "export"
+    __slots__ = ("path",)
 
     def __init__(
         self,
@@ -1433,6 +1572,7 @@ class FollowupAction(Event):
     """Enqueue a followup action."""
 
     type_name = "followup"
+    __slots__ = ("action_name",)
 
     def __init__(
         self,
@@ -1489,6 +1629,10 @@ class FollowupAction(Event):
         d.update({"name": self.action_name})
         return d
 
+    def compact(self) -> None:
+        """Interns the action name (see docstring of `Event`)."""
+        self.action_name = _intern(self.action_name)
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state."""
         tracker.trigger_followup_action(self.action_name)
@@ -1502,6 +1646,7 @@ class ConversationPaused(AlwaysEqualEventMixin):
     """
 
     type_name = "pause"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1524,6 +1669,7 @@ class ConversationResumed(AlwaysEqualEventMixin):
     """
 
     type_name = "resume"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -1546,6 +1692,14 @@ class ActionExecuted(Event):
     """
 
     type_name = "action"
+    __slots__ = (
+        "action_name",
+        "policy",
+        "confidence",
+        "unpredictable",
+        "action_text",
+        "hide_rule_turn",
+    )
 
     def __init__(
         self,
@@ -1669,6 +1823,11 @@ class ActionExecuted(Event):
             #        `action_name` or `action_text`
             return {ACTION_TEXT: cast(Text, self.action_text)}
 
+    def compact(self) -> None:
+        """Interns the action and policy names (see docstring of `Event`)."""
+        self.action_name = _intern(self.action_name)
+        self.policy = _intern(self.policy)
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state."""
         tracker.set_latest_action(self.as_sub_state())
@@ -1683,6 +1842,7 @@ class AgentUttered(SkipEventInMDStoryMixin):
     """
 
     type_name = "agent"
+    __slots__ = ("text", "data")
 
     def __init__(
         self,
@@ -1739,6 +1899,7 @@ class ActiveLoop(Event):
     """If `name` is given: activates a loop with `name` else deactivates active loop."""
 
     type_name = "active_loop"
+    __slots__ = ("name",)
 
     def __init__(
         self,
@@ -1797,6 +1958,10 @@ class ActiveLoop(Event):
         d.update({LOOP_NAME: self.name})
         return d
 
+    def compact(self) -> None:
+        """Interns the loop name (see docstring of `Event`)."""
+        self.name = _intern(self.name)
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state."""
         tracker.change_loop_to(self.name)
@@ -1810,6 +1975,7 @@ class LegacyForm(ActiveLoop):
     """
 
     type_name = "form"
+    __slots__ = ()
 
     def as_dict(self) -> Dict[Text, Any]:
         """Returns serialized event."""
@@ -1836,6 +2002,7 @@ class LoopInterrupted(SkipEventInMDStoryMixin):
     """
 
     type_name = "loop_interrupted"
+    __slots__ = ("is_interrupted",)
 
     def __init__(
         self,
@@ -1900,6 +2067,7 @@ class LegacyFormValidation(LoopInterrupted):
     """
 
     type_name = "form_validation"
+    __slots__ = ()
 
     def __init__(
         self,
@@ -1942,6 +2110,7 @@ class ActionExecutionRejected(SkipEventInMDStoryMixin):
     """Notify Core that the execution of the action has been rejected."""
 
     type_name = "action_execution_rejected"
+    __slots__ = ("action_name", "policy", "confidence")
 
     def __init__(
         self,
@@ -2006,6 +2175,11 @@ class ActionExecutionRejected(SkipEventInMDStoryMixin):
         )
         return d
 
+    def compact(self) -> None:
+        """Interns the action and policy names (see docstring of `Event`)."""
+        self.action_name = _intern(self.action_name)
+        self.policy = _intern(self.policy)
+
     def apply_to(self, tracker: "DialogueStateTracker") -> None:
         """Applies event to current conversation state."""
         tracker.reject_action(self.action_name)
@@ -2015,6 +2189,7 @@ class SessionStarted(AlwaysEqualEventMixin):
     """Mark the beginning of a new conversation session."""
 
     type_name = "session_started"
+    __slots__ = ()
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
@@ -61,7 +61,7 @@ from rasa.shared.core.events import (
     ActionExecutionRejected,
     DefinePrevUserUtteredFeaturization,
 )
-from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.domain import Domain, State, TrackerHistoryStates
 from rasa.shared.core.slots import AnySlot, Slot
 
 if TYPE_CHECKING:
@@ -136,6 +136,7 @@ class DialogueStateTracker:
         events_as_dict: List[Dict[Text, Any]],
         slots: Optional[Iterable[Slot]] = None,
         max_event_history: Optional[int] = None,
+        compact_events: bool = False,
     ) -> "DialogueStateTracker":
         """Create a tracker from dump.
 
@@ -144,7 +145,9 @@ class DialogueStateTracker:
         """
         evts = events.deserialise_events(events_as_dict)
 
-        return cls.from_events(sender_id, evts, slots, max_event_history)
+        return cls.from_events(
+            sender_id, evts, slots, max_event_history, compact_events=compact_events
+        )
 
     @classmethod
     def from_events(
@@ -155,6 +158,7 @@ class DialogueStateTracker:
         max_event_history: Optional[int] = None,
         sender_source: Optional[Text] = None,
         domain: Optional[Domain] = None,
+        compact_events: bool = False,
     ) -> "DialogueStateTracker":
         """Creates tracker from existing events.
 
@@ -165,12 +169,19 @@ class DialogueStateTracker:
             max_event_history: Maximum number of events which should be stored.
             sender_source: File source of the messages.
             domain: The current model domain.
+            compact_events: Whether to compact the events to save memory.
 
         Returns:
             Instantiated tracker with its state updated according to the given
             events.
         """
-        tracker = cls(sender_id, slots, max_event_history, sender_source)
+        tracker = cls(
+            sender_id,
+            slots,
+            max_event_history,
+            sender_source,
+            compact_events=compact_events,
+        )
 
         for e in evts:
             tracker.update(e, domain)
@@ -184,15 +195,22 @@ class DialogueStateTracker:
         max_event_history: Optional[int] = None,
         sender_source: Optional[Text] = None,
         is_rule_tracker: bool = False,
+        compact_events: bool = False,
     ) -> None:
         """Initialize the tracker.
 
         A set of events can be stored externally, and we will run through all
         of them to get the current state. The tracker will represent all the
         information we captured while processing messages of the dialogue.
+
+        If `compact_events` is `True`, every event is compacted (see
+        `Event.compact`) when it's added to the tracker. This reduces the memory
+        used by trackers with long conversation histories.
         """
         # maximum number of events to store
         self._max_event_history = max_event_history
+        # whether events are compacted when they are added
+        self._compact_events = compact_events
         # list of previously seen events
         self.events = self._create_events([])
         # id of the source of the messages
@@ -227,6 +245,9 @@ class DialogueStateTracker:
         self.model_id: Optional[Text] = None
         self.assistant_id: Optional[Text] = None
 
+        # past states which are shared by all policies predicting for this tracker
+        self._past_states_cache: Dict[Tuple, _IncrementalPastStates] = {}
+
     ###
     # Public tracker interface
     ###
@@ -318,12 +339,22 @@ class DialogueStateTracker:
         Returns:
             A list of states
         """
-        return domain.states_for_tracker_history(
-            self,
-            omit_unset_slots=omit_unset_slots,
-            ignore_rule_only_turns=ignore_rule_only_turns,
-            rule_only_data=rule_only_data,
+        key = (
+            omit_unset_slots,
+            ignore_rule_only_turns,
+            rasa.shared.utils.io.deep_container_fingerprint(rule_only_data),
         )
+        past_states = self._past_states_cache.get(key)
+        if past_states is None or past_states.domain is not domain:
+            past_states = _IncrementalPastStates(
+                domain,
+                omit_unset_slots=omit_unset_slots,
+                ignore_rule_only_turns=ignore_rule_only_turns,
+                rule_only_data=rule_only_data,
+            )
+            self._past_states_cache[key] = past_states
+
+        return past_states.states(self)
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
         """Set the currently active loop.
@@ -478,6 +509,7 @@ class DialogueStateTracker:
             self.slots.values(),
             self._max_event_history,
             is_rule_tracker=self.is_rule_tracker,
+            compact_events=self._compact_events,
         )
 
     def generate_all_prior_trackers(
@@ -640,6 +672,9 @@ class DialogueStateTracker:
             )
 
         self._reset()
+        if self._compact_events:
+            for event in dialogue.events:
+                event.compact()
         self.events.extend(dialogue.events)
         self.replay_events()
 
@@ -683,6 +718,9 @@ class DialogueStateTracker:
         if self.assistant_id and ASSISTANT_ID_KEY not in event.metadata:
             event.metadata = {**event.metadata, ASSISTANT_ID_KEY: self.assistant_id}
 
+        if self._compact_events:
+            event.compact()
+
         self.events.append(event)
         event.apply_to(self)
 
@@ -906,6 +944,104 @@ class DialogueStateTracker:
         return rasa.shared.utils.io.get_dictionary_fingerprint(data)
 
 
+class _IncrementalPastStates:
+    """Past states of a tracker which are extended as events are added.
+
+    Only the states for the events which were applied since the last call are
+    computed. If previous events don't apply anymore (e.g. due to a rewind,
+    a restart or a new session), the states are computed from scratch.
+
+    The events are applied to a tracker which keeps the replayed slots, latest
+    message, latest action and active loop. The events themselves aren't stored
+    in it.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        self.domain = domain
+        self._history_kwargs: Dict[Text, Any] = {
+            "omit_unset_slots": omit_unset_slots,
+            "ignore_rule_only_turns": ignore_rule_only_turns,
+            "rule_only_data": rule_only_data,
+        }
+
+        self._history = TrackerHistoryStates(domain, **self._history_kwargs)
+        self._replay_tracker: Optional[DialogueStateTracker] = None
+        self._num_applied_events = 0
+        self._last_applied_event: Optional[Event] = None
+        self._num_events = 0
+        self._last_event: Optional[Event] = None
+        self._states: List[State] = []
+
+    def states(self, tracker: DialogueStateTracker) -> List[State]:
+        """Returns the past states of `tracker`.
+
+        Args:
+            tracker: The tracker whose states are cached by this object.
+
+        Returns:
+            A list of states which can be modified by the caller.
+        """
+        if not self._is_up_to_date(tracker):
+            self._update(tracker)
+
+        return [
+            {key: dict(sub_state) for key, sub_state in state.items()}
+            for state in self._states
+        ]
+
+    def _is_up_to_date(self, tracker: DialogueStateTracker) -> bool:
+        last_event = tracker.events[-1] if tracker.events else None
+        return (
+            self._replay_tracker is not None
+            and len(tracker.events) == self._num_events
+            and last_event is self._last_event
+        )
+
+    def _update(self, tracker: DialogueStateTracker) -> None:
+        applied_events = tracker.applied_events()
+
+        if self._replay_tracker is None or not self._is_continued_by(applied_events):
+            self._history = TrackerHistoryStates(self.domain, **self._history_kwargs)
+            self._replay_tracker = tracker.init_copy()
+            self._num_applied_events = 0
+
+        for event in applied_events[self._num_applied_events :]:
+            if isinstance(event, ActionExecuted):
+                self._history.add(self._replay_tracker, event.hide_rule_turn)
+            # the states only depend on the state of the tracker, not on its events
+            event.apply_to(self._replay_tracker)
+        self._num_applied_events = len(applied_events)
+        self._last_applied_event = applied_events[-1] if applied_events else None
+
+        # the state after the last event changes with the next event, hence it's
+        # only added to a copy of the history
+        history = self._history.copy()
+        history.add(self._replay_tracker, False)
+        self._states = history.states
+
+        self._num_events = len(tracker.events)
+        self._last_event = tracker.events[-1] if tracker.events else None
+
+    def _is_continued_by(self, applied_events: List[Event]) -> bool:
+        if not self._num_applied_events:
+            return True
+
+        # The applied events only continue the replayed ones if the event at the
+        # position of the last replayed event is still that same event object.
+        # Earlier events aren't compared, e.g. events which were replaced in place
+        # before that position wouldn't be detected.
+        return (
+            len(applied_events) >= self._num_applied_events
+            and applied_events[self._num_applied_events - 1] is self._last_applied_event
+        )
+
+
 class TrackerEventDiffEngine:
     """Computes event difference of two trackers."""
 
@@ -14,6 +14,7 @@ import rasa.shared.data
 from rasa.shared.core.slots import TextSlot, ListSlot
 from rasa.shared.exceptions import YamlException
 import rasa.shared.utils.io
+import rasa.shared.utils.parsed_data_cache
 from rasa.shared.core.constants import LOOP_NAME
 from rasa.shared.nlu.constants import (
     ENTITIES,
@@ -106,16 +107,27 @@ class YAMLStoryReader(StoryReader):
         """
         self.source_name = str(filename)
         try:
-            return self.read_from_string(
-                rasa.shared.utils.io.read_file(
-                    filename, rasa.shared.utils.io.DEFAULT_ENCODING
+            story_steps = rasa.shared.utils.parsed_data_cache.load_or_parse(
+                filename,
+                lambda: self.read_from_string(
+                    rasa.shared.utils.io.read_file(
+                        filename, rasa.shared.utils.io.DEFAULT_ENCODING
+                    ),
+                    skip_validation,
                 ),
+                self.__class__.__name__,
+                self.domain,
                 skip_validation,
             )
         except YamlException as e:
             e.filename = str(filename)
             raise e
 
+        # Steps loaded from the cache have the ids they got when the file was parsed
+        # for the first time. Assign new ones so that they are unique and reflect the
+        # order in which files were read.
+        return [step.create_copy(use_new_id=True) for step in story_steps]
+
     def read_from_string(
         self, string: Text, skip_validation: bool = False
     ) -> List[StoryStep]:
@@ -433,6 +433,7 @@ class StoryGraph:
             self.story_end_checkpoints = story_end_checkpoints
         else:
             self.story_end_checkpoints = {}
+        self._cached_fingerprint: Optional[Text] = None
 
     def __hash__(self) -> int:
         """Return hash for the story step.
@@ -452,8 +453,14 @@ class StoryGraph:
             YAMLStoryWriter,
         )
 
-        stories_as_yaml = YAMLStoryWriter().stories_to_yaml(self.story_steps)
-        return rasa.shared.utils.io.deep_container_fingerprint(stories_as_yaml)
+        # Dumping the stories is expensive. The graph is not changed after its
+        # creation, so the fingerprint can be re-used.
+        if self._cached_fingerprint is None:
+            stories_as_yaml = YAMLStoryWriter().stories_to_yaml(self.story_steps)
+            self._cached_fingerprint = rasa.shared.utils.io.deep_container_fingerprint(
+                stories_as_yaml
+            )
+        return self._cached_fingerprint
 
     def ordered_steps(self) -> List[StoryStep]:
         """Returns the story steps ordered by topological order of the DAG."""
@@ -1,5 +1,4 @@
 import logging
-from functools import reduce
 from typing import Text, Set, Dict, Optional, List, Union, Any
 import os
 
@@ -25,7 +24,19 @@ class MultiProjectImporter(TrainingDataImporter):
         domain_path: Optional[Text] = None,
         training_data_paths: Optional[Union[List[Text], Text]] = None,
         project_directory: Optional[Text] = None,
+        jobs: int = 1,
     ):
+        """Initializes the importer.
+
+        Args:
+            config_file: The model configuration file which lists the imports.
+            domain_path: Path to an additional domain file or directory.
+            training_data_paths: Paths to additional training data.
+            project_directory: The root directory of the project.
+            jobs: Number of processes which are used to load the domain, NLU and
+                story files.
+        """
+        self._jobs = jobs
         self.config = rasa.shared.utils.io.read_model_configuration(config_file)
         if domain_path:
             self._domain_paths = [domain_path]
@@ -177,22 +188,19 @@ class MultiProjectImporter(TrainingDataImporter):
 
     def get_domain(self) -> Domain:
         """Retrieves model domain (see parent class for full docstring)."""
-        domains = [Domain.load(path) for path in self._domain_paths]
-        return reduce(
-            lambda merged, other: merged.merge(other),
-            domains,
-            Domain.empty(),
-        )
+        return utils.domain_from_paths(self._domain_paths, self._jobs)
 
     def get_stories(self, exclusion_percentage: Optional[int] = None) -> StoryGraph:
         """Retrieves training stories / rules (see parent class for full docstring)."""
         return utils.story_graph_from_paths(
-            self._story_paths, self.get_domain(), exclusion_percentage
+            self._story_paths, self.get_domain(), exclusion_percentage, self._jobs
         )
 
     def get_conversation_tests(self) -> StoryGraph:
         """Retrieves conversation test stories (see parent class for full docstring)."""
-        return utils.story_graph_from_paths(self._e2e_story_paths, self.get_domain())
+        return utils.story_graph_from_paths(
+            self._e2e_story_paths, self.get_domain(), jobs=self._jobs
+        )
 
     def get_config(self) -> Dict:
         """Retrieves model config (see parent class for full docstring)."""
@@ -200,4 +208,4 @@ class MultiProjectImporter(TrainingDataImporter):
 
     def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         """Retrieves NLU training data (see parent class for full docstring)."""
-        return utils.training_data_from_paths(self._nlu_paths, language)
+        return utils.training_data_from_paths(self._nlu_paths, language, self._jobs)
@@ -25,9 +25,18 @@ class RasaFileImporter(TrainingDataImporter):
         config_file: Optional[Text] = None,
         domain_path: Optional[Text] = None,
         training_data_paths: Optional[Union[List[Text], Text]] = None,
+        jobs: int = 1,
     ):
-
+        """Initializes the importer.
+
+        Args:
+            config_file: The model configuration file.
+            domain_path: Path to the domain file or directory.
+            training_data_paths: Paths to the training data files or directories.
+            jobs: Number of processes which are used to load the NLU and story files.
+        """
         self._domain_path = domain_path
+        self._jobs = jobs
 
         self._nlu_files = rasa.shared.data.get_data_files(
             training_data_paths, rasa.shared.data.is_nlu_file
@@ -58,18 +67,18 @@ class RasaFileImporter(TrainingDataImporter):
     def get_stories(self, exclusion_percentage: Optional[int] = None) -> StoryGraph:
         """Retrieves training stories / rules (see parent class for full docstring)."""
         return utils.story_graph_from_paths(
-            self._story_files, self.get_domain(), exclusion_percentage
+            self._story_files, self.get_domain(), exclusion_percentage, self._jobs
         )
 
     def get_conversation_tests(self) -> StoryGraph:
         """Retrieves conversation test stories (see parent class for full docstring)."""
         return utils.story_graph_from_paths(
-            self._conversation_test_files, self.get_domain()
+            self._conversation_test_files, self.get_domain(), jobs=self._jobs
         )
 
     def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         """Retrieves NLU training data (see parent class for full docstring)."""
-        return utils.training_data_from_paths(self._nlu_files, language)
+        return utils.training_data_from_paths(self._nlu_files, language, self._jobs)
 
     def get_domain(self) -> Domain:
         """Retrieves model domain (see parent class for full docstring)."""
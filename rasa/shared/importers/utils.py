@@ -1,22 +1,111 @@
-from typing import Iterable, Text, Optional, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable, List, Optional, Text, TypeVar
 
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.training_data.structures import StoryGraph
+from rasa.shared.exceptions import RasaException
 from rasa.shared.nlu.training_data.training_data import TrainingData
 
+T = TypeVar("T")
 
-def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingData:
+
+def training_data_from_paths(
+    paths: Iterable[Text], language: Text, jobs: int = 1
+) -> TrainingData:
+    """Returns the merged `TrainingData` from paths.
+
+    Args:
+        paths: The NLU training data files.
+        language: The language of the training data.
+        jobs: Number of processes which are used to load the files in parallel.
+
+    Returns:
+        The training data of all files merged in the order of `paths`.
+    """
     from rasa.shared.nlu.training_data import loading
 
-    training_data_sets = [loading.load_data(nlu_file, language) for nlu_file in paths]
+    paths = list(paths)
+    training_data_sets = map_in_processes(
+        loading.load_data, jobs, paths, repeat(language, len(paths))
+    )
     return TrainingData().merge(*training_data_sets)
 
 
 def story_graph_from_paths(
-    files: List[Text], domain: Domain, exclusion_percentage: Optional[int] = None
+    files: List[Text],
+    domain: Domain,
+    exclusion_percentage: Optional[int] = None,
+    jobs: int = 1,
 ) -> StoryGraph:
     """Returns the `StoryGraph` from paths."""
     from rasa.shared.core.training_data import loading
 
-    story_steps = loading.load_data_from_files(files, domain, exclusion_percentage)
-    return StoryGraph(story_steps)
+    if not _use_processes(jobs, files):
+        story_steps = loading.load_data_from_files(files, domain, exclusion_percentage)
+        return StoryGraph(story_steps)
+
+    steps_per_file = map_in_processes(
+        loading.load_data_from_files,
+        jobs,
+        [[story_file] for story_file in files],
+        repeat(domain, len(files)),
+    )
+    # The step ids of the different processes aren't unique. Re-create the steps
+    # in the order of the files to get the same ids as when loading sequentially.
+    story_steps = [
+        step.create_copy(use_new_id=True) for steps in steps_per_file for step in steps
+    ]
+    return StoryGraph(loading.exclude_story_steps(story_steps, exclusion_percentage))
+
+
+def domain_from_paths(paths: List[Text], jobs: int = 1) -> Domain:
+    """Returns the merged `Domain` from paths.
+
+    Args:
+        paths: The domain files or directories.
+        jobs: Number of processes which are used to load the files in parallel.
+
+    Returns:
+        The domains of all paths merged in the order of `paths`.
+    """
+    domain = Domain.empty()
+    for other in map_in_processes(Domain.load, jobs, paths):
+        domain = domain.merge(other)
+    return domain
+
+
+def map_in_processes(
+    function: Callable[..., T], jobs: int, *arguments: Iterable[Any]
+) -> List[T]:
+    """Applies `function` to the arguments, optionally in multiple processes.
+
+    Args:
+        function: A picklable function which is applied to the arguments.
+        jobs: Number of processes to use. With `1` everything is run in the
+            current process.
+        arguments: Iterables with the arguments for each call of `function`.
+
+    Returns:
+        The results in the order of the arguments.
+    """
+    argument_lists = [list(argument) for argument in arguments]
+    if not _use_processes(jobs, argument_lists[0] if argument_lists else []):
+        return list(map(function, *argument_lists))
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        # `map` returns the results in order, which keeps the merged data
+        # independent of the number of processes.
+        return list(executor.map(function, *argument_lists))
+
+
+def _use_processes(jobs: int, items: List[Any]) -> bool:
+    if jobs < 1:
+        raise RasaException(
+            f"The number of jobs to load training data needs to be at least 1, but "
+            f"it was {jobs}."
+        )
+    return jobs > 1 and len(items) > 1
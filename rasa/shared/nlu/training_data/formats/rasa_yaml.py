@@ -20,6 +20,7 @@ from rasa.shared.nlu.training_data.formats.readerwriter import (
     TrainingDataWriter,
 )
 import rasa.shared.utils.io
+import rasa.shared.utils.parsed_data_cache
 import rasa.shared.nlu.training_data.util
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
@@ -68,6 +69,26 @@ class RasaYAMLReader(TrainingDataReader):
             e.filename = self.filename
             raise e
 
+    def read(self, filename: Union[Text, Path], **kwargs: Any) -> "TrainingData":
+        """Reads TrainingData in YAML format from a file.
+
+        The parsed training data is cached so that unchanged files don't need to be
+        validated and parsed again.
+
+        Args:
+            filename: Path to the YAML training data file.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            New `TrainingData` object with parsed training data.
+        """
+        return rasa.shared.utils.parsed_data_cache.load_or_parse(
+            filename,
+            lambda: super(RasaYAMLReader, self).read(filename, **kwargs),
+            self.__class__.__name__,
+            kwargs,
+        )
+
     def reads(  # type: ignore[override]
         self, string: Text, **kwargs: Any
     ) -> "TrainingData":
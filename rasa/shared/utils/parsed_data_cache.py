@@ -0,0 +1,192 @@
+import functools
+import logging
+import os
+import pickle
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, TypeVar, Union
+
+import pkg_resources
+
+import rasa.shared.utils.io
+
+logger = logging.getLogger(__name__)
+
+PARSED_DATA_CACHE_LOCATION_ENV = "RASA_PARSED_DATA_CACHE_DIRECTORY"
+PARSED_DATA_CACHE_ENABLED_ENV = "RASA_PARSED_DATA_CACHE"
+# This must not be inside the cache directory of the training cache as that one
+# might be purged during training.
+DEFAULT_PARSED_DATA_CACHE_LOCATION = Path(".rasa", "parsed_data")
+
+T = TypeVar("T")
+
+# Maps a file path to its modification time, size and content hash.
+_content_hashes: Dict[Text, Tuple[int, int, Text]] = {}
+
+
+def is_enabled() -> bool:
+    """Checks whether parsed training data files should be cached.
+
+    Returns:
+        `False` if the cache was disabled using the `RASA_PARSED_DATA_CACHE`
+        environment variable, `True` otherwise.
+    """
+    return os.environ.get(PARSED_DATA_CACHE_ENABLED_ENV, "true").lower() != "false"
+
+
+def get_cache_location() -> Path:
+    """Returns the directory where parsed training data is cached."""
+    return Path(
+        os.environ.get(
+            PARSED_DATA_CACHE_LOCATION_ENV, DEFAULT_PARSED_DATA_CACHE_LOCATION
+        )
+    )
+
+
+def file_content_hash(filename: Union[Text, Path]) -> Text:
+    """Calculates the hash of a file's content.
+
+    The hash is re-used within the same process as long as the file's modification
+    time and size don't change.
+
+    Args:
+        filename: The file to hash.
+
+    Returns:
+        The hash of the file's content.
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+
+    known = _content_hashes.get(path)
+    if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        return known[2]
+
+    content_hash = rasa.shared.utils.io.get_text_hash(
+        rasa.shared.utils.io.read_file(path)
+    )
+    _content_hashes[path] = (stat.st_mtime_ns, stat.st_size, content_hash)
+    return content_hash
+
+
+def load_or_parse(filename: Union[Text, Path], parse: Callable[[], T], *key: Any) -> T:
+    """Loads the parsed content of a file from the cache or parses it.
+
+    Results are cached by the file's content, the Rasa version and `key`. Files
+    which cause warnings about their content are not cached so that the warnings are
+    shown every time they are read. Once a file changed, the cached results for its
+    previous content are deleted.
+
+    Args:
+        filename: The file which is parsed.
+        parse: Parses the file. It's only called if there is no cached result.
+        key: Additional values the parsed content depends on. They need to
+            return a stable string representation or fingerprint.
+
+    Returns:
+        The parsed file content.
+    """
+    rasa_version = _rasa_version()
+    if not is_enabled() or not rasa_version:
+        return parse()
+
+    path_key = rasa.shared.utils.io.deep_container_fingerprint(
+        os.path.abspath(filename)
+    )
+    content_key = rasa.shared.utils.io.deep_container_fingerprint(
+        [rasa_version, file_content_hash(filename)]
+    )
+    key_fingerprint = rasa.shared.utils.io.deep_container_fingerprint(list(key))
+    cache_file = (
+        get_cache_location() / f"{path_key}-{content_key}-{key_fingerprint}.pkl"
+    )
+
+    cached = _load(cache_file)
+    if cached is not None:
+        logger.debug(f"Loaded parsed content of '{filename}' from the cache.")
+        return cached
+
+    caught_warnings: List[warnings.WarningMessage] = []
+    try:
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            parsed = parse()
+    finally:
+        for warning in caught_warnings:
+            warnings.warn_explicit(
+                warning.message,
+                warning.category,
+                warning.filename,
+                warning.lineno,
+                source=warning.source,
+            )
+
+    if not any(_is_warning_about_data(warning) for warning in caught_warnings):
+        _delete_outdated(path_key, content_key)
+        _dump(cache_file, parsed)
+
+    return parsed
+
+
+def _delete_outdated(path_key: Text, content_key: Text) -> None:
+    """Deletes cached results of a file which were parsed from different content."""
+    for cache_file in get_cache_location().glob(f"{path_key}-*.pkl"):
+        if cache_file.name.startswith(f"{path_key}-{content_key}-"):
+            continue
+
+        try:
+            cache_file.unlink()
+            logger.debug(f"Deleted outdated cached content '{cache_file}'.")
+        except OSError as e:
+            # e.g. another process deleted it already
+            logger.debug(f"Failed to delete outdated cache file '{cache_file}': {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _rasa_version() -> Optional[Text]:
+    try:
+        return pkg_resources.get_distribution("rasa").version
+    except pkg_resources.DistributionNotFound:
+        logger.debug(
+            "Parsed training data won't be cached as the installed Rasa version is "
+            "unknown."
+        )
+        return None
+
+
+def _is_warning_about_data(warning: warnings.WarningMessage) -> bool:
+    # Rasa uses user and future warnings to point out problems with the training
+    # data. Other warnings (e.g. deprecation warnings of libraries) don't prevent
+    # caching.
+    return issubclass(warning.category, (UserWarning, FutureWarning))
+
+
+def _load(cache_file: Path) -> Optional[Any]:
+    if not cache_file.is_file():
+        return None
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)  # nosec
+    except Exception as e:
+        logger.debug(f"Failed to load cached content from '{cache_file}': {e}")
+        return None
+
+
+def _dump(cache_file: Path, parsed: Any) -> None:
+    temporary_file = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never see a
+        # partially written file.
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_file.parent, delete=False
+        ) as f:
+            temporary_file = f.name
+            pickle.dump(parsed, f)
+        os.replace(temporary_file, cache_file)
+    except Exception as e:
+        logger.debug(f"Failed to cache parsed content in '{cache_file}': {e}")
+        if temporary_file and os.path.exists(temporary_file):
+            os.remove(temporary_file)
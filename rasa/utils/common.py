@@ -110,9 +110,13 @@ class TempDirectoryPath(str, ContextManager):
             shutil.rmtree(self)
 
 
-def get_temp_dir_name() -> Text:
-    """Returns the path name of a newly created temporary directory."""
-    tempdir_name = tempfile.mkdtemp()
+def get_temp_dir_name(prefix: Optional[Text] = None) -> Text:
+    """Returns the path name of a newly created temporary directory.
+
+    Args:
+        prefix: Prefix of the directory name.
+    """
+    tempdir_name = tempfile.mkdtemp(prefix=prefix)
 
     return decode_bytes(tempdir_name)
 
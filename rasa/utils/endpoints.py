@@ -1,11 +1,13 @@
+import asyncio
 import ssl
+from dataclasses import asdict, dataclass
 
 import aiohttp
 import logging
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from typing import Any, Optional, Set, Text, Dict
 
 from rasa.shared.exceptions import FileNotFoundException
 import rasa.shared.utils.io
@@ -15,6 +17,10 @@ from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 0  # no limit
+DEFAULT_KEEPALIVE_TIMEOUT = 15  # in seconds
+
 
 def read_endpoint_config(
     filename: Text, endpoint_type: Text
@@ -71,6 +77,32 @@ def concat_url(base: Text, subpath: Optional[Text]) -> Text:
     return url + subpath
 
 
+@dataclass
+class ConnectionStats:
+    """Statistics about the connections of an `EndpointConfig`'s session.
+
+    Attributes:
+        requests: Number of requests which were sent.
+        connections_created: Number of connections which had to be established.
+        connections_reused: Number of requests which reused a pooled connection.
+    """
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Returns the share of requests which reused a pooled connection."""
+        if not self.requests:
+            return 0.0
+        return self.connections_reused / self.requests
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the statistics in a JSON serializable format."""
+        return {**asdict(self), "reuse_ratio": self.reuse_ratio}
+
+
 class EndpointConfig:
     """Configuration for an external HTTP endpoint."""
 
@@ -95,23 +127,173 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
         self.kwargs = kwargs
-
-    def session(self) -> aiohttp.ClientSession:
-        """Creates and returns a configured aiohttp client session."""
+        self._reset_pooled_session()
+
+    def _reset_pooled_session(self) -> None:
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._pooled_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # sessions of previous event loops which are still being closed
+        self._closing_sessions: Set[asyncio.Future] = set()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._connection_stats = ConnectionStats()
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # sessions are bound to an event loop and can't be copied or pickled
+        state = self.__dict__.copy()
+        for key in [
+            "_pooled_session",
+            "_pooled_session_loop",
+            "_closing_sessions",
+            "_ssl_context",
+            "_connection_stats",
+        ]:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_pooled_session()
+
+    def _auth(self) -> Optional[aiohttp.BasicAuth]:
         # create authentication parameters
         if self.basic_auth:
-            auth = aiohttp.BasicAuth(
+            return aiohttp.BasicAuth(
                 self.basic_auth["username"], self.basic_auth["password"]
             )
+        return None
+
+    def session(self) -> aiohttp.ClientSession:
+        """Creates and returns a configured aiohttp client session.
+
+        The caller is responsible for closing the session. Use `pooled_session` to
+        share connections across requests.
+        """
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            auth=self._auth(),
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+        )
+
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the long-lived client session of this endpoint.
+
+        The session keeps connections to the endpoint alive between requests. It is
+        created on first use for the running event loop and must not be closed by
+        the caller. Call `close` to release its connections. The session of a
+        previous event loop is closed when a new one is created.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._pooled_session is None
+            or self._pooled_session.closed
+            or self._pooled_session_loop is not loop
+        ):
+            self._close_previous_pooled_session()
+            self._pooled_session = self._create_pooled_session()
+            self._pooled_session_loop = loop
+
+        return self._pooled_session
+
+    def _close_previous_pooled_session(self) -> None:
+        session, loop = self._pooled_session, self._pooled_session_loop
+        self._pooled_session = None
+        self._pooled_session_loop = None
+        if session is None or session.closed:
+            return
+
+        closing: asyncio.Future
+        if loop is not None and not loop.is_closed() and loop.is_running():
+            # the session is still bound to an event loop in another thread
+            closing = asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            )
         else:
-            auth = None
+            # connections of a stopped event loop can be closed from any loop
+            closing = asyncio.ensure_future(session.close())
+
+        self._closing_sessions.add(closing)
+        closing.add_done_callback(self._closing_sessions.discard)
+
+    def _create_pooled_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=int(self.kwargs.get("max_connections", DEFAULT_MAX_CONNECTIONS)),
+            limit_per_host=int(
+                self.kwargs.get(
+                    "max_connections_per_host", DEFAULT_MAX_CONNECTIONS_PER_HOST
+                )
+            ),
+            keepalive_timeout=float(
+                self.kwargs.get("keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT)
+            ),
+        )
 
         return aiohttp.ClientSession(
+            connector=connector,
             headers=self.headers,
-            auth=auth,
+            auth=self._auth(),
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            trace_configs=[self._connection_trace_config()],
         )
 
+    def _connection_trace_config(self) -> aiohttp.TraceConfig:
+        stats = self._connection_stats
+
+        async def on_request_start(*_: Any) -> None:
+            stats.requests += 1
+
+        async def on_connection_create_end(*_: Any) -> None:
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(*_: Any) -> None:
+            stats.connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def connection_stats(self) -> ConnectionStats:
+        """Returns statistics about the connections of the pooled session."""
+        return ConnectionStats(**asdict(self._connection_stats))
+
+    async def close(self) -> None:
+        """Closes the pooled sessions and their connections."""
+        if self._pooled_session is not None and not self._pooled_session.closed:
+            logger.debug(
+                f"Closing connections to endpoint '{self.url}'. Connection "
+                f"statistics: {self._connection_stats.as_dict()}."
+            )
+
+        loop = asyncio.get_running_loop()
+        if self._pooled_session_loop is loop:
+            session = self._pooled_session
+            self._pooled_session = None
+            self._pooled_session_loop = None
+            if session is not None:
+                await session.close()
+        else:
+            self._close_previous_pooled_session()
+
+        closing = [f for f in self._closing_sessions if f.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing)
+
+    def _get_ssl_context(self) -> Optional[ssl.SSLContext]:
+        if not self.cafile:
+            return None
+
+        if self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context(cafile=self.cafile)
+            except FileNotFoundError as e:
+                raise FileNotFoundException(
+                    f"Failed to find certificate file, "
+                    f"'{os.path.abspath(self.cafile)}' does not exist."
+                ) from e
+
+        return self._ssl_context
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -137,7 +319,8 @@ class EndpointConfig:
     ) -> Optional[Any]:
         """Send a HTTP request to the endpoint. Return json response, if available.
 
-        All additional arguments will get passed through
+        Requests are sent with the endpoint's pooled session, so connections are
+        reused between requests. All additional arguments will get passed through
         to aiohttp's `session.request`.
         """
         # create the appropriate headers
@@ -151,34 +334,26 @@ class EndpointConfig:
 
         url = concat_url(self.url, subpath)
 
-        sslcontext = None
-        if self.cafile:
+        sslcontext = self._get_ssl_context()
+
+        session = self.pooled_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            compress=compress,
+            ssl=sslcontext,
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
             try:
-                sslcontext = ssl.create_default_context(cafile=self.cafile)
-            except FileNotFoundError as e:
-                raise FileNotFoundException(
-                    f"Failed to find certificate file, "
-                    f"'{os.path.abspath(self.cafile)}' does not exist."
-                ) from e
-
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                compress=compress,
-                ssl=sslcontext,
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
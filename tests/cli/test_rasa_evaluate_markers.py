@@ -68,7 +68,8 @@ def test_evaluate_markers_first_n_help(run: Callable[..., RunResult]):
     [--logging-config-file LOGGING_CONFIG_FILE]
     [--config CONFIG]
     [--no-stats | --stats-file-prefix [STATS_FILE_PREFIX]]
-    [--endpoints ENDPOINTS] [-d DOMAIN]
+    [-j JOBS] [--endpoints ENDPOINTS]
+    [-d DOMAIN]
     count output_filename"""
 
     lines = [line.strip() for line in help_text.split("\n")]
@@ -86,7 +87,8 @@ def test_evaluate_markers_sample_n_help(run: Callable[..., RunResult]):
     [--logging-config-file LOGGING_CONFIG_FILE]
     [--seed SEED] [--config CONFIG]
     [--no-stats | --stats-file-prefix [STATS_FILE_PREFIX]]
-    [--endpoints ENDPOINTS] [-d DOMAIN]
+    [-j JOBS] [--endpoints ENDPOINTS]
+    [-d DOMAIN]
     count output_filename"""  # noqa: E501
 
     lines = [line.strip() for line in help_text.split("\n")]
@@ -104,7 +106,7 @@ def test_evaluate_markers_all_help(run: Callable[..., RunResult]):
     [--logging-config-file LOGGING_CONFIG_FILE]
     [--config CONFIG]
     [--no-stats | --stats-file-prefix [STATS_FILE_PREFIX]]
-    [--endpoints ENDPOINTS] [-d DOMAIN]
+    [-j JOBS] [--endpoints ENDPOINTS] [-d DOMAIN]
     output_filename"""
 
     lines = [line.strip() for line in help_text.split("\n")]
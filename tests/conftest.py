@@ -4,6 +4,8 @@ import copy
 import os
 import random
 import re
+import shutil
+import tempfile
 import textwrap
 
 import jwt
@@ -58,6 +60,7 @@ import rasa.core.run
 from rasa.core.tracker_store import InMemoryTrackerStore, TrackerStore
 from rasa.model_training import train, train_nlu
 from rasa.shared.exceptions import RasaException
+from rasa.shared.utils.parsed_data_cache import PARSED_DATA_CACHE_LOCATION_ENV
 import rasa.utils.common
 import rasa.utils.io
 
@@ -726,6 +729,14 @@ def random_user_uttered_event(timestamp: Optional[float] = None) -> UserUttered:
     )
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    # Reading training data while collecting the tests would otherwise cache the
+    # parsed files in the `.rasa` directory of the working directory
+    parsed_data_cache_dir = tempfile.mkdtemp(prefix="parsed-data-cache-")
+    os.environ[PARSED_DATA_CACHE_LOCATION_ENV] = parsed_data_cache_dir
+    config.add_cleanup(lambda: shutil.rmtree(parsed_data_cache_dir, True))
+
+
 def pytest_runtest_setup(item: Function) -> None:
     if (
         "skip_on_windows" in [mark.name for mark in item.iter_markers()]
@@ -842,6 +853,9 @@ def use_temp_dir_for_cache(
     # cache.
     cache_dir = tmp_path_factory.mktemp(uuid.uuid4().hex)
     monkeypatch.setattr(LocalTrainingCache, "_get_cache_location", lambda: cache_dir)
+    monkeypatch.setenv(
+        PARSED_DATA_CACHE_LOCATION_ENV, str(tmp_path_factory.mktemp(uuid.uuid4().hex))
+    )
 
 
 @contextlib.contextmanager
@@ -538,6 +538,50 @@ async def test_markers_cli_results_save_correctly(tmp_path: Path):
         assert len(senders) == 5
 
 
+async def test_markers_are_extracted_in_parallel_processes(tmp_path: Path):
+    domain = Domain.empty()
+    store = InMemoryTrackerStore(domain)
+
+    for i in range(5):
+        tracker = DialogueStateTracker(str(i), None)
+        tracker.update_with_events([SlotSet(str(j), "slot") for j in range(5)], domain)
+        tracker.update(ActionExecuted(ACTION_SESSION_START_NAME))
+        tracker.update(UserUttered("hello"))
+        tracker.update_with_events(
+            [SlotSet(str(5 + j), "slot") for j in range(5)], domain
+        )
+        await store.save(tracker)
+
+    markers = OrMarker(
+        markers=[SlotSetMarker("2", name="marker1"), SlotSetMarker("7", name="marker2")]
+    )
+
+    outputs = []
+    for jobs in [1, 2]:
+        output_dir = tmp_path / str(jobs)
+        output_dir.mkdir()
+        await markers.evaluate_trackers(
+            MarkerTrackerLoader(store, "all").load(),
+            output_dir / "results.csv",
+            session_stats_file=output_dir / "session_stats.csv",
+            overall_stats_file=output_dir / "overall_stats.csv",
+            jobs=jobs,
+        )
+        outputs.append(
+            [
+                (output_dir / file_name).read_text()
+                for file_name in [
+                    "results.csv",
+                    "session_stats.csv",
+                    "overall_stats.csv",
+                ]
+            ]
+        )
+
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0][0].splitlines()) == 16
+
+
 def _collect_parameters(
     marker: Marker, condition_type: Type[ConditionMarker]
 ) -> Set[Text]:
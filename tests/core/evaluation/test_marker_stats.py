@@ -1,4 +1,5 @@
 import csv
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Text, Tuple
 import itertools
@@ -10,6 +11,7 @@ from rasa.core.evaluation.marker_stats import (
     EventMetaData,
     MarkerStatistics,
     compute_statistics,
+    compute_statistics_from_counts,
 )
 
 
@@ -31,6 +33,20 @@ def test_compute_statistics_simple_check():
     assert stats["median"] == 1.5  # this is no bug, it is a convention numpy follows
 
 
+@pytest.mark.parametrize(
+    "values",
+    [[], [3], [1, 2, 9, 0], [5, 5, 1], [2, 2, 2, 7, 7, 0, 1], list(range(20))],
+)
+def test_compute_statistics_from_counts(values: List[int]):
+    expected = compute_statistics(values)
+
+    actual = compute_statistics_from_counts(Counter(values))
+
+    assert list(actual.keys()) == list(expected.keys())
+    for stat_name, stat_value in expected.items():
+        assert actual[stat_name] == pytest.approx(stat_value, nan_ok=True)
+
+
 def _generate_random_example_for_one_session_and_one_marker(
     rng: np.random.Generator,
 ) -> Tuple[List[EventMetaData], List[int]]:
@@ -104,7 +120,7 @@ def _generate_random_examples(
 
 
 @pytest.mark.parametrize("seed", [2345, 5654, 2345234])
-def test_process_results_per_session(seed: int):
+def test_process_results_per_session(tmp_path: Path, seed: int):
     rng = np.random.default_rng(seed=seed)
 
     (
@@ -114,35 +130,82 @@ def test_process_results_per_session(seed: int):
     markers = sorted(preceding_user_turn_numbers_used_per_marker.keys())
     num_sessions = len(per_session_results)
 
-    stats = MarkerStatistics()
-    sender_ids = []
-    session_indices = []
-    for session_idx, results in enumerate(per_session_results):
-        sender_id = str(rng.choice(100))
-        session_idx = int(rng.choice(100))
-        stats.process(
-            session_idx=session_idx,
-            sender_id=sender_id,
-            meta_data_on_relevant_events_per_marker=results,
-        )
-        sender_ids.append(sender_id)
-        session_indices.append(session_idx)
+    tmp_file = tmp_path / "test.csv"
+    with tmp_file.open(mode="w") as f:
+        stats = MarkerStatistics(per_session_statistics=csv.writer(f))
+        sender_ids = []
+        session_indices = []
+        for session_idx, results in enumerate(per_session_results):
+            sender_id = str(rng.choice(100))
+            session_idx = int(rng.choice(100))
+            stats.process(
+                session_idx=session_idx,
+                sender_id=sender_id,
+                meta_data_on_relevant_events_per_marker=results,
+            )
+            sender_ids.append(sender_id)
+            session_indices.append(session_idx)
+
+            # the statistics are written as soon as the session is processed
+            f.flush()
+            with tmp_file.open(mode="r") as written:
+                rows = list(csv.DictReader(written))
+            assert {row["sender_id"] for row in rows[-len(markers) * 5 :]} == {
+                sender_id
+            }
 
     assert stats.num_sessions == len(per_session_results)
-    for marker in markers:
-        for idx in range(num_sessions):
+
+    with tmp_file.open(mode="r") as f:
+        rows = list(csv.DictReader(f))
+
+    # one row per session, marker and statistic
+    assert len(rows) == num_sessions * len(markers) * 5
+    rows_iter = iter(rows)
+    for idx in range(num_sessions):
+        for marker in markers:
             expected_stats = compute_statistics(
                 preceding_user_turn_numbers_used_per_marker[marker][idx]
             )
-            for stat_name, stat_value in expected_stats.items():
-                assert (
-                    pytest.approx(
-                        stats.session_results[marker][stat_name][idx], nan_ok=True
-                    )
-                    == stat_value
+            for stat_name in sorted(expected_stats):
+                row = next(rows_iter)
+                assert (row["sender_id"], row["session_idx"], row["marker"]) == (
+                    sender_ids[idx],
+                    str(session_indices[idx]),
+                    marker,
                 )
-    for idx in range(num_sessions):
-        assert stats.session_identifier[idx] == (sender_ids[idx], session_indices[idx])
+                assert row["statistic"] == (
+                    MarkerStatistics._add_num_user_turns_str_to(stat_name)
+                )
+                assert pytest.approx(float(row["value"]), nan_ok=True) == round(
+                    expected_stats[stat_name], 3
+                )
+
+
+def test_per_session_statistics_to_csv(tmp_path: Path):
+    rng = np.random.default_rng(seed=2345)
+    per_session_results, _ = _generate_random_examples(num_markers=3, rng=rng)
+
+    streamed_file = tmp_path / "streamed.csv"
+    with streamed_file.open(mode="w") as f:
+        streamed_stats = MarkerStatistics(per_session_statistics=csv.writer(f))
+        stats = MarkerStatistics()
+        for session_idx, results in enumerate(per_session_results):
+            for marker_stats in [streamed_stats, stats]:
+                marker_stats.process(
+                    session_idx=session_idx,
+                    sender_id="sender",
+                    meta_data_on_relevant_events_per_marker=results,
+                )
+
+    tmp_file = tmp_path / "test.csv"
+    stats.per_session_statistics_to_csv(path=tmp_file)
+
+    assert tmp_file.read_text() == streamed_file.read_text()
+    with pytest.raises(FileExistsError):
+        stats.per_session_statistics_to_csv(path=tmp_file)
+    with pytest.raises(RuntimeError):
+        streamed_stats.per_session_statistics_to_csv(path=tmp_path / "other.csv")
 
 
 @pytest.mark.parametrize("seed", [2345, 5654, 2345234])
@@ -176,7 +239,9 @@ def test_process_results_overall(seed: int):
                 preceding_user_turn_numbers_used_per_marker[marker]
             )
         )
-        assert stats.num_preceding_user_turns_collected[marker] == concatenated_numbers
+        assert stats.num_preceding_user_turns_counts[marker] == Counter(
+            concatenated_numbers
+        )
 
 
 @pytest.mark.parametrize("seed", [2345, 5654, 2345234])
@@ -243,7 +308,11 @@ def test_overall_statistics_to_csv(tmp_path: Path, seed: int):
 
     for marker_name in markers:
         statistics = compute_statistics(
-            stats.num_preceding_user_turns_collected[marker_name]
+            list(
+                itertools.chain.from_iterable(
+                    preceding_user_turn_numbers_used_per_marker[marker_name]
+                )
+            )
         )
         for stat_name, stat_value in statistics.items():
             assert rows[row_idx] == {
@@ -254,54 +323,3 @@ def test_overall_statistics_to_csv(tmp_path: Path, seed: int):
                 "value": str(round(stat_value, num_digits)),
             }
             row_idx += 1
-
-
-@pytest.mark.parametrize("seed", [2345, 5654, 2345234])
-def test_per_session_statistics_to_csv(tmp_path: Path, seed: int):
-
-    rng = np.random.default_rng(seed=seed)
-    (
-        per_session_results,
-        preceding_user_turn_numbers_used_per_marker,
-    ) = _generate_random_examples(
-        num_markers=3, rng=rng, num_sessions_min=10, num_sessions_max=20
-    )
-    markers = sorted(preceding_user_turn_numbers_used_per_marker.keys())
-
-    stats = MarkerStatistics()
-    for session_idx, results in enumerate(per_session_results):
-        stats.process(
-            session_idx=session_idx,
-            sender_id=str(rng.choice(100)),
-            meta_data_on_relevant_events_per_marker=results,
-        )
-
-    tmp_file = tmp_path / "test.csv"
-    stats.per_session_statistics_to_csv(path=tmp_file)
-
-    with tmp_file.open(mode="r") as f:
-        reader = csv.DictReader(f)
-        rows = [row for row in reader]
-
-    actual_information = {
-        (row["sender_id"], row["session_idx"], row["marker"], row["statistic"]): row[
-            "value"
-        ]
-        for row in rows
-    }
-    num_digits = 3
-    expected_information = {
-        (
-            sender_id,
-            str(session_idx),
-            marker_name,
-            MarkerStatistics._add_num_user_turns_str_to(stat_name),
-        ): str(value)
-        if np.isnan(value)
-        else str(round(value, num_digits))
-        for marker_name in markers
-        for stat_name, values in stats.session_results[marker_name].items()
-        for (sender_id, session_idx), value in zip(stats.session_identifier, values)
-    }
-
-    assert actual_information == expected_information
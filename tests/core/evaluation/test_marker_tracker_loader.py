@@ -140,3 +140,20 @@ async def test_warn_count_exceeds_store(marker_trackerstore: TrackerStore):
     with pytest.warns(UserWarning):
         # Need to force the generator to evaluate to produce the warning
         [tracker async for tracker in loader.load()]
+
+
+@pytest.mark.parametrize("prefetch", [1, 3, 10])
+async def test_load_keeps_order_of_keys(
+    marker_trackerstore: TrackerStore, prefetch: int
+):
+    loader = MarkerTrackerLoader(marker_trackerstore, STRATEGY_ALL, prefetch=prefetch)
+    result = [tracker async for tracker in loader.load()]
+
+    assert [tracker.sender_id for tracker in result] == list(
+        await marker_trackerstore.keys()
+    )
+
+
+def test_exception_zero_prefetch(marker_trackerstore: TrackerStore):
+    with pytest.raises(RasaException):
+        MarkerTrackerLoader(marker_trackerstore, STRATEGY_ALL, prefetch=0)
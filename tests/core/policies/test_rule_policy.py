@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Text, Callable, Dict, Any, Optional, cast
 
 import dataclasses
+import json
 import pytest
 
 from rasa.engine.graph import ExecutionContext
@@ -53,7 +54,7 @@ from rasa.shared.core.events import (
     FollowupAction,
 )
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule, RULES
+from rasa.core.policies.rule_policy import RulePolicy, InvalidRule, RULES, _RuleIndex
 from rasa.graph_components.providers.rule_only_provider import RuleOnlyDataProvider
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -815,6 +816,49 @@ def test_rule_policy_contradicting_rule_finetune(
         )
 
 
+def test_rule_index_candidates():
+    def rule_key(*states: Dict[Text, Any]) -> Text:
+        return json.dumps(list(states), sort_keys=True)
+
+    greet_rule = rule_key(
+        {
+            "prev_action": {"action_name": ACTION_LISTEN_NAME},
+            "user": {"intent": "greet"},
+        }
+    )
+    goodbye_rule = rule_key(
+        {
+            "prev_action": {"action_name": ACTION_LISTEN_NAME},
+            "user": {"intent": "goodbye"},
+        }
+    )
+    slot_rule = rule_key(
+        {"prev_action": {"action_name": "utter_greet"}, "slots": {"name": [1.0]}}
+    )
+    conversation_start_rule = rule_key({"user": {"intent": "greet"}})
+    rule_index = _RuleIndex(
+        {
+            greet_rule: "utter_greet",
+            goodbye_rule: "utter_goodbye",
+            slot_rule: ACTION_LISTEN_NAME,
+            conversation_start_rule: "utter_welcome",
+        }
+    )
+
+    assert rule_index.candidates(
+        {
+            "prev_action": {"action_name": ACTION_LISTEN_NAME},
+            "user": {"intent": "greet"},
+        }
+    ) == [greet_rule]
+    assert rule_index.candidates(
+        {"prev_action": {"action_name": "utter_greet"}, "slots": {"name": (1.0,)}}
+    ) == [slot_rule]
+    assert rule_index.candidates({"user": {"intent": "greet"}}) == [
+        conversation_start_rule
+    ]
+
+
 def test_faq_rule(policy: RulePolicy):
     domain = Domain.from_yaml(
         f"""
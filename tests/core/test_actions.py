@@ -246,6 +246,114 @@ async def test_remote_action_runs(
         }
 
 
+async def test_remote_action_sends_tracker_delta(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+):
+    url = "https://example.com/webhooks/delta_actions"
+    endpoint = EndpointConfig(url, enable_tracker_delta=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "delta-sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        first_request = json_of_latest_request(latest_request(mocked, "post", url))
+
+        tracker.update(ActionExecuted("my_action"))
+        tracker.update(UserUttered("bye"))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        second_request = json_of_latest_request(latest_request(mocked, "post", url))
+
+    assert first_request["events_offset"] == 0
+    assert len(first_request["tracker"]["events"]) == 2
+    assert first_request["domain"] == domain.as_dict()
+    assert first_request["domain_hash"] == domain.fingerprint()
+
+    assert second_request["events_offset"] == 2
+    assert second_request["tracker"]["events"] == [
+        event.as_dict() for event in list(tracker.events)[2:]
+    ]
+    assert second_request["tracker"]["latest_message"]["text"] == "bye"
+    assert "domain" not in second_request
+    assert second_request["domain_hash"] == domain.fingerprint()
+
+
+async def test_remote_action_sends_full_payload_on_tracker_delta_miss(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+):
+    url = "https://example.com/webhooks/delta_miss_actions"
+    endpoint = EndpointConfig(url, enable_tracker_delta=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events("delta-sender", [UserUttered("hi")])
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []})
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        tracker.update(UserUttered("bye"))
+        mocked.post(url, status=409, body="unknown conversation")
+        mocked.post(url, payload={"events": [SlotSet("name", "bot").as_dict()]})
+        result = await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        requests = [
+            request.kwargs["json"] for request in latest_request(mocked, "post", url)
+        ]
+
+    assert result == [SlotSet("name", "bot")]
+    delta_request, full_request = requests[1:]
+    assert delta_request["events_offset"] == 1
+    assert "domain" not in delta_request
+    assert full_request["events_offset"] == 0
+    assert len(full_request["tracker"]["events"]) == 2
+    assert full_request["domain"] == domain.as_dict()
+
+
+async def test_remote_action_sends_all_events_if_tracker_changed(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+):
+    url = "https://example.com/webhooks/delta_changed_actions"
+    endpoint = EndpointConfig(url, enable_tracker_delta=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        tracker = DialogueStateTracker.from_events(
+            "delta-sender", [UserUttered("hi"), UserUttered("there")]
+        )
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        # e.g. the tracker store only loaded the events of the latest session
+        tracker = DialogueStateTracker.from_events(
+            "delta-sender", [SessionStarted(), UserUttered("bye")]
+        )
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        request = json_of_latest_request(latest_request(mocked, "post", url))
+
+    assert request["events_offset"] == 0
+    assert len(request["tracker"]["events"]) == 2
+
+
+def test_tracker_delta_is_skipped_without_action_endpoint_url(domain: Domain):
+    endpoint = EndpointConfig(None, enable_tracker_delta=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events("delta-sender", [UserUttered("hi")])
+
+    request = remote_action._action_call_format(tracker, domain)
+
+    assert "events_offset" not in request
+    assert request["tracker"]["events"] == [event.as_dict() for event in tracker.events]
+
+
 async def test_remote_action_logs_events(
     default_channel: OutputChannel,
     default_nlg: NaturalLanguageGenerator,
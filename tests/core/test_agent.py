@@ -1,6 +1,7 @@
 import asyncio
 from http import HTTPStatus
 import json
+import time
 from pathlib import Path
 from typing import Any, Dict, Text, Callable, Optional
 from unittest.mock import patch
@@ -32,6 +33,7 @@ import rasa.utils.io
 from rasa.core import jobs
 from rasa.core.agent import Agent, load_agent
 from rasa.core.channels.channel import UserMessage
+from rasa.core.processor import MessageProcessor
 from rasa.shared.core.domain import Domain
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.utils.endpoints import EndpointConfig
@@ -348,6 +350,48 @@ async def test_agent_update_model(trained_core_model: Text, trained_nlu_model: T
     )
 
 
+async def test_agent_load_model_in_thread(
+    trained_core_model: Text, trained_nlu_model: Text
+):
+    agent = await load_agent(model_path=trained_core_model)
+    previous_processor = agent.processor
+
+    await agent.load_model_in_thread(trained_nlu_model, "new-fingerprint")
+
+    assert agent.processor is not previous_processor
+    assert agent.fingerprint == "new-fingerprint"
+    assert agent.domain is agent.processor.domain
+    assert agent.tracker_store.domain is agent.domain
+    assert (
+        agent.processor.model_metadata.predict_schema
+        != previous_processor.model_metadata.predict_schema
+    )
+
+
+async def test_agent_load_model_in_thread_does_not_block_event_loop(
+    trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    agent = Agent()
+    create_processor = agent._create_processor
+
+    def slow_create_processor(model_path: Text) -> MessageProcessor:
+        time.sleep(1)
+        return create_processor(model_path)
+
+    monkeypatch.setattr(agent, "_create_processor", slow_create_processor)
+
+    loading = asyncio.ensure_future(agent.load_model_in_thread(trained_rasa_model))
+    await asyncio.sleep(0.1)
+
+    # the event loop is free while the model is loaded and the agent still uses
+    # its previous (here: no) model
+    assert not loading.done()
+    assert agent.processor is None
+
+    await loading
+    assert agent.is_ready()
+
+
 async def test_parse_with_http_interpreter(trained_default_agent_model: Text):
     endpoints = AvailableEndpoints(nlu=EndpointConfig("https://interpreter.com"))
     agent = await load_agent(
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import logging
 import textwrap
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Callable, Dict, Union, Text, List, Optional, Type
+from unittest.mock import Mock
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -20,9 +22,18 @@ import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.file import FileEventBroker
-from rasa.core.brokers.kafka import KafkaEventBroker, KafkaProducerInitializationError
+from rasa.core.brokers.kafka import (
+    KafkaEventBroker,
+    KafkaProducerInitializationError,
+    OVERFLOW_POLICY_DROP_NEWEST,
+    OVERFLOW_POLICY_DROP_OLDEST,
+    OVERFLOW_POLICY_WAIT,
+)
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.core.tracker_store import InMemoryTrackerStore
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.events import Event, Restarted, SlotSet, UserUttered
 from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
@@ -172,6 +183,71 @@ async def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+def _stored_event_types(broker: SQLEventBroker) -> List[Text]:
+    with broker.session_scope() as session:
+        return [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+
+async def test_sql_broker_buffered_writes_full_buffer(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), buffer_size=3, flush_interval_in_seconds=60
+    )
+
+    for e in TEST_EVENTS[:2]:
+        broker.publish(e.as_dict())
+    await asyncio.sleep(0.05)
+    # the buffer isn't full yet
+    assert _stored_event_types(broker) == []
+
+    broker.publish(TEST_EVENTS[2].as_dict())
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if _stored_event_types(broker):
+            break
+
+    assert _stored_event_types(broker) == ["user", "slot", "restart"]
+    await broker.close()
+
+
+async def test_sql_broker_buffered_writes_after_flush_interval(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), buffer_size=100, flush_interval_in_seconds=0.01
+    )
+
+    broker.publish(TEST_EVENTS[0].as_dict())
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if _stored_event_types(broker):
+            break
+
+    assert _stored_event_types(broker) == ["user"]
+    await broker.close()
+
+
+async def test_sql_broker_writes_buffered_events_on_close(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), buffer_size=1000, flush_interval_in_seconds=60
+    )
+
+    events = TEST_EVENTS * 300
+    for e in events:
+        broker.publish(e.as_dict())
+    await broker.close()
+
+    assert _stored_event_types(broker) == [e.type_name for e in events]
+
+
+def test_sql_broker_buffered_without_event_loop(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"), buffer_size=10)
+
+    broker.publish(TEST_EVENTS[0].as_dict())
+
+    assert _stored_event_types(broker) == ["user"]
+
+
 async def test_file_broker_from_config(tmp_path: Path):
     # backslashes need to be encoded (windows...) otherwise we run into unicode issues
     path = str(tmp_path / "rasa_test_event.log").replace("\\", "\\\\")
@@ -304,6 +380,222 @@ async def test_kafka_broker_security_protocols(file: Text, exception: Exception)
         producer.list_topics("topic", timeout=1)
 
 
+class FakeKafkaProducer:
+    def __init__(self, connection_failures: int = 0) -> None:
+        self.connection_failures = connection_failures
+        self.produced: List[Dict[Text, Any]] = []
+        self._in_flight: List[Callable] = []
+
+    def list_topics(self, timeout: float) -> None:
+        if self.connection_failures:
+            self.connection_failures -= 1
+            raise confluent_kafka.KafkaException("Kafka is down.")
+
+    def produce(self, topic: Text, value: bytes, on_delivery: Callable, **_) -> None:
+        self.produced.append(json.loads(value))
+        self._in_flight.append(on_delivery)
+
+    def poll(self, timeout: float) -> int:
+        in_flight, self._in_flight = self._in_flight, []
+        for on_delivery in in_flight:
+            on_delivery(None, Mock())
+        return len(in_flight)
+
+    def flush(self, timeout: float) -> int:
+        self.poll(0)
+        return 0
+
+
+def _kafka_broker_with_fake_producer(
+    monkeypatch: MonkeyPatch, producer: FakeKafkaProducer, **kwargs: Any
+) -> KafkaEventBroker:
+    broker = KafkaEventBroker(
+        "localhost", security_protocol="PLAINTEXT", retry_delay_in_seconds=0, **kwargs
+    )
+    monkeypatch.setattr(broker, "_create_producer", lambda: producer)
+    return broker
+
+
+async def test_kafka_broker_publishes_in_background(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+
+    for i in range(3):
+        broker.publish({"sender_id": "test", "event": "user", "text": str(i)})
+
+    # nothing was handed to the producer yet as `publish` only queues the events
+    assert producer.produced == []
+    assert broker.publish_stats().queue_depth == 3
+
+    await broker.close()
+
+    assert [event["text"] for event in producer.produced] == ["0", "1", "2"]
+    stats = broker.publish_stats()
+    assert stats.queue_depth == 0
+    assert stats.produced_events == 3
+    assert stats.delivered_events == 3
+    assert stats.dropped_events == 0
+    assert 0 < stats.average_delivery_latency <= stats.max_delivery_latency
+    assert stats.as_dict()["average_delivery_latency"] == stats.average_delivery_latency
+
+
+@pytest.mark.parametrize(
+    "overflow_policy, expected_texts",
+    [
+        (OVERFLOW_POLICY_DROP_OLDEST, ["2", "3"]),
+        (OVERFLOW_POLICY_DROP_NEWEST, ["0", "1"]),
+    ],
+)
+async def test_kafka_broker_overflow_policy(
+    monkeypatch: MonkeyPatch,
+    caplog: LogCaptureFixture,
+    overflow_policy: Text,
+    expected_texts: List[Text],
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch,
+        producer,
+        publish_queue_size=2,
+        overflow_policy=overflow_policy,
+    )
+
+    for i in range(4):
+        broker.publish({"sender_id": "test", "event": "user", "text": str(i)})
+    await broker.close()
+
+    assert [event["text"] for event in producer.produced] == expected_texts
+    assert broker.publish_stats().dropped_events == 2
+    assert len([r for r in caplog.records if "publish queue is full" in r.message]) == 2
+
+
+async def test_kafka_broker_waits_for_free_space_by_default(monkeypatch: MonkeyPatch):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch, producer, publish_queue_size=1
+    )
+
+    assert broker.overflow_policy == OVERFLOW_POLICY_WAIT
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *[
+                broker.publish_async({"sender_id": "test", "text": str(i)})
+                for i in range(3)
+            ]
+        ),
+        timeout=5,
+    )
+    await broker.close()
+
+    assert len(producer.produced) == 3
+    assert broker.publish_stats().dropped_events == 0
+
+
+async def test_kafka_broker_publish_async_waits_for_free_space(
+    monkeypatch: MonkeyPatch,
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch,
+        producer,
+        publish_queue_size=1,
+        overflow_policy=OVERFLOW_POLICY_WAIT,
+    )
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *[
+                broker.publish_async({"sender_id": "test", "text": str(i)})
+                for i in range(5)
+            ]
+        ),
+        timeout=5,
+    )
+    await broker.close()
+
+    assert len(producer.produced) == 5
+    assert broker.publish_stats().dropped_events == 0
+
+
+async def test_kafka_broker_retries_connection_without_blocking_event_loop(
+    monkeypatch: MonkeyPatch,
+):
+    producer = FakeKafkaProducer(connection_failures=2)
+    broker = _kafka_broker_with_fake_producer(monkeypatch, producer)
+    # the synchronous path would sleep for 5 seconds between retries
+    broker.retry_delay_in_seconds = 0.01
+
+    broker.publish({"sender_id": "test", "event": "user", "text": "hi"})
+    started = asyncio.get_running_loop().time()
+    await asyncio.sleep(0)
+    # the event loop continues to run while the broker tries to reconnect
+    assert asyncio.get_running_loop().time() - started < 1
+
+    await broker.close()
+
+    assert producer.connection_failures == 0
+    assert [event["text"] for event in producer.produced] == ["hi"]
+
+
+async def test_kafka_broker_publish_async_applies_overflow_policy(
+    monkeypatch: MonkeyPatch,
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch,
+        producer,
+        publish_queue_size=2,
+        overflow_policy=OVERFLOW_POLICY_DROP_OLDEST,
+    )
+
+    for i in range(4):
+        await broker.publish_async({"sender_id": "test", "text": str(i)})
+    await broker.close()
+
+    assert [event["text"] for event in producer.produced] == ["2", "3"]
+    assert broker.publish_stats().dropped_events == 2
+
+
+async def test_tracker_store_streams_events_with_publish_async(
+    monkeypatch: MonkeyPatch, domain: Domain
+):
+    producer = FakeKafkaProducer()
+    broker = _kafka_broker_with_fake_producer(
+        monkeypatch,
+        producer,
+        publish_queue_size=1,
+        overflow_policy=OVERFLOW_POLICY_WAIT,
+    )
+    tracker_store = InMemoryTrackerStore(domain, event_broker=broker)
+    tracker = DialogueStateTracker.from_events(
+        "test", [UserUttered(str(i)) for i in range(5)]
+    )
+
+    # the tracker store waits for the queue instead of dropping events
+    await asyncio.wait_for(tracker_store.save(tracker), timeout=5)
+    await broker.close()
+
+    assert [event["text"] for event in producer.produced] == [str(i) for i in range(5)]
+    assert broker.publish_stats().dropped_events == 0
+
+
+def test_kafka_broker_with_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        KafkaEventBroker("localhost", overflow_policy="block")
+
+
+def test_kafka_broker_producer_batching_config():
+    broker = KafkaEventBroker(
+        "localhost", security_protocol="PLAINTEXT", linger_ms=50, batch_num_messages=7
+    )
+
+    config = broker._get_kafka_config()
+
+    assert config["linger.ms"] == 50
+    assert config["batch.num.messages"] == 7
+
+
 @pytest.mark.flaky
 async def test_no_pika_logs_if_no_debug_mode(caplog: LogCaptureFixture):
     """
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional, Text
+
+import pytest
+
+from rasa.core.inference_executor import (
+    InferenceExecutor,
+    InferenceExecutorError,
+    InlineInferenceExecutor,
+    ThreadPoolInferenceExecutor,
+)
+from rasa.engine.runner.interface import GraphRunner
+from rasa.utils.endpoints import EndpointConfig
+
+
+class SlowGraphRunner(GraphRunner):
+    def __init__(self, duration: float = 0.0) -> None:
+        self.duration = duration
+        self.threads: List[Text] = []
+
+    @classmethod
+    def create(cls, *args: Any, **kwargs: Any) -> "SlowGraphRunner":
+        return cls()
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.duration)
+        return {target: inputs["x"] for target in targets}
+
+
+class CustomInferenceExecutor(InlineInferenceExecutor):
+    def __init__(self, endpoint_config: EndpointConfig) -> None:
+        super().__init__()
+        self.endpoint_config = endpoint_config
+
+
+@pytest.mark.parametrize(
+    "endpoint_config, expected_class",
+    [
+        (None, InlineInferenceExecutor),
+        (EndpointConfig(type="inline"), InlineInferenceExecutor),
+        (EndpointConfig(type="thread", max_workers=2), ThreadPoolInferenceExecutor),
+        (
+            EndpointConfig(type=f"{__name__}.{CustomInferenceExecutor.__name__}"),
+            CustomInferenceExecutor,
+        ),
+    ],
+)
+def test_create_inference_executor(
+    endpoint_config: Optional[EndpointConfig], expected_class: type
+):
+    executor = InferenceExecutor.create(endpoint_config)
+
+    assert isinstance(executor, expected_class)
+    executor.shutdown()
+
+
+def test_create_inference_executor_passes_through_executor():
+    executor = InlineInferenceExecutor()
+
+    assert InferenceExecutor.create(executor) is executor
+
+
+def test_create_inference_executor_with_nlu_batching():
+    executor = InferenceExecutor.create(
+        EndpointConfig(type="thread", nlu_batch_size=8, nlu_batch_max_wait_time=0.01)
+    )
+
+    assert executor.nlu_batch_size == 8
+    assert executor.nlu_batch_max_wait_time == 0.01
+    executor.shutdown()
+
+
+def test_create_inference_executor_with_invalid_batch_size():
+    with pytest.raises(InferenceExecutorError):
+        InferenceExecutor.create(EndpointConfig(type="inline", nlu_batch_size=0))
+
+
+def test_create_inference_executor_with_unknown_module():
+    with pytest.raises(InferenceExecutorError):
+        InferenceExecutor.create(EndpointConfig(type="some.unknown.Executor"))
+
+
+def test_create_thread_executor_without_workers():
+    with pytest.raises(InferenceExecutorError):
+        ThreadPoolInferenceExecutor(max_workers=0)
+
+
+async def test_inline_executor_runs_on_event_loop_thread():
+    runner = SlowGraphRunner()
+    executor = InlineInferenceExecutor()
+
+    result = await executor.run(runner, inputs={"x": 1}, targets=["a"])
+
+    assert result == {"a": 1}
+    assert runner.threads == [threading.current_thread().name]
+    assert executor.stats().completed_runs == 1
+
+
+async def test_thread_executor_does_not_block_event_loop():
+    runner = SlowGraphRunner(duration=0.2)
+    executor = ThreadPoolInferenceExecutor(max_workers=1)
+    heartbeats = []
+
+    async def heartbeat() -> None:
+        for _ in range(5):
+            heartbeats.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    result, _ = await asyncio.gather(
+        executor.run(runner, inputs={"x": 2}, targets=["b"]), heartbeat()
+    )
+    executor.shutdown()
+
+    assert result == {"b": 2}
+    assert len(heartbeats) == 5
+    # the heartbeat was not blocked for the duration of the graph run
+    assert heartbeats[-1] - heartbeats[0] < 0.2
+    assert runner.threads[0].startswith("rasa_inference")
+
+
+async def test_thread_executor_records_queue_depth_and_wait_time():
+    runner = SlowGraphRunner(duration=0.05)
+    executor = ThreadPoolInferenceExecutor(max_workers=1)
+
+    runs = [
+        asyncio.ensure_future(executor.run(runner, inputs={"x": i}, targets=["c"]))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    stats_while_running = executor.stats()
+
+    results = await asyncio.gather(*runs)
+    stats = executor.stats()
+    executor.shutdown()
+
+    assert [result["c"] for result in results] == [0, 1, 2]
+    assert stats_while_running.in_flight == 1
+    assert stats_while_running.queue_depth == 2
+
+    assert stats.queue_depth == 0
+    assert stats.in_flight == 0
+    assert stats.completed_runs == 3
+    # the last run had to wait for the two runs before it
+    assert stats.max_wait_time >= 0.09
+    assert 0 < stats.average_wait_time <= stats.max_wait_time
+    assert stats.as_dict()["average_wait_time"] == stats.average_wait_time
@@ -35,8 +35,11 @@ class FakeRedisLockStore(RedisLockStore):
     # noinspection PyMissingConstructor
     def __init__(self):
         import fakeredis
+        import fakeredis.aioredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        server = fakeredis.FakeServer()
+        self.red = fakeredis.FakeStrictRedis(server=server)
+        self.async_red = fakeredis.aioredis.FakeRedis(server=server)
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -331,6 +334,33 @@ async def test_acquire_lock_debug_message(
     )
 
 
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_waiting_ticket_is_notified_when_lock_is_released(lock_store: LockStore):
+    conversation_id = "test_waiting_ticket_is_notified_when_lock_is_released"
+    # the waiting ticket shouldn't rely on polling the lock
+    wait_time_in_seconds = 10
+    released_at = []
+    acquired_at = []
+
+    async def first_task() -> None:
+        async with lock_store.lock(
+            conversation_id, wait_time_in_seconds=wait_time_in_seconds
+        ):
+            await asyncio.sleep(0.1)
+        released_at.append(time.perf_counter())
+
+    async def second_task() -> None:
+        async with lock_store.lock(
+            conversation_id, wait_time_in_seconds=wait_time_in_seconds
+        ):
+            acquired_at.append(time.perf_counter())
+
+    await asyncio.wait_for(asyncio.gather(first_task(), second_task()), timeout=5)
+
+    assert acquired_at[0] - released_at[0] < 0.5
+    assert lock_store.get_lock(conversation_id) is None
+
+
 async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
     import redis.exceptions
 
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Text
+
+import pytest
+
+from rasa.core.channels.channel import UserMessage
+from rasa.core.inference_executor import InlineInferenceExecutor
+from rasa.core.nlu_batcher import NLUMessageBatcher
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.exceptions import GraphRunError
+from rasa.engine.graph import GraphSchema, SchemaNode
+from rasa.engine.runner.interface import GraphRunner
+from rasa.graph_components.converters.nlu_message_converter import (
+    NLUMessageConverter,
+)
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+
+NLU_TARGET = "nlu_target"
+
+
+class ParsingGraphRunner(GraphRunner):
+    def __init__(self, drop_messages: bool = False) -> None:
+        self.batches: List[List[Text]] = []
+        self.drop_messages = drop_messages
+
+    @classmethod
+    def create(cls, *args: Any, **kwargs: Any) -> "ParsingGraphRunner":
+        return cls()
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        messages = inputs[PLACEHOLDER_MESSAGE]
+        self.batches.append([message.text for message in messages])
+        if self.drop_messages:
+            messages = messages[1:]
+        return {
+            NLU_TARGET: [Message({TEXT: message.text.upper()}) for message in messages]
+        }
+
+
+def _create_batcher(
+    runner: GraphRunner, max_batch_size: int = 3, max_wait_time: float = 0.01
+) -> NLUMessageBatcher:
+    return NLUMessageBatcher(
+        InlineInferenceExecutor(),
+        runner,
+        NLU_TARGET,
+        max_batch_size=max_batch_size,
+        max_wait_time=max_wait_time,
+    )
+
+
+async def test_concurrent_messages_are_parsed_in_one_batch():
+    runner = ParsingGraphRunner()
+    batcher = _create_batcher(runner, max_batch_size=5)
+
+    parsed = await asyncio.gather(
+        *[batcher.parse(UserMessage(text)) for text in ["a", "b", "c"]]
+    )
+
+    assert [message.get(TEXT) for message in parsed] == ["A", "B", "C"]
+    assert runner.batches == [["a", "b", "c"]]
+
+
+async def test_full_batch_is_parsed_without_waiting():
+    runner = ParsingGraphRunner()
+    batcher = _create_batcher(runner, max_batch_size=2, max_wait_time=60)
+
+    parsed = await asyncio.wait_for(
+        asyncio.gather(*[batcher.parse(UserMessage(text)) for text in ["a", "b"]]),
+        timeout=1,
+    )
+
+    assert [message.get(TEXT) for message in parsed] == ["A", "B"]
+    assert runner.batches == [["a", "b"]]
+
+
+async def test_messages_are_split_into_batches_of_max_size():
+    runner = ParsingGraphRunner()
+    batcher = _create_batcher(runner, max_batch_size=2)
+
+    parsed = await asyncio.gather(
+        *[batcher.parse(UserMessage(text)) for text in ["a", "b", "c"]]
+    )
+
+    assert [message.get(TEXT) for message in parsed] == ["A", "B", "C"]
+    assert runner.batches == [["a", "b"], ["c"]]
+
+
+async def test_errors_are_propagated_to_every_caller():
+    runner = ParsingGraphRunner(drop_messages=True)
+    batcher = _create_batcher(runner)
+
+    results = await asyncio.gather(
+        *[batcher.parse(UserMessage(text)) for text in ["a", "b"]],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, GraphRunError) for result in results)
+
+
+@pytest.mark.parametrize(
+    "needs, expected",
+    [
+        ({"messages": PLACEHOLDER_MESSAGE}, True),
+        ({"tracker": PLACEHOLDER_TRACKER}, False),
+    ],
+)
+def test_supports_batching(needs: Dict[Text, Text], expected: bool):
+    schema = GraphSchema(
+        {
+            NLU_TARGET: SchemaNode(
+                needs=needs,
+                uses=NLUMessageConverter,
+                constructor_name="create",
+                fn="convert_user_message",
+                config={},
+            ),
+            "core_target": SchemaNode(
+                needs={"tracker": PLACEHOLDER_TRACKER},
+                uses=NLUMessageConverter,
+                constructor_name="create",
+                fn="convert_user_message",
+                config={},
+            ),
+        }
+    )
+
+    assert NLUMessageBatcher.supports_batching(schema, NLU_TARGET) == expected
@@ -1,3 +1,4 @@
+import json
 import uuid
 from pathlib import Path
 from typing import Type, List, Text, Optional, Dict, Any
@@ -21,6 +22,7 @@ from rasa.shared.core.events import (
     EntitiesAdded,
     SlotSet,
 )
+import rasa.shared.utils.io
 from rasa.core import training
 from rasa.core.constants import POLICY_MAX_HISTORY
 from rasa.core.featurizers.tracker_featurizers import (
@@ -35,7 +37,13 @@ from rasa.core.featurizers.single_state_featurizer import (
 from rasa.core.policies.policy import SupportedData, InvalidPolicyConfig, Policy
 from rasa.core.policies.rule_policy import RulePolicy
 from rasa.core.policies.ted_policy import TEDPolicy
-from rasa.core.policies.memoization import AugmentedMemoizationPolicy, MemoizationPolicy
+from rasa.core.policies.memoization import (
+    FEATURE_KEY_FORMAT_HASHED,
+    FEATURE_KEY_FORMAT_JSON,
+    AugmentedMemoizationPolicy,
+    FeatureKeyEncoder,
+    MemoizationPolicy,
+)
 
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -415,6 +423,65 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain, None)
         assert recalled is not None
 
+    def test_hashed_feature_keys_after_load(
+        self,
+        trained_policy: MemoizationPolicy,
+        resource: Resource,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+    ):
+        loaded_policy = trained_policy.__class__.load(
+            trained_policy.config, model_storage, resource, execution_context
+        )
+
+        assert loaded_policy.feature_key_format == FEATURE_KEY_FORMAT_HASHED
+        assert loaded_policy.lookup == trained_policy.lookup
+
+        tracker = tracker_from_dialogue(TEST_DEFAULT_DIALOGUE, default_domain)
+        states = trained_policy._prediction_states(tracker, default_domain)
+        assert loaded_policy._create_feature_key(
+            states
+        ) == trained_policy._create_feature_key(states)
+
+    def test_load_model_with_json_feature_keys(
+        self,
+        trained_policy: MemoizationPolicy,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        # models trained with older versions only persisted json feature keys
+        trained_policy.feature_key_format = FEATURE_KEY_FORMAT_JSON
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        (
+            all_states,
+            all_actions,
+        ) = trained_policy.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+        legacy_lookup = trained_policy._create_lookup_from_states(
+            all_states, all_actions
+        )
+        trained_policy.feature_key_format = FEATURE_KEY_FORMAT_HASHED
+
+        legacy_resource = Resource(uuid.uuid4().hex)
+        with model_storage.write_to(legacy_resource) as path:
+            trained_policy.featurizer.persist(path)
+            rasa.shared.utils.io.dump_obj_as_json_to_file(
+                path / trained_policy._metadata_filename(), {"lookup": legacy_lookup}
+            )
+
+        loaded_policy = trained_policy.__class__.load(
+            trained_policy.config, model_storage, legacy_resource, execution_context
+        )
+
+        assert loaded_policy.feature_key_format == FEATURE_KEY_FORMAT_JSON
+        for tracker, states, actions in zip(trackers, all_states, all_actions):
+            recalled = loaded_policy.recall(states, tracker, default_domain, None)
+            assert recalled == actions[0]
+
     def test_finetune_after_load(
         self,
         trained_policy: MemoizationPolicy,
@@ -1035,3 +1102,38 @@ def test_get_training_trackers_for_policy(
 
     assert len(rule_trackers) == n_rule_trackers
     assert len(ml_trackers) == n_ml_trackers
+
+
+def test_feature_key_encoder_ignores_order_of_features():
+    encoder = FeatureKeyEncoder()
+    states = [
+        {},
+        {"user": {"intent": "greet", "entities": ("name",)}, "slots": {"name": (1.0,)}},
+    ]
+    encoder.intern_features(states)
+
+    reordered_states = [
+        {},
+        {"slots": {"name": (1.0,)}, "user": {"entities": ("name",), "intent": "greet"}},
+    ]
+
+    assert encoder.encode(states) == encoder.encode(reordered_states)
+    # the features are the same but they belong to different states
+    assert encoder.encode(states) != encoder.encode(list(reversed(states)))
+
+
+def test_feature_key_encoder_with_unknown_feature():
+    encoder = FeatureKeyEncoder()
+    encoder.intern_features([{"user": {"intent": "greet"}}])
+
+    assert encoder.encode([{"user": {"intent": "goodbye"}}]) is None
+
+
+def test_feature_key_encoder_from_persisted_features():
+    encoder = FeatureKeyEncoder()
+    states = [{"user": {"intent": "greet", "entities": ("name",)}}]
+    encoder.intern_features(states)
+
+    persisted = json.loads(json.dumps(encoder.as_list()))
+
+    assert FeatureKeyEncoder(persisted).encode(states) == encoder.encode(states)
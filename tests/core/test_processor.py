@@ -70,7 +70,8 @@ from rasa.shared.core.events import (
     LoopInterrupted,
 )
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
-from rasa.core.processor import MessageProcessor
+from rasa.core.inference_executor import ThreadPoolInferenceExecutor
+from rasa.core.processor import WARM_UP_SENDER_ID, MessageProcessor
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.constants import INTENT_NAME_KEY, METADATA_MODEL_ID
 from rasa.shared.nlu.training_data.message import Message
@@ -105,6 +106,61 @@ async def test_message_processor(
     }
 
 
+async def test_message_processor_with_thread_inference_executor(
+    default_channel: CollectingOutputChannel,
+    default_processor: MessageProcessor,
+    monkeypatch: MonkeyPatch,
+):
+    executor = ThreadPoolInferenceExecutor(max_workers=2)
+    monkeypatch.setattr(default_processor, "inference_executor", executor)
+
+    await default_processor.handle_message(
+        UserMessage('/greet{"name":"Core"}', default_channel, "thread_executor")
+    )
+    executor.shutdown()
+
+    assert default_channel.latest_output() == {
+        "recipient_id": "thread_executor",
+        "text": "hey there Core!",
+    }
+    stats = executor.stats()
+    assert stats.completed_runs >= 1
+    assert stats.queue_depth == 0
+    assert stats.in_flight == 0
+
+
+async def test_warm_up(default_processor: MessageProcessor, monkeypatch: MonkeyPatch):
+    run = MagicMock(wraps=default_processor.graph_runner.run)
+    monkeypatch.setattr(default_processor.graph_runner, "run", run)
+
+    default_processor.warm_up()
+
+    run.assert_called_once()
+    assert run.call_args.kwargs["targets"] == [
+        default_processor.model_metadata.nlu_target,
+        default_processor.model_metadata.core_target,
+    ]
+    # the warm-up conversation isn't stored
+    assert WARM_UP_SENDER_ID not in await default_processor.tracker_store.keys()
+
+
+def test_warm_up_failure_is_logged(
+    default_processor: MessageProcessor,
+    monkeypatch: MonkeyPatch,
+    caplog: LogCaptureFixture,
+):
+    monkeypatch.setattr(
+        default_processor.graph_runner,
+        "run",
+        MagicMock(side_effect=ValueError("oh no")),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        default_processor.warm_up()
+
+    assert "Failed to warm up model" in caplog.text
+
+
 async def test_message_id_logging(default_processor: MessageProcessor):
     message = UserMessage("If Meg was an egg would she still have a leg?")
     tracker = DialogueStateTracker("1", [])
@@ -1497,6 +1553,30 @@ async def test_parse_message_nlu_only(trained_moodbot_nlu_path: Text):
     assert result["intent"]["name"]
 
 
+async def test_parse_messages_gives_same_results_as_parse_message(
+    trained_moodbot_nlu_path: Text,
+):
+    processor = Agent.load(model_path=trained_moodbot_nlu_path).processor
+    texts = ["Hello", "/greet", "I am sad", "good", "bye", "hi"]
+    expected = [
+        await processor.parse_message(UserMessage(text), only_output_properties=False)
+        for text in texts
+    ]
+
+    results = await processor.parse_messages(
+        [UserMessage(text) for text in texts], only_output_properties=False
+    )
+
+    assert [result["intent"]["name"] for result in results] == [
+        result["intent"]["name"] for result in expected
+    ]
+    for result, expected_result in zip(results, expected):
+        assert result["intent"]["confidence"] == pytest.approx(
+            expected_result["intent"]["confidence"]
+        )
+        assert result["entities"] == expected_result["entities"]
+
+
 async def test_parse_message_core_only(trained_core_model: Text):
     processor = Agent.load(model_path=trained_core_model).processor
     message = UserMessage("/greet")
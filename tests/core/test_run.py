@@ -9,7 +9,9 @@ from asyncio import AbstractEventLoop
 from pathlib import Path
 from rasa.core import run
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.core.channels.callback import CallbackInput
 from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 
 CREDENTIALS_FILE = "data/test_moodbot/credentials.yml"
 
@@ -81,9 +83,26 @@ async def test_load_agent_on_start_with_bad_model_file(
 async def test_close_resources(loop: AbstractEventLoop):
     broker = SQLEventBroker()
     app = Mock()
+    app.ctx.input_channels = []
     app.ctx.agent.tracker_store.event_broker = broker
+    action_endpoint = EndpointConfig("https://example.com/webhook")
+    app.ctx.agent.http_endpoints.return_value = {"action_endpoint": action_endpoint}
+    session = action_endpoint.pooled_session()
 
     with pytest.warns(None) as warnings:
         await run.close_resources(app, loop)
 
     assert len(warnings) == 0
+    assert session.closed
+
+
+async def test_close_resources_closes_callback_endpoint(loop: AbstractEventLoop):
+    callback_endpoint = EndpointConfig("https://example.com/callback")
+    app = Mock()
+    app.ctx.agent = None
+    app.ctx.input_channels = [CallbackInput(callback_endpoint)]
+    session = callback_endpoint.pooled_session()
+
+    await run.close_resources(app, loop)
+
+    assert session.closed
@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 import fakeredis
+import fakeredis.aioredis
 import pytest
 import sqlalchemy
 import uuid
@@ -18,13 +19,26 @@ from moto import mock_dynamodb
 from pymongo.errors import OperationFailure
 
 from rasa.core.agent import Agent
+from rasa.core.brokers.broker import EventBroker
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
 from rasa.shared.constants import DEFAULT_SENDER_ID
 from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
-from typing import Any, Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+    Text,
+    Type,
+    Dict,
+    Iterator,
+    List,
+    Union,
+    Optional,
+    ContextManager,
+)
 from unittest.mock import MagicMock, Mock
 
 import rasa.core.tracker_store
@@ -49,13 +63,24 @@ from rasa.core.tracker_store import (
     TrackerStore,
     InMemoryTrackerStore,
     RedisTrackerStore,
+    AsyncRedisTrackerStore,
     DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
+    MONGO_NUMBER_OF_EVENTS_KEY,
+    MONGO_SESSION_START_KEY,
     SQLTrackerStore,
+    AsyncSQLTrackerStore,
     DynamoTrackerStore,
+    SessionDynamoTrackerStore,
     FailSafeTrackerStore,
     AwaitableTrackerStore,
+    CachedTrackerStore,
+    TrackerDivergedException,
+)
+from rasa.shared.core.trackers import (
+    DialogueStateTracker,
+    EventVerbosity,
+    TrackerEventDiffEngine,
 )
-from rasa.shared.core.trackers import DialogueStateTracker, TrackerEventDiffEngine
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
 from tests.conftest import AsyncMock
@@ -110,6 +135,104 @@ async def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+@pytest.fixture
+def session_dynamo_tracker_store() -> Iterator[SessionDynamoTrackerStore]:
+    with mock_dynamodb():
+        yield SessionDynamoTrackerStore(test_domain)
+
+
+async def test_session_dynamo_tracker_store_retrieve(
+    session_dynamo_tracker_store: SessionDynamoTrackerStore,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+):
+    tracker_store = session_dynamo_tracker_store
+    sender_id = tracker_with_restarted_event.sender_id
+
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    # like the other tracker stores, the latest session starts with `SessionStarted`
+    assert list(tracker.events) == events_after_restart[1:]
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events)
+
+    # one item per session
+    items = tracker_store.db.scan()["Items"]
+    assert [int(item["session_number"]) for item in items] == [0, 1]
+    assert list(await tracker_store.keys()) == [sender_id]
+    assert await tracker_store.retrieve("unknown") is None
+
+
+@pytest.mark.parametrize("retrieve_full_tracker", [True, False])
+async def test_session_dynamo_tracker_store_appends_only_new_events(
+    session_dynamo_tracker_store: SessionDynamoTrackerStore,
+    tracker_with_restarted_event: DialogueStateTracker,
+    retrieve_full_tracker: bool,
+):
+    tracker_store = session_dynamo_tracker_store
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    if retrieve_full_tracker:
+        tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    else:
+        tracker = await tracker_store.retrieve(sender_id)
+    new_events = [
+        BotUttered("Hey! How can I help you?", timestamp=14.5),
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=15),
+        SessionStarted(timestamp=16),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=17),
+    ]
+    tracker.update_with_events(new_events, test_domain, override_timestamp=False)
+    await tracker_store.save(tracker)
+    # saving the same tracker again doesn't store anything
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        list(tracker_with_restarted_event.events) + new_events
+    )
+
+    latest_session = await tracker_store.retrieve(sender_id)
+    assert list(latest_session.events) == new_events[2:]
+
+
+async def test_session_dynamo_tracker_store_replaces_diverged_sessions(
+    session_dynamo_tracker_store: SessionDynamoTrackerStore,
+    tracker_with_restarted_event: DialogueStateTracker,
+):
+    tracker_store = session_dynamo_tracker_store
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    # e.g. the events of the conversation were replaced using the HTTP API
+    replaced_events = [
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=20),
+        SessionStarted(timestamp=21),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=22),
+        UserUttered("hello again", timestamp=23),
+    ]
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, replaced_events)
+    )
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == replaced_events
+    items = tracker_store.db.scan()["Items"]
+    assert [int(item["session_number"]) for item in items] == [0]
+    assert int(items[0]["number_of_events"]) == len(replaced_events)
+
+
+@mock_dynamodb
+def test_session_dynamo_tracker_store_with_table_without_sessions():
+    DynamoTrackerStore(test_domain, table_name="states")
+
+    with pytest.raises(RasaException):
+        SessionDynamoTrackerStore(test_domain, table_name="states")
+
+
 async def test_restart_after_retrieval_from_tracker_store(domain: Domain):
     store = InMemoryTrackerStore(domain)
     tr = await store.get_or_create_tracker("myuser")
@@ -710,6 +833,137 @@ async def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+def test_create_async_sql_tracker_store_from_endpoint_config(
+    domain: Domain, tmp_path: Path
+):
+    store = EndpointConfig(type="async_sql", db=str(tmp_path / "rasa.db"))
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, AsyncSQLTrackerStore)
+
+
+async def test_async_sql_tracker_store_retrieve(
+    domain: Domain,
+    tmp_path: Path,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = AsyncSQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    sender_id = tracker_with_restarted_event.sender_id
+
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:]
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events)
+
+    assert await tracker_store.retrieve("unknown") is None
+    assert list(await tracker_store.keys()) == [sender_id]
+
+
+async def test_async_sql_tracker_store_retries_save_after_concurrent_save(
+    domain: Domain, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    db = str(tmp_path / "rasa.db")
+    tracker_store = AsyncSQLTrackerStore(domain, db=db)
+    other_tracker_store = AsyncSQLTrackerStore(domain, db=db)
+    tracker = DialogueStateTracker.from_events(
+        "test", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    conversation_session = tracker_store._conversation_session
+    concurrent_saves = []
+
+    def conversation_session_with_concurrent_save(
+        session: Any, sender_id: Text
+    ) -> AsyncSQLTrackerStore.SQLConversationSession:
+        result = conversation_session(session, sender_id)
+        if not concurrent_saves:
+            # another process saves the conversation after it was read
+            concurrent_saves.append(other_tracker_store._save(tracker))
+        return result
+
+    monkeypatch.setattr(
+        tracker_store,
+        "_conversation_session",
+        conversation_session_with_concurrent_save,
+    )
+    await tracker_store.save(tracker)
+
+    assert len(concurrent_saves) == 1
+    full_tracker = await tracker_store.retrieve_full_tracker("test")
+    assert list(full_tracker.events) == list(tracker.events)
+    with tracker_store.session_scope() as session:
+        stored_session = session.get(
+            AsyncSQLTrackerStore.SQLConversationSession, "test"
+        )
+        assert stored_session.number_of_events == len(tracker.events)
+
+
+@pytest.mark.parametrize("retrieve_full_tracker", [True, False])
+async def test_async_sql_tracker_store_inserts_only_new_events(
+    domain: Domain,
+    tmp_path: Path,
+    tracker_with_restarted_event: DialogueStateTracker,
+    retrieve_full_tracker: bool,
+) -> None:
+    tracker_store = AsyncSQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    if retrieve_full_tracker:
+        tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    else:
+        tracker = await tracker_store.retrieve(sender_id)
+    new_events = [
+        BotUttered("Hey! How can I help you?", timestamp=14),
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=15),
+        SessionStarted(timestamp=16),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=17),
+    ]
+    tracker.update_with_events(new_events, domain, override_timestamp=False)
+    await tracker_store.save(tracker)
+    # saving the same tracker again doesn't store anything
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        list(tracker_with_restarted_event.events) + new_events
+    )
+
+    latest_session = await tracker_store.retrieve(sender_id)
+    assert list(latest_session.events) == new_events[2:]
+
+
+async def test_async_sql_tracker_store_with_events_of_sql_tracker_store(
+    domain: Domain,
+    tmp_path: Path,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    db = str(tmp_path / "rasa.db")
+    sender_id = tracker_with_restarted_event.sender_id
+    await SQLTrackerStore(domain, db=db).save(tracker_with_restarted_event)
+
+    tracker_store = AsyncSQLTrackerStore(domain, db=db)
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:]
+
+    new_event = BotUttered("Hey! How can I help you?", timestamp=14)
+    tracker.update(new_event)
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        list(tracker_with_restarted_event.events) + [new_event]
+    )
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:] + [new_event]
+
+
 def test_session_scope_error(
     monkeypatch: MonkeyPatch, capsys: CaptureFixture, domain: Domain
 ):
@@ -1160,6 +1414,89 @@ async def test_mongo_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart[1:]
 
 
+async def test_mongo_tracker_store_keeps_event_counters(
+    domain: Domain, tracker_with_restarted_event: DialogueStateTracker
+) -> None:
+    tracker_store = MockedMongoTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+
+    await tracker_store.save(tracker_with_restarted_event)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_NUMBER_OF_EVENTS_KEY] == 13
+    # position of the latest `SessionStarted` event
+    assert stored[MONGO_SESSION_START_KEY] == 10
+    assert list(await tracker_store.keys()) == [sender_id]
+
+
+async def test_mongo_tracker_store_counts_events_of_concurrent_saves(
+    domain: Domain, monkeypatch: MonkeyPatch
+) -> None:
+    tracker_store = MockedMongoTrackerStore(domain)
+    sender_id = "test_mongo_tracker_store_counts_events_of_concurrent_saves"
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("Hi", timestamp=1)])
+    )
+
+    # Another server stored events after this one read the counters
+    tracker_store.conversations.update_one(
+        {"sender_id": sender_id},
+        {
+            "$push": {"events": ActionExecuted("action_listen").as_dict()},
+            "$inc": {MONGO_NUMBER_OF_EVENTS_KEY: 1},
+        },
+    )
+    monkeypatch.setattr(tracker_store, "_event_counters", lambda _: (1, 0))
+
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [
+            UserUttered("Hi", timestamp=1),
+            ActionExecuted(ACTION_SESSION_START_NAME, timestamp=2),
+            SessionStarted(timestamp=3),
+        ],
+    )
+    await tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_NUMBER_OF_EVENTS_KEY] == len(stored["events"]) == 4
+    assert stored["events"][stored[MONGO_SESSION_START_KEY]]["event"] == (
+        SessionStarted.type_name
+    )
+
+
+async def test_mongo_tracker_store_with_conversation_without_counters(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedMongoTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    # conversations which were stored by older versions don't have counters
+    tracker_store.conversations.insert_one(
+        {
+            "sender_id": sender_id,
+            "events": [
+                event.as_dict() for event in tracker_with_restarted_event.events
+            ],
+        }
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:]
+
+    new_event = BotUttered("Hey! How can I help you?", timestamp=14)
+    tracker.update(new_event)
+    await tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_NUMBER_OF_EVENTS_KEY] == 14
+    assert stored[MONGO_SESSION_START_KEY] == 10
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:] + [new_event]
+
+
 class MockedRedisTrackerStore(RedisTrackerStore):
     def __init__(
         self,
@@ -1291,6 +1628,163 @@ def test_redis_tracker_store_merge_trackers_different_session() -> None:
     assert list(actual_tracker.events) == expected_events
 
 
+class MockedAsyncRedisTrackerStore(AsyncRedisTrackerStore):
+    def __init__(self, domain: Domain, **kwargs: Any) -> None:
+        self.red = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
+        self.record_exp = None
+        super(AsyncRedisTrackerStore, self).__init__(domain, **kwargs)
+
+
+def test_create_async_redis_tracker_store_from_endpoint_config(domain: Domain):
+    store = EndpointConfig(type="async_redis", url="localhost", key_prefix="rasa")
+
+    tracker_store = TrackerStore.create(store, domain)
+
+    assert isinstance(tracker_store, AsyncRedisTrackerStore)
+    assert tracker_store.key_prefix == "rasa:" + DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
+
+
+async def test_async_redis_tracker_store_retrieve(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedAsyncRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart[1:]
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert full_tracker == tracker_with_restarted_event
+
+    assert await tracker_store.exists(sender_id)
+    assert not await tracker_store.exists("unknown")
+    assert await tracker_store.retrieve("unknown") is None
+    assert list(await tracker_store.keys()) == [sender_id]
+
+
+@pytest.mark.parametrize("retrieve_full_tracker", [True, False])
+async def test_async_redis_tracker_store_appends_only_new_events(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    retrieve_full_tracker: bool,
+) -> None:
+    tracker_store = MockedAsyncRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    if retrieve_full_tracker:
+        tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    else:
+        tracker = await tracker_store.retrieve(sender_id)
+    new_events = [
+        BotUttered("Hey! How can I help you?", timestamp=14),
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=15),
+        SessionStarted(timestamp=16),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=17),
+    ]
+    tracker.update_with_events(new_events, domain, override_timestamp=False)
+    await tracker_store.save(tracker)
+    # saving the same tracker again doesn't store anything
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        list(tracker_with_restarted_event.events) + new_events
+    )
+
+    latest_session = await tracker_store.retrieve(sender_id)
+    assert list(latest_session.events) == new_events[2:]
+
+
+async def test_async_redis_tracker_store_retries_save_after_concurrent_save(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import redis.exceptions
+
+    tracker_store = MockedAsyncRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("Hey!", timestamp=14))
+
+    create_pipeline = tracker_store.red.pipeline
+    concurrent_saves = []
+
+    def create_pipeline_with_concurrent_save(*args: Any, **kwargs: Any) -> Any:
+        pipe = create_pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def execute_after_concurrent_save(*args: Any, **kwargs: Any) -> Any:
+            if concurrent_saves:
+                return await execute(*args, **kwargs)
+
+            # Another server stores the same events before this transaction is
+            # executed. Redis then aborts the transaction as the watched keys
+            # changed.
+            concurrent_saves.append(tracker)
+            await pipe.reset()
+            await tracker_store.save(tracker)
+            raise redis.exceptions.WatchError()
+
+        pipe.execute = execute_after_concurrent_save
+        return pipe
+
+    monkeypatch.setattr(
+        tracker_store.red, "pipeline", create_pipeline_with_concurrent_save
+    )
+    await tracker_store.save(tracker)
+
+    assert len(concurrent_saves) == 1
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events) + [
+        BotUttered("Hey!", timestamp=14)
+    ]
+
+
+async def test_async_redis_tracker_store_rejects_diverged_tracker(
+    domain: Domain, tracker_with_restarted_event: DialogueStateTracker
+) -> None:
+    tracker_store = MockedAsyncRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+
+    diverged_tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("Hi", timestamp=100), BotUttered("Hey", timestamp=101)]
+    )
+    with pytest.raises(TrackerDivergedException):
+        await tracker_store.save(diverged_tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert full_tracker == tracker_with_restarted_event
+
+
+async def test_async_redis_tracker_store_streams_new_events(
+    domain: Domain, tracker_with_restarted_event: DialogueStateTracker
+) -> None:
+    event_broker = Mock(spec=EventBroker)
+    tracker_store = MockedAsyncRedisTrackerStore(domain, event_broker=event_broker)
+    sender_id = tracker_with_restarted_event.sender_id
+    await tracker_store.save(tracker_with_restarted_event)
+    event_broker.publish_async.reset_mock()
+
+    tracker = await tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("Hey!", timestamp=14))
+    await tracker_store.save(tracker)
+
+    event_broker.publish_async.assert_called_once()
+    published = event_broker.publish_async.call_args[0][0]
+    assert published["sender_id"] == sender_id
+    assert published["text"] == "Hey!"
+
+
 async def test_tracker_event_diff_engine_event_difference() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),
@@ -1313,3 +1807,220 @@ async def test_tracker_event_diff_engine_event_difference() -> None:
     event_diff = TrackerEventDiffEngine.event_difference(prior_tracker, new_tracker)
 
     assert new_events == event_diff
+
+
+async def test_tracker_store_with_compact_events(domain: Domain):
+    tracker_store = InMemoryTrackerStore(domain, compact_events=True)
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}, parse_data={"intent_ranking": []}),
+        ],
+    )
+    await tracker_store.save(tracker)
+
+    retrieved = await tracker_store.retrieve("test")
+
+    assert retrieved._compact_events
+    assert retrieved.events[-1]._parse_data is None
+    assert (
+        retrieved.current_state(EventVerbosity.ALL)["events"]
+        == tracker.current_state(EventVerbosity.ALL)["events"]
+    )
+
+
+class VersionedTrackerStore(InMemoryTrackerStore):
+    def __init__(self, domain: Domain) -> None:
+        super().__init__(domain)
+        self.retrieved: List[Text] = []
+        self.versions: Dict[Text, Text] = {}
+
+    async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+        await super().save(tracker)
+        self.versions[tracker.sender_id] = str(len(tracker.events))
+        return self.versions[tracker.sender_id]
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        self.retrieved.append(sender_id)
+        return await super().retrieve(sender_id)
+
+    async def tracker_version(self, sender_id: Text) -> Optional[Text]:
+        return self.versions.get(sender_id)
+
+
+def _tracker_with_user_message(sender_id: Text) -> DialogueStateTracker:
+    return DialogueStateTracker.from_events(
+        sender_id, [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+
+async def test_cached_tracker_store_skips_retrieval(domain: Domain):
+    inner = VersionedTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    await tracker_store.save(tracker)
+
+    assert await tracker_store.retrieve("test") is tracker
+    assert inner.retrieved == []
+
+    # the tracker was checked out and wasn't saved again
+    retrieved = await tracker_store.retrieve("test")
+    assert retrieved is not tracker
+    assert retrieved.events == tracker.events
+    assert inner.retrieved == ["test"]
+
+
+async def test_cached_tracker_store_reloads_changed_tracker(domain: Domain):
+    inner = VersionedTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    await tracker_store.save(tracker)
+
+    # another process stored new events
+    other_tracker = _tracker_with_user_message("test")
+    other_tracker.update(ActionExecuted("utter_greet"))
+    await inner.save(other_tracker)
+
+    retrieved = await tracker_store.retrieve("test")
+
+    assert retrieved is not tracker
+    assert len(retrieved.events) == 3
+    assert inner.retrieved == ["test"]
+
+
+async def test_cached_tracker_store_uses_version_written_by_save(domain: Domain):
+    class RacingTrackerStore(VersionedTrackerStore):
+        async def save(self, tracker: DialogueStateTracker) -> Optional[Text]:
+            version = await super().save(tracker)
+            # another process stores new events before this save returns
+            self.versions[tracker.sender_id] = "other version"
+            return version
+
+    inner = RacingTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    await tracker_store.save(tracker)
+
+    assert await tracker_store.retrieve("test") is not tracker
+    assert inner.retrieved == ["test"]
+
+
+async def test_cached_tracker_store_without_version_from_save(domain: Domain):
+    class UnversionedSaveTrackerStore(VersionedTrackerStore):
+        async def save(self, tracker: DialogueStateTracker) -> None:
+            await super().save(tracker)
+
+    inner = UnversionedSaveTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    await tracker_store.save(tracker)
+
+    assert await tracker_store.retrieve("test") is not tracker
+    assert inner.retrieved == ["test"]
+
+
+async def test_cached_tracker_store_ignores_modified_tracker(domain: Domain):
+    inner = VersionedTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    await tracker_store.save(tracker)
+
+    # events which were added after saving aren't stored yet
+    tracker.update(ActionExecuted("utter_greet"))
+    retrieved = await tracker_store.retrieve("test")
+
+    assert retrieved is not tracker
+    assert len(retrieved.events) == 2
+
+
+async def test_cached_tracker_store_evicts_least_recently_saved(domain: Domain):
+    inner = VersionedTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner, max_cached_trackers=2)
+    trackers = {
+        sender_id: _tracker_with_user_message(sender_id)
+        for sender_id in ["a", "b", "c"]
+    }
+    for tracker in trackers.values():
+        await tracker_store.save(tracker)
+
+    for sender_id in ["a", "b", "c"]:
+        await tracker_store.retrieve(sender_id)
+
+    assert inner.retrieved == ["a"]
+
+
+async def test_cached_tracker_store_does_not_cache_several_sessions(domain: Domain):
+    inner = VersionedTrackerStore(domain)
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    tracker.update_with_events(
+        [ActionExecuted(ACTION_SESSION_START_NAME), SessionStarted()], domain
+    )
+    await tracker_store.save(tracker)
+
+    retrieved = await tracker_store.retrieve("test")
+
+    assert retrieved is not tracker
+    assert inner.retrieved == ["test"]
+
+
+async def test_cached_tracker_store_with_sql_tracker_store(
+    domain: Domain, tmp_path: Path
+):
+    inner = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    tracker_store = CachedTrackerStore(inner)
+    tracker = _tracker_with_user_message("test")
+    version = await tracker_store.save(tracker)
+    assert version == await inner.tracker_version("test")
+
+    other_tracker = await inner.retrieve("test")
+    other_tracker.update(ActionExecuted("utter_greet"))
+    await inner.save(other_tracker)
+
+    assert await inner.tracker_version("test") != version
+    retrieved = await tracker_store.retrieve("test")
+    assert retrieved is not tracker
+    assert len(retrieved.events) == 3
+
+
+@pytest.mark.parametrize(
+    "create_tracker_store",
+    [
+        lambda domain, tmp_path: MockedAsyncRedisTrackerStore(domain),
+        lambda domain, tmp_path: MockedMongoTrackerStore(domain),
+        lambda domain, tmp_path: SQLTrackerStore(domain, db=str(tmp_path / "rasa.db")),
+        lambda domain, tmp_path: AsyncSQLTrackerStore(
+            domain, db=str(tmp_path / "rasa.db")
+        ),
+    ],
+)
+async def test_save_returns_tracker_version(
+    create_tracker_store: Callable[[Domain, Path], TrackerStore],
+    domain: Domain,
+    tmp_path: Path,
+):
+    tracker_store = create_tracker_store(domain, tmp_path)
+    tracker = _tracker_with_user_message("test")
+
+    for _ in range(2):
+        version = await tracker_store.save(tracker)
+        assert version == await tracker_store.tracker_version("test")
+        tracker.update(ActionExecuted("utter_greet"))
+
+    # saving without new events
+    tracker = await tracker_store.retrieve("test")
+    assert await tracker_store.save(tracker) == version
+
+
+def test_create_cached_tracker_store_from_endpoint_config(domain: Domain):
+    tracker_store = TrackerStore.create(EndpointConfig(cache_size=10), domain)
+
+    assert isinstance(tracker_store, CachedTrackerStore)
+    assert tracker_store.max_cached_trackers == 10
+    assert tracker_store.domain is domain
+
+
+def test_cached_tracker_store_with_invalid_size(domain: Domain):
+    with pytest.raises(RasaException):
+        CachedTrackerStore(InMemoryTrackerStore(domain), max_cached_trackers=0)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import Optional
+from unittest.mock import Mock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
 from rasa.engine.exceptions import GraphRunError
@@ -326,3 +328,75 @@ def test_loading_from_previous_node(default_model_storage: ModelStorage):
     results = runner.run()
 
     assert results["load"] == test_value
+
+
+def test_execution_plan_is_compiled_once_per_targets(
+    default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                is_target=True,
+            ),
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    compile_plan = Mock(wraps=runner._compile_execution_plan)
+    monkeypatch.setattr(runner, "_compile_execution_plan", compile_plan)
+
+    for first_input in range(3):
+        results = runner.run(inputs={"first_input": first_input, "second_input": 4})
+        assert results == {"subtract_2": first_input + 2}
+
+    assert runner.run(
+        inputs={"first_input": 1, "second_input": 1}, targets=["add"]
+    ) == {"add": 2}
+
+    # once for the default targets and once for `add`
+    assert compile_plan.call_count == 2
+
+
+def test_input_overrides_node(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                is_target=True,
+            ),
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    assert runner.run(inputs={"add": 10}) == {"subtract_2": 8}
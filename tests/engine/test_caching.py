@@ -9,10 +9,12 @@ from unittest.mock import Mock
 import pytest
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
+import sqlalchemy as sa
 from sqlalchemy.exc import OperationalError
 
 import rasa.shared.utils.io
 import rasa.shared.utils.common
+import rasa.utils.common
 from rasa.engine.caching import (
     LocalTrainingCache,
     CACHE_LOCATION_ENV,
@@ -20,11 +22,15 @@ from rasa.engine.caching import (
     CACHE_SIZE_ENV,
     CACHE_DB_NAME_ENV,
     TrainingCache,
+    CACHED_RESULT_DIRECTORY_PREFIX,
+    DEFAULT_CACHE_LOCATION,
 )
 import tests.conftest
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.nlu.training_data.formats.rasa_yaml import RasaYAMLReader
+from rasa.shared.utils.parsed_data_cache import PARSED_DATA_CACHE_LOCATION_ENV
 
 
 @dataclasses.dataclass
@@ -452,41 +458,213 @@ def test_delete_using_lru_if_cache_exceeds_size(
 
 
 def test_cache_exceeds_size_but_not_in_database(
-    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    default_model_storage: ModelStorage,
+    local_cache_creator: Callable[..., LocalTrainingCache],
 ):
-    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
-
     max_cache_size = 5
     # Pretend we have a cache of size `max_cached_size`
     monkeypatch.setenv(CACHE_SIZE_ENV, str(max_cache_size))
 
-    cache = LocalTrainingCache()
+    cache = local_cache_creator(tmp_path)
+
+    # Fill cache with a result which is not in the cache metadata (e.g. from an
+    # interrupted training)
+    untracked_result = tmp_path / f"{CACHED_RESULT_DIRECTORY_PREFIX}untracked"
+    untracked_result.mkdir()
+    tests.conftest.create_test_file_with_size(untracked_result, max_cache_size)
 
-    # Fill cache with something which is not in the cache metadata
-    sub_dir = cache._cache_location / "some dir"
-    sub_dir.mkdir()
+    # files which weren't created by the cache are never deleted
+    unknown_dir = tmp_path / "some dir"
+    unknown_dir.mkdir()
+    unknown_file = tests.conftest.create_test_file_with_size(tmp_path, 1)
 
-    # one subdirectory which needs deletion
-    tests.conftest.create_test_file_with_size(sub_dir, max_cache_size)
-    # one file which needs deletion
-    test_file = tests.conftest.create_test_file_with_size(
-        cache._cache_location, max_cache_size
+    output_fingerprints = []
+    for _ in range(3):
+        output_fingerprint = uuid.uuid4().hex
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            output_fingerprint,
+            default_model_storage,
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    # the last item didn't fit and caused an eviction
+    assert (
+        cache.get_cached_result(
+            output_fingerprints[0], "some_node", default_model_storage
+        )
+        is None
     )
+    for output_fingerprint in output_fingerprints[1:]:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+    assert not untracked_result.is_dir()
+    assert unknown_dir.is_dir()
+    assert unknown_file.is_file()
+
+
+def test_untracked_results_are_kept_if_nothing_is_evicted(
+    tmp_path: Path,
+    default_model_storage: ModelStorage,
+    local_cache_creator: Callable[..., LocalTrainingCache],
+):
+    untracked_result = tmp_path / f"{CACHED_RESULT_DIRECTORY_PREFIX}untracked"
+    untracked_result.mkdir()
+
+    cache = local_cache_creator(tmp_path)
+    cache.cache_output(
+        uuid.uuid4().hex,
+        TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+        uuid.uuid4().hex,
+        default_model_storage,
+    )
+
+    assert untracked_result.is_dir()
+
+
+def test_cache_entries_record_result_size(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    cache = LocalTrainingCache()
 
-    # Cache an item
     fingerprint_key = uuid.uuid4().hex
     output = TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2)
+    cache.cache_output(fingerprint_key, output, uuid.uuid4().hex, default_model_storage)
+
+    with cache._sessionmaker() as session:
+        entry = session.get(LocalTrainingCache.CacheEntry, fingerprint_key)
+
+    assert entry.result_size_in_mb == pytest.approx(2, abs=0.01)
+    with cache._sessionmaker() as session:
+        assert cache._current_cache_size_in_mb(session) == pytest.approx(2, abs=0.01)
+
+
+def test_lru_eviction_accounts_for_entries_of_other_caches(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_SIZE_ENV, "5")
+
+    # Two caches which share the same location, e.g. in different processes
+    cache = LocalTrainingCache()
+    other_cache = LocalTrainingCache()
+
+    output_fingerprints = []
+    for cache_to_fill in [cache, other_cache, cache]:
+        output_fingerprint = uuid.uuid4().hex
+        cache_to_fill.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            output_fingerprint,
+            default_model_storage,
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    assert (
+        cache.get_cached_result(
+            output_fingerprints[0], "some_node", default_model_storage
+        )
+        is None
+    )
+    for output_fingerprint in output_fingerprints[1:]:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+    with cache._sessionmaker() as session:
+        assert cache._current_cache_size_in_mb(session) == pytest.approx(4, abs=0.01)
+
+
+def test_lru_eviction_does_not_walk_cache_directory(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_SIZE_ENV, "5")
+    cache = LocalTrainingCache()
+
+    output_fingerprints = []
+    for _ in range(2):
+        output_fingerprint = uuid.uuid4().hex
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            output_fingerprint,
+            default_model_storage,
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The cache directory shouldn't be walked again.")
+
+    # Only the size of the new item should be measured
+    original_directory_size = rasa.utils.common.directory_size_in_mb
+    monkeypatch.setattr(
+        rasa.utils.common,
+        "directory_size_in_mb",
+        lambda path, filenames_to_exclude=None: fail()
+        if path == cache._cache_location
+        else original_directory_size(path, filenames_to_exclude),
+    )
+
+    new_output_fingerprint = uuid.uuid4().hex
+    cache.cache_output(
+        uuid.uuid4().hex,
+        TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+        new_output_fingerprint,
+        default_model_storage,
+    )
+
+    assert (
+        cache.get_cached_result(
+            output_fingerprints[0], "some_node", default_model_storage
+        )
+        is None
+    )
+    for output_fingerprint in [output_fingerprints[1], new_output_fingerprint]:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+
+
+def test_migrate_cache_without_result_sizes(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    cache = LocalTrainingCache()
+
+    fingerprint_key = uuid.uuid4().hex
     output_fingerprint = uuid.uuid4().hex
+    output = TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2)
     cache.cache_output(
         fingerprint_key, output, output_fingerprint, default_model_storage
     )
 
-    assert cache.get_cached_output_fingerprint(fingerprint_key) == output_fingerprint
-    assert cache.get_cached_result(
+    # Turn the database into one which was created by an older Rasa version
+    engine = cache._sessionmaker.kw["bind"]
+    with engine.begin() as connection:
+        connection.execute(sa.text("DROP INDEX ix_cache_entry_last_used"))
+        connection.execute(
+            sa.text("ALTER TABLE cache_entry DROP COLUMN result_size_in_mb")
+        )
+    engine.dispose()
+
+    migrated_cache = LocalTrainingCache()
+
+    with migrated_cache._sessionmaker() as session:
+        entry = session.get(LocalTrainingCache.CacheEntry, fingerprint_key)
+    assert entry.result_size_in_mb == pytest.approx(2, abs=0.01)
+    assert migrated_cache.get_cached_result(
         output_fingerprint, "some_node", default_model_storage
     )
-    assert not sub_dir.is_dir()
-    assert not test_file.is_file()
+
+    indexes = sa.inspect(migrated_cache._sessionmaker.kw["bind"]).get_indexes(
+        "cache_entry"
+    )
+    assert "ix_cache_entry_last_used" in {index["name"] for index in indexes}
 
 
 def test_clean_up_of_cached_result_if_database_fails(
@@ -553,3 +731,38 @@ def test_resource_with_model_storage(
             temporary_directory / test_filename
         )
         assert cached_content == test_content
+
+
+def test_training_cache_keeps_parsed_data_cache(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    # use the default locations of both caches
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(PARSED_DATA_CACHE_LOCATION_ENV)
+    monkeypatch.setattr(
+        LocalTrainingCache, "_get_cache_location", lambda: DEFAULT_CACHE_LOCATION
+    )
+    # every new item causes an eviction
+    monkeypatch.setenv(CACHE_SIZE_ENV, "3")
+
+    nlu_file = tmp_path / "nlu.yml"
+    rasa.shared.utils.io.write_text_file(
+        "nlu:\n- intent: greet\n  examples: |\n    - hello\n", nlu_file
+    )
+    RasaYAMLReader().read(nlu_file)
+    parsed_data = [path for path in (tmp_path / ".rasa").rglob("*.pkl")]
+    assert parsed_data
+
+    for _ in range(2):
+        cache = LocalTrainingCache()
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            uuid.uuid4().hex,
+            default_model_storage,
+        )
+
+    assert all(path.is_file() for path in parsed_data)
+    assert (
+        len(list(cache._cache_location.glob(f"{CACHED_RESULT_DIRECTORY_PREFIX}*"))) == 1
+    )
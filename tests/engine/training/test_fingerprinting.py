@@ -75,6 +75,8 @@ def test_fingerprint_changes_due_to_changed_source(monkeypatch: MonkeyPatch):
 
     get_source_mock = Mock(return_value="other implementation")
     monkeypatch.setattr(inspect, inspect.getsource.__name__, get_source_mock)
+    # The source is only read once per process
+    fingerprinting._component_implementation_fingerprint.cache_clear()
 
     key2 = fingerprinting.calculate_fingerprint_key(
         TEDPolicy, {}, {"input": FingerprintableText("Hi")}
@@ -85,6 +87,24 @@ def test_fingerprint_changes_due_to_changed_source(monkeypatch: MonkeyPatch):
     get_source_mock.assert_called_once_with(TEDPolicy)
 
 
+def test_fingerprint_reads_source_once(monkeypatch: MonkeyPatch):
+    fingerprinting._component_implementation_fingerprint.cache_clear()
+    get_source_mock = Mock(return_value="implementation")
+    monkeypatch.setattr(inspect, inspect.getsource.__name__, get_source_mock)
+
+    key1 = fingerprinting.calculate_fingerprint_key(
+        TEDPolicy, {}, {"input": FingerprintableText("Hi")}
+    )
+    key2 = fingerprinting.calculate_fingerprint_key(
+        TEDPolicy, {}, {"input": FingerprintableText("Hi")}
+    )
+
+    assert key1 == key2
+    get_source_mock.assert_called_once_with(TEDPolicy)
+
+    fingerprinting._component_implementation_fingerprint.cache_clear()
+
+
 def test_fingerprint_changes_when_external_file_changes():
     tmp_file = tempfile.mktemp()
 
@@ -603,6 +603,35 @@ async def test_process_unfeaturized_input(
     assert not classified_message.get(ENTITIES)
 
 
+async def test_process_batch_gives_same_predictions(
+    nlu_data_path: Text,
+    create_diet: Callable[..., DIETClassifier],
+    train_and_preprocess: Callable[..., Tuple[TrainingData, List[GraphComponent]]],
+    process_message: Callable[..., Message],
+):
+    pipeline = [
+        {"component": WhitespaceTokenizer},
+        {"component": CountVectorsFeaturizer},
+    ]
+    training_data, loaded_pipeline = train_and_preprocess(pipeline, nlu_data_path)
+    classifier = create_diet({EPOCHS: 1, RUN_EAGERLY: True})
+    classifier.train(training_data=training_data)
+
+    texts = ["hello", "I am looking for a restaurant", "bye", "show me chinese food"]
+    messages = [
+        process_message(loaded_pipeline, Message(data={TEXT: text}))
+        for text in texts + ["hi there", ""]
+    ]
+    expected = [
+        classifier.process([copy.deepcopy(message)])[0].as_dict()
+        for message in messages
+    ]
+
+    processed = classifier.process(copy.deepcopy(messages))
+
+    assert [message.as_dict() for message in processed] == expected
+
+
 async def test_train_model_not_checkpointing(
     default_model_storage: ModelStorage,
     default_diet_resource: Resource,
@@ -9,6 +9,7 @@ from typing import Text, List, Dict, Any, Set, Optional
 from rasa.core.agent import Agent
 from rasa.core.channels import UserMessage
 
+import numpy as np
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from unittest.mock import Mock, MagicMock
@@ -553,6 +554,51 @@ async def test_run_cv_evaluation():
         assert all(key in extractor_evaluation for key in ["errors", "report"])
 
 
+@pytest.mark.skip_on_windows
+@pytest.mark.timeout(300, func_only=True)
+async def test_run_cv_evaluation_in_parallel_processes(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    td = rasa.shared.nlu.training_data.loading.load_data(
+        "data/test/demo-rasa-more-ents-and-multiplied.yml"
+    )
+    # the spawned processes don't see the cache location of the test setup
+    monkeypatch.chdir(tmp_path)
+    nlu_config = {
+        "assistant_id": "placeholder_default",
+        "language": "en",
+        "pipeline": [
+            {"name": "WhitespaceTokenizer"},
+            {"name": "CountVectorsFeaturizer"},
+            {"name": "LogisticRegressionClassifier"},
+            {"name": "RegexEntityExtractor"},
+        ],
+    }
+
+    results = []
+    for jobs in [1, 2]:
+        # use the same folds for both runs
+        np.random.seed(42)
+        results.append(
+            await cross_validate(
+                td, 2, nlu_config, disable_plotting=True, report_as_dict=True, jobs=jobs
+            )
+        )
+
+    (sequential_intents, sequential_entities, _), (
+        parallel_intents,
+        parallel_entities,
+        _,
+    ) = results
+    assert parallel_intents.train == sequential_intents.train
+    assert parallel_intents.test == sequential_intents.test
+    assert parallel_intents.evaluation == sequential_intents.evaluation
+    assert parallel_entities.train == sequential_entities.train
+    assert parallel_entities.test == sequential_entities.test
+    # the processes use their own temporary training caches
+    assert not (tmp_path / ".rasa").exists()
+
+
 # FIXME: these tests take too long to run in CI on Windows, disabling them for now
 @pytest.mark.skip_on_windows
 @pytest.mark.timeout(
@@ -1329,6 +1375,14 @@ class ConstantProcessor:
     ) -> Dict[Text, Any]:
         return self.prediction
 
+    async def parse_messages(
+        self,
+        messages: List[UserMessage],
+        trackers: Optional[List[Optional[DialogueStateTracker]]] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        return [self.prediction for _ in messages]
+
 
 async def test_replacing_fallback_intent():
     expected_intent = "greet"
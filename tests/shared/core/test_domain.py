@@ -5,8 +5,10 @@ import textwrap
 from pathlib import Path
 import random
 from typing import Dict, List, Text, Any, Union, Set, Optional
+from unittest.mock import Mock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from pytest import WarningsRecorder
 
 from rasa.shared.exceptions import YamlSyntaxException, YamlException
@@ -1892,6 +1894,25 @@ def test_domain_fingerprint_consistency_across_runs():
     assert f1 == f2
 
 
+def test_domain_fingerprint_is_computed_once(monkeypatch: MonkeyPatch):
+    domain = Domain.from_yaml(
+        f"""
+         version: "{LATEST_TRAINING_DATA_FORMAT_VERSION}"
+         intents:
+         - greet
+         """
+    )
+    fingerprint = domain.fingerprint()
+
+    as_dict = Mock(side_effect=AssertionError("Fingerprint should be cached."))
+    monkeypatch.setattr(domain, domain.as_dict.__name__, as_dict)
+
+    assert domain.fingerprint() == fingerprint
+    # a copy computes its own fingerprint
+    monkeypatch.undo()
+    assert copy.deepcopy(domain).fingerprint() == fingerprint
+
+
 def test_domain_fingerprint_uniqueness():
     domain = Domain.from_yaml(
         f"""
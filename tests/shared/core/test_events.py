@@ -1,6 +1,7 @@
 import copy
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 import pytz
 import time
 from datetime import datetime
@@ -791,9 +792,10 @@ def test_event_subclasses_are_tested(event_class: Type[Event]):
 
 
 @pytest.mark.parametrize("event", tested_events)
-def test_event_fingerprint_uniqueness(event: Event):
+def test_event_fingerprint_uniqueness(event: Event, monkeypatch: MonkeyPatch):
     f1 = event.fingerprint()
-    event.type_name = "test"
+    # events use `__slots__`, hence the type name can only be changed on the class
+    monkeypatch.setattr(event.__class__, "type_name", "test")
     f2 = event.fingerprint()
 
     assert f1 != f2
@@ -827,3 +829,90 @@ def test_session_started_event_is_not_serialised():
 def test_remove_parse_data(event: Dict[Text, Any]):
     reduced_event = rasa.shared.core.events.remove_parse_data(event)
     assert "parse_data" not in reduced_event
+
+
+@pytest.mark.parametrize("event", tested_events)
+def test_events_have_no_instance_dict(event: Event):
+    # all events define `__slots__`
+    assert not hasattr(event, "__dict__")
+
+
+def test_events_can_be_copied():
+    event = ActionExecuted("utter_greet", policy="TEDPolicy", confidence=0.8)
+
+    copied = copy.deepcopy(event)
+
+    assert copied == event
+    assert copied.as_dict() == event.as_dict()
+
+
+def test_resolve_by_type_finds_event_classes_defined_later():
+    assert Event.resolve_by_type("slot") == SlotSet
+
+    class CustomEvent(SlotSet):
+        type_name = "custom_event_defined_later"
+
+    assert Event.resolve_by_type("custom_event_defined_later") == CustomEvent
+
+
+def _user_uttered_with_ranking() -> UserUttered:
+    return UserUttered(
+        "hello",
+        {INTENT_NAME_KEY: "greet", "confidence": 0.9},
+        [{"entity": "name", "value": "Ada", "start": 0, "end": 1}],
+        parse_data={
+            "intent_ranking": [
+                {INTENT_NAME_KEY: "greet", "confidence": 0.9},
+                {INTENT_NAME_KEY: "goodbye", "confidence": 0.1},
+            ],
+        },
+        timestamp=1,
+        metadata={"channel": "test"},
+    )
+
+
+def test_compact_user_uttered_keeps_serialized_form():
+    event = _user_uttered_with_ranking()
+    expected = event.as_dict()
+
+    event.compact()
+
+    assert event.as_dict() == expected
+    # serializing the event doesn't restore the parse data
+    assert event._parse_data is None
+
+    assert event.parse_data == expected["parse_data"]
+    assert event._parse_data is not None
+
+
+def test_compact_user_uttered_keeps_modified_parse_data():
+    event = _user_uttered_with_ranking()
+    event.parse_data["entities"] = []
+    expected = event.as_dict()
+
+    event.compact()
+
+    assert event.as_dict() == expected
+    assert event.parse_data["entities"] == []
+
+
+def test_compact_user_uttered_without_json_serializable_parse_data():
+    event = UserUttered("hello", parse_data={"ranking": (1, 2)})
+
+    event.compact()
+
+    assert event.parse_data["ranking"] == (1, 2)
+
+
+def test_compact_interns_names():
+    events = [
+        ActionExecuted("".join(["utter_", "greet"]), policy="".join(["TED", "Policy"]))
+        for _ in range(2)
+    ]
+    assert events[0].action_name is not events[1].action_name
+
+    for event in events:
+        event.compact()
+
+    assert events[0].action_name is events[1].action_name
+    assert events[0].policy is events[1].policy
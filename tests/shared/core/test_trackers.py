@@ -6,11 +6,14 @@ import textwrap
 import time
 from pathlib import Path
 import tempfile
+import tracemalloc
 from typing import List, Text, Dict, Any, Type
+from unittest.mock import Mock
 
 import fakeredis
 import freezegun
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.core.actions.action import ActionExtractSlots
 from rasa.core.channels import CollectingOutputChannel
@@ -1664,3 +1667,146 @@ def test_assistant_id_is_not_added_to_events_with_assistant_id():
         ActionExecuted(action_name="test", metadata={ASSISTANT_ID_KEY: "old_name"})
     )
     assert tracker.events[-1].metadata[ASSISTANT_ID_KEY] == "old_name"
+
+
+@pytest.mark.parametrize(
+    "new_events",
+    [
+        [ActionExecuted("utter_greet"), ActionExecuted(ACTION_LISTEN_NAME)],
+        [UserUtteranceReverted()],
+        [ActionReverted()],
+        [Restarted(), ActionExecuted(ACTION_LISTEN_NAME)],
+        [SessionStarted(), ActionExecuted(ACTION_LISTEN_NAME)],
+        [ActiveLoop("my_form"), ActionExecuted("my_form"), ActiveLoop(None)],
+    ],
+)
+@pytest.mark.parametrize("ignore_rule_only_turns", [True, False])
+def test_past_states_are_updated_with_new_events(
+    domain: Domain, new_events: List[Event], ignore_rule_only_turns: bool
+):
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", intent={"name": "greet"}),
+            ActionExecuted("utter_greet", hide_rule_turn=True),
+            SlotSet("name", "Peter"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("bye", intent={"name": "goodbye"}),
+        ],
+        domain.slots,
+    )
+    tracker.past_states(domain, ignore_rule_only_turns=ignore_rule_only_turns)
+
+    for event in new_events:
+        tracker.update(event)
+        assert tracker.past_states(
+            domain, ignore_rule_only_turns=ignore_rule_only_turns
+        ) == domain.states_for_tracker_history(
+            tracker, ignore_rule_only_turns=ignore_rule_only_turns
+        )
+
+
+def test_past_states_are_computed_once_per_tracker_state(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", intent={"name": "a"})],
+        domain.slots,
+    )
+    get_active_state = Mock(wraps=domain.get_active_state)
+    monkeypatch.setattr(domain, "get_active_state", get_active_state)
+
+    states = tracker.past_states(domain)
+    # callers are allowed to modify the returned states
+    del states[-1]["user"]
+    assert tracker.past_states(domain) != states
+    assert get_active_state.call_count == 2
+
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.past_states(domain)
+    # only the state before the new action and the latest state are computed
+    assert get_active_state.call_count == 4
+
+
+def test_past_states_do_not_keep_copies_of_events(domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", intent={"name": "a"})],
+        domain.slots,
+    )
+    tracker.past_states(domain)
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.past_states(domain)
+
+    for past_states in tracker._past_states_cache.values():
+        assert not past_states._replay_tracker.events
+
+
+def _serialized_conversation(number_of_events: int) -> Text:
+    events = []
+    for turn in range(number_of_events // 4):
+        events += [
+            UserUttered(
+                "hello there",
+                {"name": "greet", "confidence": 0.9},
+                [{"entity": "name", "value": "Ada", "start": 0, "end": 5}],
+                parse_data={
+                    "intent_ranking": [
+                        {"name": f"intent_{i}", "confidence": 0.01} for i in range(10)
+                    ]
+                },
+                timestamp=turn,
+            ),
+            SlotSet("name", "Ada", timestamp=turn),
+            ActionExecuted("utter_greet", policy="TEDPolicy", timestamp=turn),
+            BotUttered("Hi Ada!", metadata={"utter_action": "utter_greet"}),
+        ]
+    return json.dumps([event.as_dict() for event in events])
+
+
+def test_tracker_with_compact_events():
+    serialized = json.loads(_serialized_conversation(8))
+
+    tracker = DialogueStateTracker.from_dict("test", serialized)
+    compact_tracker = DialogueStateTracker.from_dict(
+        "test", serialized, compact_events=True
+    )
+
+    assert compact_tracker == tracker
+    assert compact_tracker.current_state(EventVerbosity.ALL) == tracker.current_state(
+        EventVerbosity.ALL
+    )
+    assert (
+        compact_tracker.latest_message.parse_data == tracker.latest_message.parse_data
+    )
+    assert compact_tracker.copy()._compact_events
+
+
+def _traced_memory_for_tracker(serialized: Text, compact_events: bool) -> int:
+    tracemalloc.start()
+    try:
+        tracker = DialogueStateTracker.from_dict(
+            "test", json.loads(serialized), compact_events=compact_events
+        )
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(tracker.events) == 1000
+    return memory
+
+
+def test_memory_per_1k_events_with_compact_events():
+    serialized = _serialized_conversation(1000)
+
+    memory = _traced_memory_for_tracker(serialized, compact_events=False)
+    compact_memory = _traced_memory_for_tracker(serialized, compact_events=True)
+
+    logging.getLogger(__name__).info(
+        f"Memory per 1k events: {memory / 1024:.0f} KiB, "
+        f"compacted: {compact_memory / 1024:.0f} KiB."
+    )
+    # most of the memory is used by the intent rankings of the user messages
+    assert compact_memory < memory / 2
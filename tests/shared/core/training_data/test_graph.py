@@ -1,4 +1,11 @@
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
+
 from rasa.shared.core.training_data.structures import StoryGraph
+from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
+    YAMLStoryWriter,
+)
 import rasa.shared.core.training_data.loading
 from rasa.shared.core.domain import Domain
 
@@ -70,6 +77,23 @@ def test_consistent_fingerprints():
     assert fingerprint == fingerprint_2
 
 
+def test_fingerprint_is_computed_once(monkeypatch: MonkeyPatch):
+    domain = Domain.load("data/test_domains/default_with_slots.yml")
+    story_steps = rasa.shared.core.training_data.loading.load_data_from_resource(
+        "data/test_yaml_stories/stories.yml", domain
+    )
+    story_graph = StoryGraph(story_steps)
+    fingerprint = story_graph.fingerprint()
+
+    monkeypatch.setattr(
+        YAMLStoryWriter,
+        YAMLStoryWriter.stories_to_yaml.__name__,
+        Mock(side_effect=AssertionError("Fingerprint should be cached.")),
+    )
+
+    assert story_graph.fingerprint() == fingerprint
+
+
 def test_unique_checkpoint_names():
     stories_path = "data/test_yaml_stories/story_with_two_equal_or_statements.yml"
     domain_path = "data/test_domains/default_with_slots.yml"
@@ -244,6 +244,28 @@ def test_single_additional_file(tmp_path: Path):
     assert selector.is_imported(str(additional_file))
 
 
+def test_multi_project_importer_with_multiple_jobs():
+    example_directory = "data/test_multi_domain"
+    importers = [
+        MultiProjectImporter(
+            os.path.join(example_directory, "config.yml"),
+            domain_path=os.path.join(example_directory, "domain.yml"),
+            training_data_paths=[os.path.join(example_directory, "data")],
+            jobs=jobs,
+        )
+        for jobs in [1, 2]
+    ]
+    sequential, parallel = importers
+
+    assert parallel.get_domain().as_dict() == sequential.get_domain().as_dict()
+    assert (
+        parallel.get_nlu_data().fingerprint() == sequential.get_nlu_data().fingerprint()
+    )
+    assert (
+        parallel.get_stories().fingerprint() == sequential.get_stories().fingerprint()
+    )
+
+
 async def test_multi_project_training(trained_async, tmp_path_factory: TempPathFactory):
     example_directory = "data/test_multi_domain"
     config_file = os.path.join(example_directory, "config.yml")
@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import Text
 import os
 
+import pytest
+
 from rasa.shared.constants import (
     DEFAULT_CONFIG_PATH,
     DEFAULT_DOMAIN_PATH,
@@ -15,6 +17,7 @@ from rasa.shared.core.constants import (
 )
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.slots import AnySlot
+from rasa.shared.exceptions import RasaException
 from rasa.shared.importers.importer import TrainingDataImporter
 from rasa.shared.importers.rasa import RasaFileImporter
 
@@ -44,6 +47,39 @@ def test_rasa_file_importer(project: Text):
     assert len(nlu_data.intent_examples) == 68
 
 
+def test_rasa_file_importer_with_multiple_jobs():
+    data_paths = ["data/test_yaml_stories", "data/test_nlu_no_responses"]
+    sequential = RasaFileImporter(
+        domain_path="data/test_domains/default_with_slots.yml",
+        training_data_paths=data_paths,
+    )
+    parallel = RasaFileImporter(
+        domain_path="data/test_domains/default_with_slots.yml",
+        training_data_paths=data_paths,
+        jobs=2,
+    )
+
+    assert (
+        parallel.get_nlu_data().fingerprint() == sequential.get_nlu_data().fingerprint()
+    )
+
+    sequential_stories = sequential.get_stories()
+    parallel_stories = parallel.get_stories()
+    assert parallel_stories.fingerprint() == sequential_stories.fingerprint()
+    assert len({step.id for step in parallel_stories.story_steps}) == len(
+        parallel_stories.story_steps
+    )
+
+
+def test_rasa_file_importer_with_invalid_jobs():
+    importer = RasaFileImporter(
+        training_data_paths=["data/test_nlu_no_responses"], jobs=0
+    )
+
+    with pytest.raises(RasaException):
+        importer.get_nlu_data()
+
+
 def test_read_conversation_tests(project: Text):
     importer = RasaFileImporter(
         training_data_paths=[str(Path(project) / DEFAULT_CONVERSATION_TEST_PATH)]
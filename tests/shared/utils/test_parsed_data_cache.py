@@ -0,0 +1,204 @@
+import textwrap
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.shared.utils.io
+import rasa.shared.utils.parsed_data_cache
+from rasa.shared.constants import LATEST_TRAINING_DATA_FORMAT_VERSION
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+    YAMLStoryReader,
+)
+from rasa.shared.nlu.training_data.formats.rasa_yaml import RasaYAMLReader
+from rasa.shared.utils.parsed_data_cache import (
+    PARSED_DATA_CACHE_ENABLED_ENV,
+    PARSED_DATA_CACHE_LOCATION_ENV,
+)
+
+NLU_DATA = f"""
+version: "{LATEST_TRAINING_DATA_FORMAT_VERSION}"
+nlu:
+- intent: greet
+  examples: |
+    - hello
+    - hi [Peter](name)
+"""
+
+STORIES = f"""
+version: "{LATEST_TRAINING_DATA_FORMAT_VERSION}"
+stories:
+- story: simple
+  steps:
+  - intent: greet
+  - action: utter_greet
+"""
+
+
+@pytest.fixture
+def nlu_file(tmp_path: Path) -> Path:
+    path = tmp_path / "nlu.yml"
+    rasa.shared.utils.io.write_text_file(NLU_DATA, path)
+    return path
+
+
+@pytest.fixture
+def stories_file(tmp_path: Path) -> Path:
+    path = tmp_path / "stories.yml"
+    rasa.shared.utils.io.write_text_file(STORIES, path)
+    return path
+
+
+@pytest.fixture
+def domain() -> Domain:
+    return Domain.from_yaml(
+        f"""
+        version: "{LATEST_TRAINING_DATA_FORMAT_VERSION}"
+        intents:
+        - greet
+        responses:
+          utter_greet:
+          - text: "Hi"
+        """
+    )
+
+
+def _fail_parsing(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        rasa.shared.utils.io,
+        rasa.shared.utils.io.read_yaml.__name__,
+        Mock(side_effect=AssertionError("The file shouldn't be parsed again.")),
+    )
+
+
+def test_nlu_file_is_parsed_once(nlu_file: Path, monkeypatch: MonkeyPatch):
+    training_data = RasaYAMLReader().read(nlu_file)
+
+    _fail_parsing(monkeypatch)
+    cached_training_data = RasaYAMLReader().read(nlu_file)
+
+    assert cached_training_data.fingerprint() == training_data.fingerprint()
+    assert len(cached_training_data.training_examples) == 2
+
+
+def test_changed_nlu_file_is_parsed_again(nlu_file: Path):
+    RasaYAMLReader().read(nlu_file)
+
+    rasa.shared.utils.io.write_text_file(NLU_DATA + "    - good morning\n", nlu_file)
+
+    assert len(RasaYAMLReader().read(nlu_file).training_examples) == 3
+
+
+def test_outdated_cache_entries_are_deleted(
+    nlu_file: Path,
+    stories_file: Path,
+    domain: Domain,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(PARSED_DATA_CACHE_LOCATION_ENV, str(cache_dir))
+
+    YAMLStoryReader(domain).read_from_file(stories_file)
+    cached_stories = set(cache_dir.glob("*.pkl"))
+    RasaYAMLReader().read(nlu_file)
+    cached_nlu_data = set(cache_dir.glob("*.pkl")) - cached_stories
+
+    rasa.shared.utils.io.write_text_file(NLU_DATA + "    - good morning\n", nlu_file)
+    RasaYAMLReader().read(nlu_file)
+
+    cache_files = set(cache_dir.glob("*.pkl"))
+    assert len(cache_files) == 2
+    assert cached_stories < cache_files
+    assert cached_nlu_data.isdisjoint(cache_files)
+
+
+def test_stories_are_cached_per_validation_mode(
+    stories_file: Path, domain: Domain, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(PARSED_DATA_CACHE_LOCATION_ENV, str(cache_dir))
+
+    YAMLStoryReader(domain).read_from_file(stories_file, skip_validation=True)
+    YAMLStoryReader(domain).read_from_file(stories_file)
+
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_files_with_warnings_are_not_cached(tmp_path: Path, monkeypatch: MonkeyPatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(PARSED_DATA_CACHE_LOCATION_ENV, str(cache_dir))
+
+    nlu_file = tmp_path / "nlu.yml"
+    rasa.shared.utils.io.write_text_file(
+        textwrap.dedent(
+            """
+            version: "2.0"
+            nlu:
+            - intent: greet
+              examples: |
+                - hello
+            """
+        ),
+        nlu_file,
+    )
+
+    for _ in range(2):
+        # the outdated version causes a warning
+        with pytest.warns(UserWarning):
+            RasaYAMLReader().read(nlu_file)
+
+    assert not list(cache_dir.glob("*"))
+
+
+def test_disable_cache(nlu_file: Path, tmp_path: Path, monkeypatch: MonkeyPatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(PARSED_DATA_CACHE_LOCATION_ENV, str(cache_dir))
+    monkeypatch.setenv(PARSED_DATA_CACHE_ENABLED_ENV, "false")
+
+    RasaYAMLReader().read(nlu_file)
+
+    assert not cache_dir.exists()
+
+
+def test_stories_are_parsed_once(
+    stories_file: Path, domain: Domain, monkeypatch: MonkeyPatch
+):
+    story_steps = YAMLStoryReader(domain).read_from_file(stories_file)
+
+    _fail_parsing(monkeypatch)
+    cached_story_steps = YAMLStoryReader(domain).read_from_file(stories_file)
+
+    assert [step.as_story_string() for step in cached_story_steps] == [
+        step.as_story_string() for step in story_steps
+    ]
+    assert cached_story_steps[0].source_name == str(stories_file)
+    # steps always get new ids
+    assert {step.id for step in cached_story_steps}.isdisjoint(
+        {step.id for step in story_steps}
+    )
+
+    # the parsed stories depend on the domain
+    with pytest.raises(AssertionError):
+        YAMLStoryReader(Domain.empty()).read_from_file(stories_file)
+
+
+def test_file_content_hash_is_reused(nlu_file: Path, monkeypatch: MonkeyPatch):
+    content_hash = rasa.shared.utils.parsed_data_cache.file_content_hash(nlu_file)
+
+    read_file = Mock(side_effect=rasa.shared.utils.io.read_file)
+    monkeypatch.setattr(rasa.shared.utils.io, "read_file", read_file)
+
+    assert (
+        rasa.shared.utils.parsed_data_cache.file_content_hash(nlu_file) == content_hash
+    )
+    read_file.assert_not_called()
+
+    rasa.shared.utils.io.write_text_file(NLU_DATA + "    - hey\n", nlu_file)
+
+    assert (
+        rasa.shared.utils.parsed_data_cache.file_content_hash(nlu_file) != content_hash
+    )
+    read_file.assert_called_once()
@@ -37,6 +37,7 @@ import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.core import utils
 from rasa.core.agent import Agent, load_agent
+from rasa.core.brokers.kafka import KafkaEventBroker
 from rasa.core.channels import (
     channel,
     CollectingOutputChannel,
@@ -200,6 +201,28 @@ async def test_status(rasa_app: SanicASGITestClient, trained_rasa_model: Text):
     assert model_file == Path(trained_rasa_model).name
 
 
+async def test_status_with_kafka_event_broker(
+    rasa_app: SanicASGITestClient, monkeypatch: MonkeyPatch
+):
+    event_broker = KafkaEventBroker("localhost", security_protocol="PLAINTEXT")
+    monkeypatch.setattr(
+        rasa_app.sanic_app.ctx.agent.tracker_store, "event_broker", event_broker
+    )
+
+    _, response = await rasa_app.get("/status")
+    event_broker._close()
+
+    assert response.status == HTTPStatus.OK
+    assert response.json["event_broker"] == event_broker.stats()
+
+
+async def test_status_without_event_broker_stats(rasa_app: SanicASGITestClient):
+    _, response = await rasa_app.get("/status")
+
+    assert response.status == HTTPStatus.OK
+    assert "event_broker" not in response.json
+
+
 async def test_status_nlu_only(
     rasa_app_nlu: SanicASGITestClient, trained_nlu_model: Text
 ):
@@ -1,9 +1,15 @@
+import asyncio
+import copy
 import logging
+import pickle
 from pathlib import Path
 from typing import Text, Optional, Union
 from unittest.mock import Mock
 
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 
 from rasa.shared.exceptions import FileNotFoundException
@@ -154,6 +160,103 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_requests_share_pooled_session():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    with aioresponses() as mocked:
+        mocked.post("https://example.com/", status=200, repeat=True)
+
+        await endpoint.request("post")
+        session = endpoint.pooled_session()
+        await endpoint.request("post")
+
+        assert endpoint.pooled_session() is session
+
+        await endpoint.close()
+
+        assert session.closed
+        assert endpoint.pooled_session() is not session
+
+    await endpoint.close()
+
+
+def test_pooled_session_of_previous_event_loop_is_closed():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    async def get_session() -> aiohttp.ClientSession:
+        return endpoint.pooled_session()
+
+    first_session = asyncio.run(get_session())
+
+    async def get_session_and_close() -> aiohttp.ClientSession:
+        session = endpoint.pooled_session()
+        await endpoint.close()
+        return session
+
+    second_session = asyncio.run(get_session_and_close())
+
+    assert second_session is not first_session
+    assert first_session.closed
+    assert second_session.closed
+
+
+async def test_pooled_session_is_configured_from_endpoint():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/",
+        headers={"X-Test": "test"},
+        basic_auth={"username": "user", "password": "pass"},
+        max_connections=10,
+        max_connections_per_host=5,
+    )
+
+    session = endpoint.pooled_session()
+
+    assert session.headers["X-Test"] == "test"
+    assert session.auth.login == "user"
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 5
+
+    await endpoint.close()
+
+
+async def test_pooled_session_reuses_connections():
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/webhook", handler)
+
+    async with TestServer(app) as server:
+        endpoint = endpoint_utils.EndpointConfig(str(server.make_url("/webhook")))
+
+        for _ in range(3):
+            assert await endpoint.request("post") == {"ok": True}
+
+        stats = endpoint.connection_stats()
+        await endpoint.close()
+
+    assert stats.requests == 3
+    assert stats.connections_created == 1
+    assert stats.connections_reused == 2
+    assert stats.as_dict()["reuse_ratio"] == pytest.approx(2 / 3)
+
+
+async def test_copied_endpoint_does_not_share_pooled_session():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/", token="token")
+    session = endpoint.pooled_session()
+
+    for copied in [
+        endpoint.copy(),
+        copy.deepcopy(endpoint),
+        pickle.loads(pickle.dumps(endpoint)),
+    ]:
+        assert copied == endpoint
+        assert copied.pooled_session() is not session
+        await copied.close()
+
+    await endpoint.close()
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type",
     [("data/test_endpoints/example_endpoints.yml", "tracker_store")],